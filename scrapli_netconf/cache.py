@@ -0,0 +1,372 @@
+"""scrapli_netconf.cache"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+from urllib.parse import quote
+
+from scrapli_netconf.capabilities import ServerCapabilities, find_hello
+
+LOG = getLogger("scrapli_netconf.cache")
+
+# the session-id is the only part of the hello that changes from one session to the next
+SESSION_ID_ELEMENT = re.compile(
+    pattern=rb"<(?:\w+:)?session-id>\s*\d+\s*</(?:\w+:)?session-id>", flags=re.I
+)
+
+CACHE_FILE_SUFFIX = ".json"
+
+
+@dataclass()
+class CachedSession:
+    host: str
+    port: int
+    transport: str = "system"
+    hello_hash: str = ""
+    server_capabilities: Optional[ServerCapabilities] = None
+    readable_datastores: Optional[List[str]] = None
+    writeable_datastores: Optional[List[str]] = None
+    server_echo: Optional[bool] = None
+
+
+def hash_hello(raw_server_capabilities: bytes) -> str:
+    """
+    Hash the hello message in the bytes read while waiting for server capabilities
+
+    The session-id is left out, so the hash only changes when the server advertises something
+    different, i.e. after a software upgrade or a change in the yang modules it has loaded.
+
+    Args:
+        raw_server_capabilities: raw bytes containing server capabilities
+
+    Returns:
+        str: sha256 hex digest of the hello, or an empty string if there is no hello
+
+    Raises:
+        N/A
+
+    """
+    hello_bounds = find_hello(raw_server_capabilities=raw_server_capabilities)
+    if hello_bounds is None:
+        return ""
+    hello = SESSION_ID_ELEMENT.sub(b"", raw_server_capabilities[hello_bounds[0] : hello_bounds[1]])
+    return hashlib.sha256(hello).hexdigest()
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write a cache file, creating its directory if need be
+
+    The file is written alongside and then moved into place, so concurrent readers (and other
+    writers of the same file) only ever see a complete file.
+
+    Args:
+        path: path of the file
+        data: contents of the file
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        # only still there if writing or moving it into place failed
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+class CapabilityCache:
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """
+        On-disk cache of what has been learned about each device when opening sessions to it
+
+        Stores the server capabilities, datastores and (once known) whether the server echoes
+        inputs of the last session opened to each host and port with each transport, with a hash
+        of the hello it was learned from, as a json file per device and transport in `path`.
+        Whether inputs are echoed depends on the transport as much as the server (the system
+        transport runs ssh in a pty), so nothing is shared between transports. Drivers opened with
+        the cache reuse all of that if the server sends the same hello again, and the cache can be
+        read without connecting to anything at all, i.e. by inventory tooling.
+
+        Args:
+            path: directory to store the cache in, created if it does not exist
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        self.path = Path(path)
+
+    def _session_path(self, host: str, port: int, transport: str) -> Path:
+        """
+        Path of the cache file of a device
+
+        Args:
+            host: host of the device
+            port: port of the device
+            transport: name of the transport the device is connected to with
+
+        Returns:
+            Path: path of the cache file
+
+        Raises:
+            N/A
+
+        """
+        return self.path / (
+            f"{quote(host, safe='')}_{port}_{quote(transport, safe='')}{CACHE_FILE_SUFFIX}"
+        )
+
+    @staticmethod
+    def _read(session_path: Path) -> Optional[CachedSession]:
+        """
+        Read a cache file
+
+        Files that cannot be read or are not what we wrote are treated as missing, the worst that
+        can happen is the device is asked for everything again.
+
+        Args:
+            session_path: path of the cache file
+
+        Returns:
+            Optional[CachedSession]: the cached session, or None if there is no (usable) file
+
+        Raises:
+            N/A
+
+        """
+        try:
+            with open(session_path, "rb") as f:
+                session_data: Any = json.load(f)
+            session = CachedSession(**session_data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            LOG.warning("ignoring unusable capability cache file '%s': %s", session_path, exc)
+            return None
+
+        if session.server_capabilities is not None:
+            session.server_capabilities = ServerCapabilities(session.server_capabilities)
+        return session
+
+    def load(
+        self, host: str, port: int = 830, transport: str = "system"
+    ) -> Optional[CachedSession]:
+        """
+        Load the cached session of a device
+
+        Args:
+            host: host of the device
+            port: port of the device
+            transport: name of the transport the device is connected to with
+
+        Returns:
+            Optional[CachedSession]: the cached session, or None if nothing is cached for the device
+
+        Raises:
+            N/A
+
+        """
+        return self._read(
+            session_path=self._session_path(host=host, port=port, transport=transport)
+        )
+
+    def store(self, session: CachedSession) -> None:
+        """
+        Store the session of a device, replacing whatever was cached for it
+
+        Args:
+            session: session to store
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        _write_file(
+            path=self._session_path(
+                host=session.host, port=session.port, transport=session.transport
+            ),
+            data=json.dumps(asdict(session)).encode(),
+        )
+
+    def remove(self, host: str, port: int = 830, transport: str = "system") -> None:
+        """
+        Remove the cached session of a device, if any
+
+        Args:
+            host: host of the device
+            port: port of the device
+            transport: name of the transport the device is connected to with
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        try:
+            self._session_path(host=host, port=port, transport=transport).unlink()
+        except FileNotFoundError:
+            pass
+
+    def sessions(self) -> Iterator[CachedSession]:
+        """
+        Iterate over the cached sessions of all devices
+
+        Args:
+            N/A
+
+        Yields:
+            CachedSession: cached session of a device
+
+        Raises:
+            N/A
+
+        """
+        if not self.path.is_dir():
+            return
+        for session_path in sorted(self.path.glob(f"*{CACHE_FILE_SUFFIX}")):
+            session = self._read(session_path=session_path)
+            if session is not None:
+                yield session
+
+
+class SchemaCache:
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """
+        On-disk, content addressed, cache of yang schemas
+
+        Schemas are stored by the sha256 of their contents (in `objects`), with a reference to that
+        per module name and revision (in `modules`), so the same module is only ever downloaded
+        once no matter how many devices advertise it, and identical schemas are only stored once.
+
+        Args:
+            path: directory to store the cache in, created if it does not exist
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        self.path = Path(path)
+
+    def _module_path(self, name: str, revision: str) -> Path:
+        """
+        Path of the reference to the schema of a module
+
+        Args:
+            name: name of the module
+            revision: revision of the module
+
+        Returns:
+            Path: path of the reference
+
+        Raises:
+            N/A
+
+        """
+        return self.path / "modules" / f"{quote(name, safe='')}@{quote(revision, safe='')}"
+
+    def _object_path(self, digest: str) -> Path:
+        """
+        Path of a stored schema
+
+        Args:
+            digest: sha256 hex digest of the schema
+
+        Returns:
+            Path: path of the schema
+
+        Raises:
+            N/A
+
+        """
+        return self.path / "objects" / f"{digest}.yang"
+
+    def has(self, name: str, revision: str) -> bool:
+        """
+        Check if the schema of a module is cached
+
+        Args:
+            name: name of the module
+            revision: revision of the module
+
+        Returns:
+            bool: True if the schema is cached
+
+        Raises:
+            N/A
+
+        """
+        return self._module_path(name=name, revision=revision).is_file()
+
+    def load(self, name: str, revision: str) -> Optional[str]:
+        """
+        Load the schema of a module
+
+        Args:
+            name: name of the module
+            revision: revision of the module
+
+        Returns:
+            Optional[str]: the schema, or None if it is not cached
+
+        Raises:
+            N/A
+
+        """
+        try:
+            digest = self._module_path(name=name, revision=revision).read_text().strip()
+            return self._object_path(digest=digest).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def store(self, name: str, revision: str, schema: str) -> str:
+        """
+        Store the schema of a module
+
+        Args:
+            name: name of the module
+            revision: revision of the module
+            schema: the schema
+
+        Returns:
+            str: sha256 hex digest of the schema
+
+        Raises:
+            N/A
+
+        """
+        data = schema.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        object_path = self._object_path(digest=digest)
+        if not object_path.is_file():
+            _write_file(path=object_path, data=data)
+        _write_file(path=self._module_path(name=name, revision=revision), data=digest.encode())
+
+        return digest
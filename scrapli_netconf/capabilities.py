@@ -0,0 +1,538 @@
+"""scrapli_netconf.capabilities"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl
+
+from lxml import etree
+
+from scrapli_netconf.exceptions import CouldNotExchangeCapabilities
+
+# namespace prefix (if any) between the "<" (or "</") and the name of the hello element
+HELLO_TAG_PREFIX = re.compile(pattern=rb"(?:\w+:)?")
+# capability elements in any (or no) namespace
+CAPABILITY_TAG = "{*}capability"
+# the whitespace between the elements of a hello is of no interest, and skipping it is a bit quicker
+HELLO_PARSER = etree.XMLParser(remove_blank_text=True)
+
+
+@dataclass(frozen=True)
+class YangModule:
+    name: str
+    namespace: str
+    revision: Optional[str] = None
+    features: FrozenSet[str] = frozenset()
+    deviations: Tuple[str, ...] = ()
+
+
+@dataclass()
+class CapabilityIndex:
+    capabilities: FrozenSet[str] = frozenset()
+    parameters: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    modules: Dict[str, YangModule] = field(default_factory=dict)
+
+
+def _split_list_parameter(value: str) -> Tuple[str, ...]:
+    """
+    Split a comma separated capability parameter, i.e. the features of a module
+
+    Args:
+        value: parameter value
+
+    Returns:
+        Tuple[str, ...]: the (non-empty) items of the value
+
+    Raises:
+        N/A
+
+    """
+    return tuple(item for item in value.split(",") if item)
+
+
+def build_capability_index(capabilities: Iterable[str]) -> CapabilityIndex:
+    """
+    Index capability uris by their uri without parameters, and by the yang module they advertise
+
+    Capabilities advertising yang modules look like `urn:ex?module=ex&revision=2020-01-01`, with
+    optional `features` and `deviations` (comma separated) parameters, see RFC 6020 section 5.6.4.
+    Should a uri or module be advertised more than once the first one wins.
+
+    Args:
+        capabilities: capability uris as advertised by the server
+
+    Returns:
+        CapabilityIndex: indexed capabilities
+
+    Raises:
+        N/A
+
+    """
+    capabilities = tuple(capabilities)
+    index = CapabilityIndex(capabilities=frozenset(capabilities))
+
+    for capability in capabilities:
+        uri, _, query = capability.partition("?")
+        parameters = dict(parse_qsl(query, keep_blank_values=True))
+        index.parameters.setdefault(uri, parameters)
+
+        module_name = parameters.get("module")
+        if not module_name or module_name in index.modules:
+            continue
+        index.modules[module_name] = YangModule(
+            name=module_name,
+            namespace=uri,
+            revision=parameters.get("revision") or None,
+            features=frozenset(_split_list_parameter(parameters.get("features", ""))),
+            deviations=_split_list_parameter(parameters.get("deviations", "")),
+        )
+
+    return index
+
+
+class ServerCapabilities(List[str]):
+    """Capabilities advertised by a netconf server, indexed for constant time lookups"""
+
+    def __init__(self, capabilities: Iterable[str] = ()) -> None:
+        """
+        Server capabilities
+
+        A list of the capability uris exactly as advertised (so anything expecting a list of
+        strings keeps working), whose membership test and lookups use an index that is built the
+        first time it is needed and rebuilt after the list is modified.
+
+        Args:
+            capabilities: capability uris as advertised by the server
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        super().__init__(capabilities)
+        self._index: Optional[CapabilityIndex] = None
+
+    def _get_index(self) -> CapabilityIndex:
+        """
+        Get the index of the capabilities, building it if need be
+
+        Not a property named `index`, as that would shadow `list.index`.
+
+        Args:
+            N/A
+
+        Returns:
+            CapabilityIndex: index of the capabilities
+
+        Raises:
+            N/A
+
+        """
+        if self._index is None:
+            self._index = build_capability_index(capabilities=self)
+        return self._index
+
+    @property
+    def modules(self) -> Mapping[str, YangModule]:
+        """
+        Getter for `modules` attribute
+
+        Args:
+            N/A
+
+        Returns:
+            Mapping[str, YangModule]: yang modules advertised by the server, by module name
+
+        Raises:
+            N/A
+
+        """
+        return self._get_index().modules
+
+    def __contains__(self, capability: object) -> bool:
+        """
+        Check if a capability uri (including any parameters) was advertised
+
+        Args:
+            capability: capability uri
+
+        Returns:
+            bool: True if the exact uri was advertised
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(capability, str):
+            return capability in self._get_index().capabilities
+        return super().__contains__(capability)
+
+    def has_capability(self, capability: str) -> bool:
+        """
+        Check if a capability was advertised, regardless of its parameters
+
+        Args:
+            capability: capability uri, any parameters are ignored
+
+        Returns:
+            bool: True if the capability was advertised
+
+        Raises:
+            N/A
+
+        """
+        return capability.partition("?")[0] in self._get_index().parameters
+
+    def capability_parameters(self, capability: str) -> Optional[Dict[str, str]]:
+        """
+        Get the parameters a capability was advertised with
+
+        Args:
+            capability: capability uri, any parameters are ignored
+
+        Returns:
+            Optional[Dict[str, str]]: parameters of the capability, i.e. `{"basic-mode": "trim"}`
+                for with-defaults, or None if the capability was not advertised
+
+        Raises:
+            N/A
+
+        """
+        parameters = self._get_index().parameters.get(capability.partition("?")[0])
+        if parameters is None:
+            return None
+        return dict(parameters)
+
+    def get_module(self, name: str) -> Optional[YangModule]:
+        """
+        Get a yang module advertised by the server
+
+        Args:
+            name: name of the module
+
+        Returns:
+            Optional[YangModule]: the module, or None if it was not advertised
+
+        Raises:
+            N/A
+
+        """
+        return self._get_index().modules.get(name)
+
+    def supports_module(
+        self, name: str, revision: Optional[str] = None, features: Sequence[str] = ()
+    ) -> bool:
+        """
+        Check if the server advertised a yang module, optionally at a revision and with features
+
+        Args:
+            name: name of the module
+            revision: revision the module must be advertised at, any revision if not provided
+            features: features of the module that must all be advertised
+
+        Returns:
+            bool: True if the module is supported
+
+        Raises:
+            N/A
+
+        """
+        module = self._get_index().modules.get(name)
+        if module is None:
+            return False
+        if revision is not None and module.revision != revision:
+            return False
+        return module.features.issuperset(features)
+
+    def _invalidate_index(self) -> None:
+        """
+        Drop the index after the list has been modified, it is rebuilt when next needed
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._index = None
+
+    def append(self, capability: str) -> None:
+        """
+        Append a capability, as `list.append`
+
+        Args:
+            capability: capability uri
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().append(capability)
+
+    def extend(self, capabilities: Iterable[str]) -> None:
+        """
+        Extend capabilities, as `list.extend`
+
+        Args:
+            capabilities: capability uris
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().extend(capabilities)
+
+    def insert(self, index: Any, capability: str) -> None:
+        """
+        Insert a capability, as `list.insert`
+
+        Args:
+            index: position to insert at
+            capability: capability uri
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().insert(index, capability)
+
+    def remove(self, capability: str) -> None:
+        """
+        Remove a capability, as `list.remove`
+
+        Args:
+            capability: capability uri
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().remove(capability)
+
+    def pop(self, index: Any = -1) -> str:
+        """
+        Remove and return a capability, as `list.pop`
+
+        Args:
+            index: position of the capability
+
+        Returns:
+            str: the removed capability uri
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        return str(super().pop(index))
+
+    def clear(self) -> None:
+        """
+        Remove all capabilities, as `list.clear`
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().clear()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Set capabilities by index or slice, as `list.__setitem__`
+
+        Args:
+            key: index or slice
+            value: capability uri(s)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Delete capabilities by index or slice, as `list.__delitem__`
+
+        Args:
+            key: index or slice
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().__delitem__(key)
+
+    def __iadd__(  # type: ignore[override,misc]
+        self, capabilities: Iterable[str]
+    ) -> "ServerCapabilities":
+        """
+        Extend capabilities in place, as `list.__iadd__`
+
+        Args:
+            capabilities: capability uris
+
+        Returns:
+            ServerCapabilities: self
+
+        Raises:
+            N/A
+
+        """
+        self.extend(capabilities)
+        return self
+
+    def __imul__(self, count: Any) -> "ServerCapabilities":  # type: ignore[misc]
+        """
+        Repeat capabilities in place, as `list.__imul__`
+
+        Args:
+            count: number of times to repeat the capabilities
+
+        Returns:
+            ServerCapabilities: self
+
+        Raises:
+            N/A
+
+        """
+        self._invalidate_index()
+        super().__imul__(count)
+        return self
+
+
+def find_hello(raw_server_capabilities: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Find the start and end of the hello element in the bytes read while waiting for capabilities
+
+    Looks for the first hello start tag and the last hello end tag (with or without a namespace
+    prefix), as that is what has always been taken to be the hello message, but with plain
+    `find`s rather than running a regex over the whole buffer.
+
+    Args:
+        raw_server_capabilities: raw bytes containing server capabilities
+
+    Returns:
+        Optional[Tuple[int, int]]: start and end offsets of the hello element, or None if there is
+            no complete hello element
+
+    Raises:
+        N/A
+
+    """
+    name_start = raw_server_capabilities.find(b"hello")
+    while name_start != -1:
+        tag_start = raw_server_capabilities.rfind(b"<", 0, name_start)
+        if tag_start != -1 and HELLO_TAG_PREFIX.fullmatch(
+            raw_server_capabilities, tag_start + 1, name_start
+        ):
+            break
+        name_start = raw_server_capabilities.find(b"hello", name_start + 1)
+    else:
+        return None
+
+    name_end = raw_server_capabilities.rfind(b"hello>")
+    while name_end > name_start:
+        end_tag_start = raw_server_capabilities.rfind(b"</", tag_start, name_end)
+        if end_tag_start != -1 and HELLO_TAG_PREFIX.fullmatch(
+            raw_server_capabilities, end_tag_start + 2, name_end
+        ):
+            return tag_start, name_end + len(b"hello>")
+        name_end = raw_server_capabilities.rfind(b"hello>", name_start, name_end)
+
+    return None
+
+
+def _parse_hello_capabilities(hello: bytes) -> ServerCapabilities:
+    """
+    Parse the capabilities out of a hello message
+
+    The capability elements are picked out of the tree by lxml itself rather than checking the
+    tag of every element of the hello in python. Newlines in the capabilities are dropped, as they
+    always have been.
+
+    Args:
+        hello: the hello element
+
+    Returns:
+        ServerCapabilities: capabilities in the order they were advertised
+
+    Raises:
+        N/A
+
+    """
+    return ServerCapabilities(
+        elem.text.replace("\n", "").strip()
+        for elem in etree.fromstring(hello, parser=HELLO_PARSER).iter(CAPABILITY_TAG)
+        if elem.text is not None
+    )
+
+
+def parse_server_capabilities(raw_server_capabilities: bytes) -> ServerCapabilities:
+    """
+    Parse netconf server capabilities out of the bytes read while waiting for them
+
+    Args:
+        raw_server_capabilities: raw bytes containing server capabilities
+
+    Returns:
+        ServerCapabilities: capabilities in the order they were advertised
+
+    Raises:
+        CouldNotExchangeCapabilities: if there is no hello message, or it cannot be parsed
+
+    """
+    hello_bounds = find_hello(raw_server_capabilities=raw_server_capabilities)
+    if hello_bounds is None:
+        raise CouldNotExchangeCapabilities("failed to parse server capabilities")
+
+    hello = raw_server_capabilities[hello_bounds[0] : hello_bounds[1]]
+
+    try:
+        return _parse_hello_capabilities(hello=hello)
+    except etree.XMLSyntaxError:
+        pass
+
+    # IOSXR/XR7 7.3.1 returns corrupt '<capabil\n\nity>' property on call-home line, so only if the
+    # hello does not parse as-is replace newlines to have a parsable read
+    try:
+        return _parse_hello_capabilities(hello=hello.replace(b"\n", b""))
+    except etree.XMLSyntaxError as exc:
+        raise CouldNotExchangeCapabilities("failed to parse server capabilities") from exc
@@ -1,11 +1,19 @@
+# pylint: disable=C0302
 """scrapli_netconf.channel.async_channel"""
 
+import asyncio
+import inspect
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
 from scrapli.channel import AsyncChannel
 from scrapli.channel.base_channel import BaseChannelArgs
 from scrapli.decorators import timeout_wrapper
+from scrapli.exceptions import ScrapliValueError
 from scrapli.transport.base.async_transport import AsyncTransport
 from scrapli_netconf.channel.base_channel import BaseNetconfChannel, NetconfBaseChannelArgs
+from scrapli_netconf.channel.buffer import ReadBuffer
 from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.framing import MessageDecoder
 
 
 class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
@@ -23,8 +31,19 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
         self._base_channel_args.comms_prompt_pattern = "]]>]]>"
         self._server_echo = False
         self._establishing_server_echo = False
-        self._capabilities_buf = b""
-        self._read_buf = b""
+        self._capabilities_buf = ReadBuffer()
+        self._read_buf = ReadBuffer()
+        self._notifications = None
+
+        self._multiplexer: Optional["asyncio.Task[None]"] = None
+        self._reply_futures: Dict[str, "asyncio.Future[bytes]"] = {}
+        self._read_wanted: Optional[asyncio.Event] = None
+        self._notification_ready: Optional[asyncio.Event] = None
+
+        # decoder of a reply being streamed by `send_input_netconf_iter` that has not been read to
+        # the end yet, and the lock making sure only one task reads the rest of it
+        self._reply_stream: Optional[MessageDecoder] = None
+        self._reply_stream_lock: Optional[asyncio.Lock] = None
 
     async def open_netconf(self) -> None:
         """
@@ -65,13 +84,24 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
         capabilities_buf = self._capabilities_buf
 
         # reset this to empty to avoid any confusion now that we are moving on
-        self._capabilities_buf = b""
+        self._capabilities_buf = ReadBuffer()
 
         async with self._channel_lock():
-            while b"]]>]]>" not in capabilities_buf:
-                capabilities_buf += await self.read()
-            self.logger.debug(f"received raw server capabilities: {repr(capabilities_buf)}")
-        return capabilities_buf
+            end = capabilities_buf.find(b"]]>]]>")
+            while end == -1:
+                # only search the newly read bytes (and enough before them to catch a delimiter
+                # split across reads) rather than the whole buffer again
+                searched = max(len(capabilities_buf) - 5, 0)
+                capabilities_buf.extend(await self.read())
+                end = capabilities_buf.find(b"]]>]]>", searched)
+
+            raw_server_capabilities = capabilities_buf.consume(end + 6)
+
+            # anything past the delimiter is the start of the next message, keep it for next read
+            self._read_buf.extend(capabilities_buf.consume())
+
+            self.logger.debug("received raw server capabilities: %r", raw_server_capabilities)
+        return raw_server_capabilities
 
     @timeout_wrapper
     async def _send_client_capabilities(
@@ -96,6 +126,87 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
             )
             self.send_return()
 
+    def write(self, channel_input: Union[str, bytes], redacted: bool = False) -> None:
+        """
+        Write input to the underlying Transport session
+
+        Netconf messages are built as bytes, those are written as-is rather than (as scrapli does
+        with strings) encoded first.
+
+        Args:
+            channel_input: string or bytes of input to send
+            redacted: redact channel input from log or not
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(channel_input, str):
+            super().write(channel_input=channel_input, redacted=redacted)
+            return
+
+        if redacted:
+            self.logger.debug("write: REDACTED")
+        else:
+            self.logger.debug("write: %r", channel_input)
+
+        self.transport.write(channel_input=channel_input)
+
+    @timeout_wrapper
+    async def _send_input_eager(self, channel_input: bytes) -> None:
+        """
+        Send input to netconf server, reading it back off the channel if the server echoes inputs
+
+        Same as scrapli `send_input` with `eager` set (the reply is left for the caller to read),
+        but sending bytes as they are.
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.logger.info("sending channel input: %r", channel_input)
+
+        async with self._channel_lock():
+            await self._finish_reply_stream()
+            self.write(channel_input=channel_input)
+            await self._read_until_input(channel_input=channel_input)
+            self.send_return()
+
+    @timeout_wrapper
+    async def _send_input_stream_eager(self, channel_input: Iterable[bytes]) -> Tuple[bytes, int]:
+        """
+        Send input to netconf server part by part, reading it back off the channel if it echoes
+
+        Args:
+            channel_input: parts of the framed xml message to send to netconf server
+
+        Returns:
+            Tuple[bytes, int]: tail end of the input sent, to look for in echoed output, and the
+                number of bytes sent
+
+        Raises:
+            N/A
+
+        """
+        self.logger.info("sending streamed channel input")
+
+        async with self._channel_lock():
+            await self._finish_reply_stream()
+            sent_tail, sent_size = self._write_stream(channel_input=channel_input)
+            await self._read_until_input(channel_input=sent_tail)
+            self.send_return()
+
+        return sent_tail, sent_size
+
     async def read(self) -> bytes:
         """
         Read chunks of output from the channels
@@ -121,18 +232,30 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
 
         """
         if self._read_buf:
-            read_buf = self._read_buf
-            self._read_buf = b""
-            return read_buf
+            return self._read_buf.consume()
+
+        return self._process_read(buf=await self.transport.read())
 
-        buf = await self.transport.read()
+    def _process_read(self, buf: bytes) -> bytes:
+        """
+        Log (and channel log) output read from the transport, stripping out any ansi codes
 
-        self.logger.debug(f"read: {buf!r}")
+        Args:
+            buf: output read from the transport
+
+        Returns:
+            bytes: output read from channel
+
+        Raises:
+            N/A
+
+        """
+        self.logger.debug("read: %r", buf)
 
         if self.channel_log:
             self.channel_log.write(buf)
 
-        if b"\x1b" in buf.lower():
+        if b"\x1b" in buf:
             buf = self._strip_ansi(buf=buf)
 
         return buf
@@ -142,7 +265,7 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
         Async read until all input has been entered.
 
         Args:
-            channel_input: string to write to channel
+            channel_input: bytes written to the channel
 
         Returns:
             bytes: output read from channel
@@ -159,50 +282,380 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
             return output
 
         if not channel_input:
-            self.logger.info(f"Read: {repr(output)}")
+            self.logger.info("Read: %r", output)
             return output
 
+        read_buf = ReadBuffer()
+
         while True:
-            output += await self.read()
+            # only search the newly read bytes (and enough before them to catch a match split
+            # across reads) rather than the whole buffer again
+            searched = max(len(read_buf) - max(len(channel_input), len(b"rpc>")) + 1, 0)
+            read_buf.extend(await self.read())
 
             if self._establishing_server_echo:
-                output, partition, new_buf = output.partition(b"]]>]]>")
-                self._read_buf += new_buf
-                output += partition
+                end = read_buf.find(b"]]>]]>")
+                if end != -1:
+                    output = read_buf.consume(end + 6)
+                    self._read_buf.extend(read_buf.consume())
+                else:
+                    output = read_buf.consume()
                 break
 
             # if we have all the input *or* we see the closing rpc tag we know we are done here
-            if channel_input in output or b"rpc>" in output:
+            if (
+                read_buf.find(channel_input, searched) != -1
+                or read_buf.find(b"rpc>", searched) != -1
+            ):
+                output = read_buf.consume()
                 break
 
-        self.logger.info(f"Read: {repr(output)}")
+        self.logger.info("Read: %r", output)
         return output
 
-    async def send_input_netconf(self, channel_input: str) -> bytes:
+    async def _read_until_message(self, buf: bytes = b"") -> bytes:
+        """
+        Read until a complete netconf message has been received
+
+        Each read is fed to a message decoder as it arrives rather than searching the entire read
+        buffer for the end of message prompt after every read.
+
+        Args:
+            buf: output from previous reads if needed
+
+        Returns:
+            bytes: de-framed message payload
+
+        Raises:
+            N/A
+
+        """
+        decoder = self._build_message_decoder()
+
+        complete = decoder.feed(buf)
+        while not complete:
+            complete = decoder.feed(await self.read())
+
+        return self._process_decoded_message(decoder=decoder)
+
+    @property
+    def multiplexing(self) -> bool:
+        """
+        Getter for 'multiplexing' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if replies are being read by the multiplexer task
+
+        Raises:
+            N/A
+
+        """
+        return self._multiplexer is not None and not self._multiplexer.done()
+
+    def start_multiplexer(self) -> None:
+        """
+        Start reading replies in a background task so multiple rpcs can be outstanding at once
+
+        Once started, rpcs sent from any number of concurrent tasks are written to the channel
+        immediately and each caller awaits its own reply, which the background task matches up by
+        message-id as replies are read. The background task only reads while replies are
+        outstanding or, once notifications are enabled, while the notification queue has room.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self.multiplexing:
+            return
+
+        self.logger.debug("starting reply multiplexer")
+        self._read_wanted = asyncio.Event()
+        self._notification_ready = asyncio.Event()
+        self._update_read_wanted()
+        self._multiplexer = asyncio.create_task(self._read_replies())
+
+    async def stop_multiplexer(self) -> None:
+        """
+        Stop the background reply reading task, cancelling any rpcs still awaiting replies
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._multiplexer is None:
+            return
+
+        self.logger.debug("stopping reply multiplexer")
+        self._multiplexer.cancel()
+
+        try:
+            await self._multiplexer
+        except asyncio.CancelledError:
+            pass
+
+        self._multiplexer = None
+
+        for future in self._reply_futures.values():
+            future.cancel()
+        self._reply_futures.clear()
+
+        # anything waiting on the multiplexer for notifications goes back to reading them itself
+        if self._notification_ready is not None:
+            self._notification_ready.set()
+
+    def _update_read_wanted(self) -> None:
+        """
+        Let the multiplexer read while replies are outstanding or there is room for notifications
+
+        Once the notification queue is full the multiplexer stops reading (so the server is held
+        back) until a notification is consumed -- unless replies are outstanding, in which case it
+        reads regardless, and the queue drops its oldest notification for any new one.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._read_wanted is None:
+            return
+
+        notifications = self._notifications
+        if self._reply_futures or (notifications is not None and not notifications.full()):
+            self._read_wanted.set()
+        else:
+            self._read_wanted.clear()
+
+    async def _read_message_start(self) -> bytes:
+        """
+        Read the start of the next message for the multiplexer, however long that takes
+
+        The session can sit idle between messages for far longer than the transport timeout --
+        once subscribed to notifications, or while the server works on a slow reply (every rpc
+        waiting on a reply enforces `timeout_ops` on it itself) -- and a transport timeout closes
+        the connection, so the transport is read without its timeout while waiting for a message
+        to start. It still applies part way through a message, where timing out is fatal anyway as
+        the rest of the message can no longer be decoded.
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: output read from channel
+
+        Raises:
+            N/A
+
+        """
+        if self._read_buf:
+            return self._read_buf.consume()
+
+        # transport reads are wrapped by scrapli's `timeout_wrapper`, which keeps the wrapped read
+        read = inspect.unwrap(type(self.transport).read)
+        buf: bytes = await read(self.transport)
+        return self._process_read(buf=buf)
+
+    async def _read_replies(self) -> None:
+        """
+        Read replies off the channel and hand them to the rpcs awaiting them, forever
+
+        Notifications are routed to the notification queue, waking up anything waiting for one.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        # only ever called from `start_multiplexer`, which creates the events first
+        read_wanted: asyncio.Event = self._read_wanted  # type: ignore[assignment]
+        notification_ready: asyncio.Event = self._notification_ready  # type: ignore[assignment]
+
+        try:
+            await self._finish_reply_stream()
+
+            while True:
+                await read_wanted.wait()
+
+                payload = await self._read_until_message(buf=await self._read_message_start())
+
+                if self._route_notification(payload=payload):
+                    notification_ready.set()
+                else:
+                    message_id = self._match_reply(
+                        payload=payload, pending=list(self._reply_futures)
+                    )
+
+                    if message_id is not None:
+                        future = self._reply_futures.pop(message_id)
+                        # the caller may have given up on this reply (timed out/cancelled) already
+                        if not future.done():
+                            future.set_result(payload)
+
+                self._update_read_wanted()
+        except Exception as exc:  # pylint: disable=W0703
+            self.logger.critical("reply multiplexer failed reading replies: %s", exc)
+
+            for future in self._reply_futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            self._reply_futures.clear()
+
+            # anything waiting for notifications goes back to reading them itself, and so sees
+            # whatever went wrong for itself
+            notification_ready.set()
+
+    @timeout_wrapper
+    async def _wait_for_reply(self, reply: "asyncio.Future[bytes]") -> bytes:
+        """
+        Wait for the multiplexer to hand over a reply
+
+        Args:
+            reply: future the multiplexer resolves with the reply payload
+
+        Returns:
+            bytes: de-framed reply payload
+
+        Raises:
+            N/A
+
+        """
+        return await reply
+
+    async def _send_input_netconf_multiplexed(
+        self, channel_input: bytes, channel_input_stream: Iterable[bytes] = ()
+    ) -> bytes:
+        """
+        Send input to netconf server, leaving reading the reply up to the multiplexer
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server -- for streamed
+                inputs this is the first part of the message, which must contain the rpc start tag
+            channel_input_stream: remaining parts of a streamed message, written straight after the
+                first part with nothing else written in between
+
+        Returns:
+            bytes: de-framed reply payload
+
+        Raises:
+            N/A
+
+        """
+        message_id = self._input_message_id(channel_input=channel_input)
+
+        # futures are left in place if the caller stops waiting, so that the reply is still matched
+        # up (and dropped) rather than mistaken for the reply to another rpc; the multiplexer is
+        # responsible for removing them
+        reply: "asyncio.Future[bytes]" = asyncio.get_running_loop().create_future()
+        self._reply_futures[message_id] = reply
+
+        self.logger.info("sending multiplexed channel input for message-id %s", message_id)
+
+        self.write(channel_input=channel_input)
+        self._write_stream(channel_input=channel_input_stream)
+        self.send_return()
+
+        if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+            self.send_return()
+
+        self._update_read_wanted()
+
+        payload: bytes = await self._wait_for_reply(reply=reply)
+        return payload
+
+    async def send_input_netconf(self, channel_input: bytes) -> bytes:
         """
         Send inputs to netconf server
 
         Args:
-            channel_input: string of the base xml message to send to netconf server
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Returns:
+            bytes: bytes result of message sent to netconf server; for netconf 1.1 (or when
+                multiplexing) this is the de-framed payload
+
+        Raises:
+            N/A
+
+        """
+        if self.multiplexing:
+            return await self._send_input_netconf_multiplexed(channel_input=channel_input)
+
+        await self._send_input_eager(channel_input=channel_input)
+        return await self._read_reply_netconf(channel_input=channel_input)
+
+    async def send_input_netconf_stream(self, channel_input: Iterable[bytes]) -> bytes:
+        """
+        Send inputs to netconf server part by part, as they are produced
+
+        Args:
+            channel_input: parts of the framed xml message to send to netconf server -- the first
+                part must contain the rpc start tag
 
         Returns:
-            bytes: bytes result of message sent to netconf server
+            bytes: bytes result of message sent to netconf server, see `send_input_netconf`
 
         Raises:
             N/A
 
         """
-        bytes_final_channel_input = channel_input.encode()
+        if self.multiplexing:
+            channel_input_stream = iter(channel_input)
+            return await self._send_input_netconf_multiplexed(
+                channel_input=next(channel_input_stream, b""),
+                channel_input_stream=channel_input_stream,
+            )
+
+        sent_tail, _ = await self._send_input_stream_eager(channel_input=channel_input)
+        return await self._read_reply_netconf(channel_input=sent_tail)
+
+    async def _read_reply_netconf(self, channel_input: bytes) -> bytes:
+        """
+        Read the reply to an input sent to netconf server
+
+        Args:
+            channel_input: bytes sent to netconf server -- or the tail end of them for streamed
+                inputs -- used to determine if the server echoes inputs
 
-        buf: bytes
-        buf, _ = await super().send_input(
-            channel_input=channel_input, strip_prompt=False, eager=True
-        )
+        Returns:
+            bytes: bytes result of message sent to netconf server; for netconf 1.1 this is the
+                de-framed payload
 
-        if bytes_final_channel_input in buf:
-            buf = buf.split(bytes_final_channel_input)[1]
+        Raises:
+            N/A
 
-        buf = await self._read_until_prompt(buf=buf)
+        """
+        decoded = self._use_message_decoder()
+        if decoded:
+            buf = await self._read_until_message()
+            # notifications may arrive ahead of the reply once subscribed
+            while self._route_notification(payload=buf):
+                buf = await self._read_until_message()
+        else:
+            buf = await self._read_until_prompt()
 
         if self._server_echo is None:
             # At least per early drafts of the netconf over ssh rfcs the netconf servers MUST NOT
@@ -231,12 +684,12 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
                 _, _, buf = buf.partition(b"</hello>]]>]]>")
                 if buf:
                     # if we read past the end of the
-                    self._read_buf += buf
+                    self._read_buf.extend(buf)
 
                 # read up till our new input now to consume it from the channel
                 self._establishing_server_echo = True
-                await self._read_until_input(bytes_final_channel_input)
-            elif bytes_final_channel_input in buf:
+                await self._read_until_input(channel_input)
+            elif channel_input in buf:
                 self.logger.debug("server echoes inputs, setting _server_echo to 'true'")
                 self._server_echo = True
             else:
@@ -257,6 +710,305 @@ class AsyncNetconfChannel(AsyncChannel, BaseNetconfChannel):
             # netconf 1.1 with "chunking" style message format needs an extra return char here
             self.send_return()
 
+        if not decoded:
+            buf = self._deframe_reply(buf=buf)
+
         # we should be able to simply partition here and put any "over reads" back into the read buf
 
         return buf
+
+    @timeout_wrapper
+    async def _read_until_replies(self, pending: List[str]) -> Dict[str, bytes]:
+        """
+        Read until replies to all outstanding requests have been received
+
+        Args:
+            pending: message-ids of outstanding requests, oldest first
+
+        Returns:
+            Dict[str, bytes]: mapping of message-id to de-framed reply payload
+
+        Raises:
+            N/A
+
+        """
+        replies: Dict[str, bytes] = {}
+
+        while pending:
+            self._demultiplex_reply(
+                payload=await self._read_until_message(), pending=pending, replies=replies
+            )
+
+        return replies
+
+    async def send_inputs_netconf(self, channel_inputs: Dict[str, bytes]) -> Dict[str, bytes]:
+        """
+        Send several inputs to netconf server without waiting for replies in between (pipelining)
+
+        All inputs are written to the channel back to back, only then are the replies read and
+        matched up to the inputs by their message-id. Servers that echo inputs back (or until we
+        know if the server echoes at all) are sent the inputs one at a time as usual instead.
+
+        Args:
+            channel_inputs: mapping of message-id to the bytes of the base xml message to send to
+                netconf server -- message-ids must match those in the messages
+
+        Returns:
+            Dict[str, bytes]: mapping of message-id to bytes result of the message sent to netconf
+                server, see `send_input_netconf`
+
+        Raises:
+            N/A
+
+        """
+        if self.multiplexing:
+            # each input is written as soon as it is sent anyway, so there is nothing to do beyond
+            # sending them all concurrently
+            payloads = await asyncio.gather(
+                *(
+                    self._send_input_netconf_multiplexed(channel_input=channel_input)
+                    for channel_input in channel_inputs.values()
+                )
+            )
+            return dict(zip(channel_inputs, payloads))
+
+        replies: Dict[str, bytes] = {}
+        pending = list(channel_inputs)
+
+        if pending and self._server_echo is None:
+            # echo behavior is determined by inspecting the whole first reply, so that one goes on
+            # its own
+            message_id = pending.pop(0)
+            replies[message_id] = await self.send_input_netconf(
+                channel_input=channel_inputs[message_id]
+            )
+
+        if self._server_echo:
+            for message_id in pending:
+                replies[message_id] = await self.send_input_netconf(
+                    channel_input=channel_inputs[message_id]
+                )
+            return replies
+
+        if not pending:
+            return replies
+
+        self.logger.info("sending %s pipelined channel inputs", len(pending))
+
+        async with self._channel_lock():
+            await self._finish_reply_stream()
+            for message_id in pending:
+                self.write(channel_input=channel_inputs[message_id])
+                self.send_return()
+
+                if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+                    self.send_return()
+
+            replies.update(await self._read_until_replies(pending=pending))
+
+        return replies
+
+    async def read_notification(self) -> bytes:
+        """
+        Read the next notification, waiting for one to arrive if none are queued
+
+        While multiplexing the multiplexer reads notifications alongside replies and this waits for
+        it to queue one, otherwise notifications are read off the channel here, discarding any
+        replies read while waiting (as nothing can be waiting for them).
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: de-framed notification message
+
+        Raises:
+            ScrapliValueError: if notifications are not enabled, i.e. there is no subscription
+
+        """
+        notifications = self._notifications
+        if notifications is None:
+            raise ScrapliValueError("no notification subscription, notifications are not enabled")
+
+        notification = notifications.get()
+        while notification is None:
+            notification_ready = self._notification_ready
+            if self.multiplexing and notification_ready is not None:
+                notification_ready.clear()
+                self._update_read_wanted()
+                await notification_ready.wait()
+            else:
+                async with self._channel_lock():
+                    await self._finish_reply_stream()
+                    payload = await self._read_until_message()
+                if not self._route_notification(payload=payload):
+                    self.logger.warning(
+                        "discarding unexpected message while awaiting notifications: %r",
+                        payload[:256],
+                    )
+            notification = notifications.get()
+
+        # there is room in the queue again
+        self._update_read_wanted()
+        return notification
+
+    @timeout_wrapper
+    async def _start_reply_stream(self, channel_input: bytes) -> MessageDecoder:
+        """
+        Send input to netconf server, setting up the decoder its reply is to be streamed through
+
+        The channel lock (if enabled) must be held by the caller.
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Returns:
+            MessageDecoder: decoder to feed the reply to
+
+        Raises:
+            N/A
+
+        """
+        await self._finish_reply_stream()
+
+        self.logger.info("sending channel input (streaming reply): %r", channel_input)
+
+        self.write(channel_input=channel_input)
+        await self._read_until_input(channel_input=channel_input)
+        self.send_return()
+
+        if self._reply_stream_lock is None:
+            self._reply_stream_lock = asyncio.Lock()
+
+        decoder = self._build_message_decoder()
+        self._reply_stream = decoder
+        return decoder
+
+    @timeout_wrapper
+    async def _read_reply_stream(self, decoder: MessageDecoder) -> List[bytes]:
+        """
+        Read until more of a streamed reply has been decoded, or all of it has
+
+        Args:
+            decoder: decoder the reply is streamed through
+
+        Returns:
+            List[bytes]: de-framed parts of the reply decoded since the last call
+
+        Raises:
+            N/A
+
+        """
+        while True:
+            decoder.feed(await self.read())
+            payloads = decoder.pop_chunks()
+            if payloads or decoder.complete:
+                return payloads
+
+    def _end_reply_stream(self, decoder: MessageDecoder) -> None:
+        """
+        Wrap up a streamed reply that has been read to the end
+
+        Args:
+            decoder: decoder that has seen the whole reply
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._reply_stream = None
+        self._restore_over_read(decoder=decoder)
+
+        if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+            self.send_return()
+
+    @timeout_wrapper
+    async def _finish_reply_stream(self) -> None:
+        """
+        Read (and discard) the rest of a streamed reply the caller stopped iterating over early
+
+        Async generators that are not iterated to the end are only closed once the event loop gets
+        around to it, by which point the caller may well have sent its next rpc -- so anything
+        about to use the channel finishes the reply first, rather than taking what is left of it
+        as its own reply. Does nothing if no reply is left part way through.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._reply_stream is None or self._reply_stream_lock is None:
+            return
+
+        async with self._reply_stream_lock:
+            decoder = self._reply_stream
+            if decoder is None:
+                # finished by whatever held the lock before us
+                return
+
+            self.logger.debug("reading the rest of a streamed reply that was not read to the end")
+            while not decoder.complete:
+                decoder.feed(await self.read())
+                decoder.pop_chunks()
+
+            self._end_reply_stream(decoder=decoder)
+
+    async def send_input_netconf_iter(self, channel_input: bytes) -> AsyncIterator[bytes]:
+        """
+        Send inputs to netconf server, yielding the de-framed reply as it is read off the channel
+
+        The channel lock (if enabled) is held until the reply has been read to the end, and each
+        wait for more of the reply is subject to `timeout_ops`. If iteration stops early the rest
+        of the reply is read off the channel before it is next used, see `_finish_reply_stream`.
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Yields:
+            bytes: de-framed parts of the reply to the message sent to netconf server
+
+        Raises:
+            GeneratorExit: re-raised once the rest of the reply is read if iteration stops early
+
+        """
+        if self.multiplexing:
+            # the multiplexer reads (and de-frames) whole replies, so there is nothing to stream
+            yield await self._send_input_netconf_multiplexed(channel_input=channel_input)
+            return
+
+        if self._server_echo is None:
+            # echo behavior is determined by inspecting the whole first reply, so until that has
+            # happened we cannot stream; just decode that reply in one go
+            decoder = self._build_message_decoder()
+            decoder.feed(await self.send_input_netconf(channel_input=channel_input))
+            for payload in decoder.pop_chunks():
+                yield payload
+            return
+
+        async with self._channel_lock():
+            decoder = await self._start_reply_stream(channel_input=channel_input)
+
+            try:
+                while not decoder.complete:
+                    for payload in await self._read_reply_stream(decoder=decoder):
+                        yield payload
+            except GeneratorExit:
+                # caller stopped iterating early, finish reading the reply off the channel (unless
+                # something else using the channel got to it first) before giving up the channel
+                await self._finish_reply_stream()
+                raise
+            finally:
+                if not decoder.complete:
+                    # failed part way through, the rest of the reply can no longer be told apart
+                    # from whatever is read next
+                    self._reply_stream = None
+
+            self._end_reply_stream(decoder=decoder)
@@ -2,14 +2,22 @@
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional
-
-from lxml import etree
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from scrapli.channel.base_channel import BaseChannel
 from scrapli.decorators import FUNC_TIMEOUT_MESSAGE_MAP
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.cache import CachedSession, hash_hello
+from scrapli_netconf.capabilities import ServerCapabilities, parse_server_capabilities
+from scrapli_netconf.channel.buffer import ReadBuffer
 from scrapli_netconf.constants import NetconfClientCapabilities, NetconfVersion, XmlParserVersion
-from scrapli_netconf.exceptions import CapabilityNotSupported, CouldNotExchangeCapabilities
+from scrapli_netconf.exceptions import CapabilityNotSupported
+from scrapli_netconf.framing import MessageDecoder, build_message_decoder, decode_chunked_message
+from scrapli_netconf.notifications import (
+    NOTIFICATION_QUEUE_SIZE,
+    NotificationQueue,
+    is_notification,
+)
 
 FUNC_TIMEOUT_MESSAGE_MAP["_get_server_capabilities"] = (
     "timed out determining if session is authenticated/getting server capabilities"
@@ -17,18 +25,41 @@ FUNC_TIMEOUT_MESSAGE_MAP["_get_server_capabilities"] = (
 FUNC_TIMEOUT_MESSAGE_MAP["channel_authenticate_netconf"] = (
     "timed out during in channel netconf authentication"
 )
+FUNC_TIMEOUT_MESSAGE_MAP["_send_input_eager"] = "timed out sending input to device"
+FUNC_TIMEOUT_MESSAGE_MAP["_send_input_stream_eager"] = "timed out sending streamed input to device"
+FUNC_TIMEOUT_MESSAGE_MAP["_read_until_replies"] = "timed out reading replies to pipelined rpcs"
+FUNC_TIMEOUT_MESSAGE_MAP["_wait_for_reply"] = "timed out waiting for multiplexed rpc reply"
+FUNC_TIMEOUT_MESSAGE_MAP["_start_reply_stream"] = "timed out sending input to device"
+FUNC_TIMEOUT_MESSAGE_MAP["_read_reply_stream"] = "timed out reading streamed reply"
+FUNC_TIMEOUT_MESSAGE_MAP["_finish_reply_stream"] = "timed out reading the rest of a streamed reply"
+
+# start tag of a reply, only ever checked at the start of a message (after any xml declaration)
+RPC_REPLY_START_TAG = re.compile(
+    pattern=rb"\s*(?:<\?xml[^>]*\?>\s*)?<(?:[\w.-]+:)?rpc-reply\b([^>]*)>"
+)
+MESSAGE_ID_ATTRIBUTE = re.compile(pattern=rb"\smessage-id\s*=\s*([\"'])(.*?)\1")
+RPC_MESSAGE_ID = re.compile(pattern=rb"<(?:[\w.-]+:)?rpc\b[^>]*?\smessage-id\s*=\s*([\"'])(.*?)\1")
+
+# how much of the end of a streamed input to hold on to, to find it in echoed output -- enough to
+# cover the closing tags of the request and its framing
+SENT_TAIL_SIZE = 64
 
 
 @dataclass()
 class NetconfBaseChannelArgs:
     netconf_version: NetconfVersion
-    server_capabilities: Optional[List[str]] = None
+    server_capabilities: Optional[ServerCapabilities] = None
     client_capabilities: NetconfClientCapabilities = NetconfClientCapabilities.UNKNOWN
     xml_parser: XmlParserVersion = XmlParserVersion.COMPRESSED_PARSER
+    # what is known about the device from the capability cache, if the driver has one
+    cached_session: Optional[CachedSession] = None
 
 
 class BaseNetconfChannel(BaseChannel):
     _netconf_base_channel_args: NetconfBaseChannelArgs
+    _server_echo: Optional[bool]
+    _read_buf: ReadBuffer
+    _notifications: Optional[NotificationQueue]
 
     def _process_capabilities_exchange(self, raw_server_capabilities: bytes) -> None:
         """
@@ -82,44 +113,76 @@ class BaseNetconfChannel(BaseChannel):
                 NetconfClientCapabilities.CAPABILITIES_1_1
             )
 
-    def _parse_server_capabilities(self, raw_server_capabilities: bytes) -> List[str]:
+    def _parse_server_capabilities(self, raw_server_capabilities: bytes) -> ServerCapabilities:
         """
         Parse netconf server capabilities
 
+        If the driver has a capability cache and the server sent the same hello as the last time
+        the cache was updated, the cached capabilities (and whether the server echoes inputs, if
+        that was known) are used rather than parsing the hello again. Otherwise the cached session
+        is started over for the new hello.
+
         Args:
             raw_server_capabilities: raw bytes containing server capabilities
 
         Returns:
-            N/A  # noqa: DAR202
+            ServerCapabilities: parsed server capabilities
 
         Raises:
-            CouldNotExchangeCapabilities: if server capabilities cannot be parsed
+            N/A
 
         """
-        server_capabilities = []
+        cached_session = self._netconf_base_channel_args.cached_session
+
+        if cached_session is not None:
+            hello_hash = hash_hello(raw_server_capabilities=raw_server_capabilities)
+            if (
+                hello_hash
+                and hello_hash == cached_session.hello_hash
+                and cached_session.server_capabilities is not None
+            ):
+                self.logger.info(
+                    "server hello unchanged, using cached server capabilities: %s",
+                    cached_session.server_capabilities,
+                )
+                if self._server_echo is None:
+                    self._server_echo = cached_session.server_echo
+                return cached_session.server_capabilities
+
+            cached_session = CachedSession(
+                host=cached_session.host,
+                port=cached_session.port,
+                transport=cached_session.transport,
+                hello_hash=hello_hash,
+            )
+            self._netconf_base_channel_args.cached_session = cached_session
 
-        # matches hello with or without namespace
-        filtered_raw_server_capabilities = re.search(
-            pattern=rb"(<(\w+\:){0,1}hello.*<\/(\w+\:){0,1}hello>)",
-            string=raw_server_capabilities,
-            flags=re.I | re.S,
-        )
-        if filtered_raw_server_capabilities is None:
-            msg = "failed to parse server capabilities"
-            raise CouldNotExchangeCapabilities(msg)
-
-        # IOSXR/XR7 7.3.1 returns corrupt '<capabil\n\nity>' property on call-home line, so replace
-        # newlines to have a parsable read
-        server_capabilities_xml = etree.fromstring(
-            filtered_raw_server_capabilities.groups()[0].replace(b"\n", b"")
+        server_capabilities = parse_server_capabilities(
+            raw_server_capabilities=raw_server_capabilities
         )
-        for elem in server_capabilities_xml.iter():
-            if "capability" not in elem.tag:
-                continue
-            server_capabilities.append(elem.text.strip())
-        self.logger.info(f"server capabilities received and parsed: {server_capabilities}")
+        self.logger.info("server capabilities received and parsed: %s", server_capabilities)
+
+        if cached_session is not None:
+            cached_session.server_capabilities = server_capabilities
         return server_capabilities
 
+    @property
+    def server_echo(self) -> Optional[bool]:
+        """
+        Getter for 'server_echo' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            Optional[bool]: True if the server echoes inputs, None if that is not known yet
+
+        Raises:
+            N/A
+
+        """
+        return self._server_echo
+
     def _process_output(self, buf: bytes, strip_prompt: bool) -> bytes:
         """
         Override scrapli _process_output as this is unnecessary for scrapli_netconf
@@ -138,6 +201,320 @@ class BaseNetconfChannel(BaseChannel):
         _ = strip_prompt
         return buf
 
+    def _use_message_decoder(self) -> bool:
+        """
+        Determine if replies should be read with a message decoder rather than the prompt pattern
+
+        Message decoders only ever look at each byte read once (or, for the 1.0 delimiter, a few
+        bytes either side of a read boundary), where reading until the prompt pattern searches the
+        tail of the whole read buffer after every read. Until we know if the server echoes our
+        inputs we stick with reading until the prompt pattern as the echo logic in
+        `send_input_netconf` needs to inspect the raw output (and echoed inputs may not have sane
+        chunk sizes on pty based transports).
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if a message decoder should be used to read replies
+
+        Raises:
+            N/A
+
+        """
+        return self._server_echo is not None
+
+    def _build_message_decoder(self) -> MessageDecoder:
+        """
+        Build a message decoder appropriate for the current netconf version
+
+        Args:
+            N/A
+
+        Returns:
+            MessageDecoder: decoder to feed channel reads to
+
+        Raises:
+            N/A
+
+        """
+        return build_message_decoder(
+            netconf_version=self._netconf_base_channel_args.netconf_version
+        )
+
+    def _deframe_reply(self, buf: bytes) -> bytes:
+        """
+        De-frame a netconf 1.1 reply that was read until the prompt rather than with a decoder
+
+        Replies read with a message decoder are de-framed as they are read, this gives replies read
+        while the server echo behavior is still unknown the same shape so that callers always get
+        the de-framed payload back.
+
+        Args:
+            buf: bytes read off the channel up to and including the end of message prompt
+
+        Returns:
+            bytes: de-framed payload for netconf 1.1, otherwise the unmodified buf
+
+        Raises:
+            N/A
+
+        """
+        if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+            return decode_chunked_message(buf)
+        return buf
+
+    def _restore_over_read(self, decoder: MessageDecoder) -> None:
+        """
+        Place anything read past the end of a decoded message back onto the read buffer
+
+        Args:
+            decoder: decoder that has seen a full message
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if decoder.remainder:
+            self._read_buf.unread(decoder.remainder)
+
+    def _process_decoded_message(self, decoder: MessageDecoder) -> bytes:
+        """
+        Handle a completely decoded message for consistency between sync/async versions
+
+        Anything read past the end of the message is placed back onto the read buffer so that the
+        next read picks it up.
+
+        Args:
+            decoder: decoder that has seen a full message
+
+        Returns:
+            bytes: de-framed message payload
+
+        Raises:
+            N/A
+
+        """
+        self._restore_over_read(decoder=decoder)
+
+        payload = decoder.payload
+        self.logger.debug("decoded message of %s bytes", len(payload))
+        return payload
+
+    @property
+    def notifications(self) -> Optional[NotificationQueue]:
+        """
+        Getter for 'notifications' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            Optional[NotificationQueue]: queue notifications are routed to, None if there is no
+                notification subscription on the session
+
+        Raises:
+            N/A
+
+        """
+        return self._notifications
+
+    def enable_notifications(self, maxsize: int = NOTIFICATION_QUEUE_SIZE) -> NotificationQueue:
+        """
+        Start routing notifications read off the channel to a queue rather than discarding them
+
+        A session only ever has the one subscription (RFC 5277 section 2.1.1), so if notifications
+        are already enabled the existing queue is kept as is.
+
+        Args:
+            maxsize: number of notifications to hold at most, see `NotificationQueue`
+
+        Returns:
+            NotificationQueue: queue notifications are routed to
+
+        Raises:
+            N/A
+
+        """
+        if self._notifications is None:
+            self.logger.debug("routing notifications to a queue of at most %s", maxsize)
+            self._notifications = NotificationQueue(maxsize=maxsize)
+        return self._notifications
+
+    def disable_notifications(self) -> None:
+        """
+        Stop routing notifications to a queue, any notifications still queued are dropped
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._notifications = None
+
+    def _route_notification(self, payload: bytes) -> bool:
+        """
+        Route a message read off the channel to the notification queue if it is a notification
+
+        Notifications can arrive at any time once subscribed, interleaved with rpc replies, so every
+        message read is checked before it is taken to be a reply. Notifications that arrive without
+        a queue to route them to are discarded.
+
+        Args:
+            payload: de-framed message read off the channel
+
+        Returns:
+            bool: True if the message was a notification (and so is dealt with)
+
+        Raises:
+            N/A
+
+        """
+        if not is_notification(payload=payload):
+            return False
+
+        if self._notifications is None:
+            self.logger.warning(
+                "discarding notification received without a subscription: %r", payload[:256]
+            )
+        else:
+            self._notifications.put(notification=payload)
+        return True
+
+    def _match_reply(self, payload: bytes, pending: List[str]) -> Optional[str]:
+        """
+        Match a message read off the channel to the outstanding request it is the reply to
+
+        Replies are matched on their message-id; servers must reply to requests in the order they
+        were received (RFC 6241 section 4.2), so should a reply have no (or an unexpected)
+        message-id, it belongs to the oldest outstanding request. Messages that are not replies at
+        all, and replies while no requests are outstanding, are discarded.
+
+        Args:
+            payload: de-framed message read off the channel
+            pending: message-ids of outstanding requests, oldest first
+
+        Returns:
+            Optional[str]: message-id of the request the reply belongs to, None if the message is
+                not a reply
+
+        Raises:
+            N/A
+
+        """
+        rpc_reply = RPC_REPLY_START_TAG.match(payload)
+        if rpc_reply is None:
+            self.logger.warning(
+                "discarding unexpected message while awaiting rpc replies: %r", payload[:256]
+            )
+            return None
+
+        if not pending:
+            self.logger.warning(
+                "discarding rpc reply received with no requests outstanding: %r", payload[:256]
+            )
+            return None
+
+        message_id_match = MESSAGE_ID_ATTRIBUTE.search(rpc_reply.group(1))
+        message_id = message_id_match.group(2).decode() if message_id_match else None
+
+        if message_id not in pending:
+            self.logger.warning(
+                "reply message-id %s is not outstanding, assuming it is the reply to oldest "
+                "outstanding message-id %s",
+                message_id,
+                pending[0],
+            )
+            message_id = pending[0]
+
+        self.logger.debug("received reply for message-id %s", message_id)
+        return message_id
+
+    def _demultiplex_reply(
+        self, payload: bytes, pending: List[str], replies: Dict[str, bytes]
+    ) -> None:
+        """
+        Store a reply read off the channel against the outstanding (pipelined) request it answers
+
+        Notifications read while waiting for the replies are routed to the notification queue.
+
+        Args:
+            payload: de-framed message read off the channel
+            pending: message-ids of outstanding requests, oldest first; the matched message-id is
+                removed from this list
+            replies: mapping of message-id to reply payload to store the reply in
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._route_notification(payload=payload):
+            return
+
+        message_id = self._match_reply(payload=payload, pending=pending)
+        if message_id is None:
+            return
+
+        pending.remove(message_id)
+        replies[message_id] = payload
+
+    def _write_stream(self, channel_input: Iterable[bytes]) -> Tuple[bytes, int]:
+        """
+        Write the parts of a message to the channel as they are produced
+
+        Only the tail end of what was written is kept, the message as a whole is never held on to.
+
+        Args:
+            channel_input: parts of the framed xml message to send to netconf server
+
+        Returns:
+            Tuple[bytes, int]: (up to) the last `SENT_TAIL_SIZE` bytes written, and the number of
+                bytes written in total
+
+        Raises:
+            N/A
+
+        """
+        sent_tail = b""
+        sent_size = 0
+        for part in channel_input:
+            # bytes are written as-is by the sync/async channel write overrides
+            self.write(channel_input=part)  # type: ignore[arg-type]
+            sent_tail = (sent_tail + part[-SENT_TAIL_SIZE:])[-SENT_TAIL_SIZE:]
+            sent_size += len(part)
+        return sent_tail, sent_size
+
+    @staticmethod
+    def _input_message_id(channel_input: bytes) -> str:
+        """
+        Fetch the message-id of the rpc in a channel input
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Returns:
+            str: message-id of the rpc
+
+        Raises:
+            ScrapliValueError: if the channel input does not contain an rpc with a message-id
+
+        """
+        message_id_match = RPC_MESSAGE_ID.search(channel_input)
+        if message_id_match is None:
+            raise ScrapliValueError("channel input does not contain an rpc with a message-id")
+        return message_id_match.group(2).decode()
+
     def _pre_send_client_capabilities(
         self, client_capabilities: NetconfClientCapabilities
     ) -> bytes:
@@ -156,6 +533,6 @@ class BaseNetconfChannel(BaseChannel):
         """
         self.logger.info("sending client capabilities")
         bytes_client_capabilities: bytes = client_capabilities.value.encode()
-        self.logger.debug(f"attempting to send capabilities: {client_capabilities}")
+        self.logger.debug("attempting to send capabilities: %s", client_capabilities)
         self.write(client_capabilities.value)
         return bytes_client_capabilities
@@ -0,0 +1,168 @@
+"""scrapli_netconf.channel.buffer"""
+
+
+class ReadBuffer:
+    # compact the underlying bytearray once this many bytes at its head have been consumed (and
+    # they make up at least half of it) so consuming from the front stays cheap
+    COMPACT_THRESHOLD = 65536
+
+    def __init__(self, data: bytes = b"") -> None:
+        """
+        Growable buffer of bytes read off the channel
+
+        Bytes are appended to the end with `extend` and taken off the front with `consume`, neither
+        of which copy anything other than the bytes being added or taken, unlike concatenating (or
+        slicing) immutable bytes objects which copies the whole buffer every time.
+
+        Args:
+            data: initial contents of the buffer
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        self._buf = bytearray(data)
+        self._start = 0
+
+    def __len__(self) -> int:
+        """
+        Number of unconsumed bytes in the buffer
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of bytes
+
+        Raises:
+            N/A
+
+        """
+        return len(self._buf) - self._start
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ReadBuffer class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"ReadBuffer({self.peek()!r})"
+
+    def extend(self, data: bytes) -> None:
+        """
+        Append bytes to the end of the buffer
+
+        Args:
+            data: bytes to append
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._buf += data
+
+    def unread(self, data: bytes) -> None:
+        """
+        Place bytes back at the front of the buffer, i.e. anything read past the end of a message
+
+        Args:
+            data: bytes to place back
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if not data:
+            return
+
+        if len(data) <= self._start:
+            # fits in the already consumed head of the buffer, no need to move anything
+            self._start -= len(data)
+            self._buf[self._start : self._start + len(data)] = data
+            return
+
+        self._buf[: self._start] = data
+        self._start = 0
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """
+        Find the first occurrence of sub in the buffer
+
+        Args:
+            sub: bytes to search for
+            start: offset (from the front of the buffer) to start searching from
+
+        Returns:
+            int: offset of sub from the front of the buffer, -1 if not found
+
+        Raises:
+            N/A
+
+        """
+        index = self._buf.find(sub, self._start + start)
+        if index == -1:
+            return -1
+        return index - self._start
+
+    def peek(self, size: int = -1) -> bytes:
+        """
+        Return bytes from the front of the buffer without consuming them
+
+        Args:
+            size: number of bytes to return, all of them if negative
+
+        Returns:
+            bytes: bytes from the front of the buffer
+
+        Raises:
+            N/A
+
+        """
+        end = len(self._buf) if size < 0 else self._start + size
+        return bytes(self._buf[self._start : end])
+
+    def consume(self, size: int = -1) -> bytes:
+        """
+        Take bytes off the front of the buffer
+
+        Args:
+            size: number of bytes to take, all of them if negative
+
+        Returns:
+            bytes: bytes taken off the front of the buffer
+
+        Raises:
+            N/A
+
+        """
+        if size < 0 or size >= len(self):
+            data = bytes(self._buf[self._start :])
+            self._buf.clear()
+            self._start = 0
+            return data
+
+        data = bytes(self._buf[self._start : self._start + size])
+        self._start += size
+
+        if self._start >= self.COMPACT_THRESHOLD and self._start * 2 >= len(self._buf):
+            del self._buf[: self._start]
+            self._start = 0
+
+        return data
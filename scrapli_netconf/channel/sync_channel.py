@@ -1,14 +1,15 @@
 """scrapli_netconf.channel.sync_channel"""
 
 import re
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from scrapli.channel import Channel
 from scrapli.channel.base_channel import BaseChannelArgs
 from scrapli.decorators import timeout_wrapper
-from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliTimeout
+from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliTimeout, ScrapliValueError
 from scrapli.transport.base import Transport
 from scrapli_netconf.channel.base_channel import BaseNetconfChannel, NetconfBaseChannelArgs
+from scrapli_netconf.channel.buffer import ReadBuffer
 from scrapli_netconf.constants import NetconfVersion
 
 HELLO_MATCH = re.compile(pattern=rb"<(\w+\:){0,1}hello", flags=re.I)
@@ -29,8 +30,9 @@ class NetconfChannel(Channel, BaseNetconfChannel):
         self._base_channel_args.comms_prompt_pattern = "]]>]]>"
         self._server_echo: Optional[bool] = None
         self._establishing_server_echo = False
-        self._capabilities_buf = b""
-        self._read_buf = b""
+        self._capabilities_buf = ReadBuffer()
+        self._read_buf = ReadBuffer()
+        self._notifications = None
 
     def open_netconf(self) -> None:
         """
@@ -54,7 +56,7 @@ class NetconfChannel(Channel, BaseNetconfChannel):
         self._send_client_capabilities()
 
     @staticmethod
-    def _authenticate_check_hello(buf: bytes) -> bool:
+    def _authenticate_check_hello(buf: Union[bytes, bytearray]) -> bool:
         """
         Check if "hello" message is in output
 
@@ -96,23 +98,23 @@ class NetconfChannel(Channel, BaseNetconfChannel):
 
         password_count = 0
         passphrase_count = 0
-        authenticate_buf = b""
+        authenticate_buf = bytearray()
 
         with self._channel_lock():
             while True:
                 buf = self.read()
 
                 authenticate_buf += buf.lower()
-                self._capabilities_buf += buf
+                self._capabilities_buf.extend(buf)
 
-                self._ssh_message_handler(output=authenticate_buf)
+                self._ssh_message_handler(output=bytes(authenticate_buf))
 
                 if re.search(
                     pattern=self.auth_password_pattern,
                     string=authenticate_buf,
                 ):
                     # clear the authentication buffer so we don't re-read the password prompt
-                    authenticate_buf = b""
+                    authenticate_buf.clear()
                     password_count += 1
                     if password_count > 2:
                         msg = "password prompt seen more than once, assuming auth failed"
@@ -126,7 +128,7 @@ class NetconfChannel(Channel, BaseNetconfChannel):
                     string=authenticate_buf,
                 ):
                     # clear the authentication buffer so we don't re-read the passphrase prompt
-                    authenticate_buf = b""
+                    authenticate_buf.clear()
                     passphrase_count += 1
                     if passphrase_count > 2:
                         msg = "passphrase prompt seen more than once, assuming auth failed"
@@ -159,18 +161,25 @@ class NetconfChannel(Channel, BaseNetconfChannel):
         capabilities_buf = self._capabilities_buf
 
         # reset this to empty to avoid any confusion now that we are moving on
-        self._capabilities_buf = b""
+        self._capabilities_buf = ReadBuffer()
 
         with self._channel_lock():
-            while b"]]>]]>" not in capabilities_buf:
-                capabilities_buf += self.read()
+            end = capabilities_buf.find(b"]]>]]>")
+            while end == -1:
+                # only search the newly read bytes (and enough before them to catch a delimiter
+                # split across reads) rather than the whole buffer again
+                searched = max(len(capabilities_buf) - 5, 0)
+                capabilities_buf.extend(self.read())
+                end = capabilities_buf.find(b"]]>]]>", searched)
 
-            capabilities_buf, _, over_read_buf = capabilities_buf.partition(b"]]>]]>")
-            if over_read_buf:
-                self._read_buf += over_read_buf
+            raw_server_capabilities = capabilities_buf.consume(end)
 
-            self.logger.debug(f"received raw server capabilities: {repr(capabilities_buf)}")
-        return capabilities_buf
+            # anything past the delimiter is the start of the next message, keep it for next read
+            capabilities_buf.consume(6)
+            self._read_buf.extend(capabilities_buf.consume())
+
+            self.logger.debug("received raw server capabilities: %r", raw_server_capabilities)
+        return raw_server_capabilities
 
     @timeout_wrapper
     def _send_client_capabilities(
@@ -196,6 +205,85 @@ class NetconfChannel(Channel, BaseNetconfChannel):
             self._read_until_input(channel_input=bytes_client_capabilities)
             self.send_return()
 
+    def write(self, channel_input: Union[str, bytes], redacted: bool = False) -> None:
+        """
+        Write input to the underlying Transport session
+
+        Netconf messages are built as bytes, those are written as-is rather than (as scrapli does
+        with strings) encoded first.
+
+        Args:
+            channel_input: string or bytes of input to send
+            redacted: redact channel input from log or not
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(channel_input, str):
+            super().write(channel_input=channel_input, redacted=redacted)
+            return
+
+        if redacted:
+            self.logger.debug("write: REDACTED")
+        else:
+            self.logger.debug("write: %r", channel_input)
+
+        self.transport.write(channel_input=channel_input)
+
+    @timeout_wrapper
+    def _send_input_eager(self, channel_input: bytes) -> None:
+        """
+        Send input to netconf server, reading it back off the channel if the server echoes inputs
+
+        Same as scrapli `send_input` with `eager` set (the reply is left for the caller to read),
+        but sending bytes as they are.
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.logger.info("sending channel input: %r", channel_input)
+
+        with self._channel_lock():
+            self.write(channel_input=channel_input)
+            self._read_until_input(channel_input=channel_input)
+            self.send_return()
+
+    @timeout_wrapper
+    def _send_input_stream_eager(self, channel_input: Iterable[bytes]) -> Tuple[bytes, int]:
+        """
+        Send input to netconf server part by part, reading it back off the channel if it echoes
+
+        Args:
+            channel_input: parts of the framed xml message to send to netconf server
+
+        Returns:
+            Tuple[bytes, int]: tail end of the input sent, to look for in echoed output, and the
+                number of bytes sent
+
+        Raises:
+            N/A
+
+        """
+        self.logger.info("sending streamed channel input")
+
+        with self._channel_lock():
+            sent_tail, sent_size = self._write_stream(channel_input=channel_input)
+            self._read_until_input(channel_input=sent_tail)
+            self.send_return()
+
+        return sent_tail, sent_size
+
     def read(self) -> bytes:
         """
         Read chunks of output from the channel
@@ -221,18 +309,16 @@ class NetconfChannel(Channel, BaseNetconfChannel):
 
         """
         if self._read_buf:
-            read_buf = self._read_buf
-            self._read_buf = b""
-            return read_buf
+            return self._read_buf.consume()
 
         buf = self.transport.read()
 
-        self.logger.debug(f"read: {buf!r}")
+        self.logger.debug("read: %r", buf)
 
         if self.channel_log:
             self.channel_log.write(buf)
 
-        if b"\x1b" in buf.lower():
+        if b"\x1b" in buf:
             buf = self._strip_ansi(buf=buf)
 
         return buf
@@ -242,7 +328,7 @@ class NetconfChannel(Channel, BaseNetconfChannel):
         Sync read until all input has been entered.
 
         Args:
-            channel_input: string to write to channel
+            channel_input: bytes written to the channel
 
         Returns:
             bytes: output read from channel
@@ -259,55 +345,130 @@ class NetconfChannel(Channel, BaseNetconfChannel):
             return output
 
         if not channel_input:
-            self.logger.info(f"Read: {repr(output)}")
+            self.logger.info("Read: %r", output)
             return output
 
+        read_buf = ReadBuffer()
+
         while True:
-            output += self.read()
+            # only search the newly read bytes (and enough before them to catch a match split
+            # across reads) rather than the whole buffer again
+            searched = max(len(read_buf) - max(len(channel_input), len(b"rpc>")) + 1, 0)
+            read_buf.extend(self.read())
 
             if self._establishing_server_echo:
-                output, partition, new_buf = output.partition(b"]]>]]>")
-                self._read_buf += new_buf
-                output += partition
+                end = read_buf.find(b"]]>]]>")
+                if end != -1:
+                    output = read_buf.consume(end + 6)
+                    self._read_buf.extend(read_buf.consume())
+                else:
+                    output = read_buf.consume()
                 break
 
             # if we have all the input *or* we see the closing rpc tag we know we are done here
-            if channel_input in output or b"rpc>" in output:
+            if (
+                read_buf.find(channel_input, searched) != -1
+                or read_buf.find(b"rpc>", searched) != -1
+            ):
+                output = read_buf.consume()
                 break
 
-        self.logger.info(f"Read: {repr(output)}")
+        self.logger.info("Read: %r", output)
         return output
 
-    def send_input_netconf(self, channel_input: str) -> bytes:  # noqa: mccabe
+    def _read_until_message(self, buf: bytes = b"") -> bytes:
+        """
+        Read until a complete netconf message has been received
+
+        Each read is fed to a message decoder as it arrives rather than searching the entire read
+        buffer for the end of message prompt after every read.
+
+        Args:
+            buf: output from previous reads if needed
+
+        Returns:
+            bytes: de-framed message payload
+
+        Raises:
+            N/A
+
+        """
+        decoder = self._build_message_decoder()
+
+        complete = decoder.feed(buf)
+        while not complete:
+            complete = decoder.feed(self.read())
+
+        return self._process_decoded_message(decoder=decoder)
+
+    def send_input_netconf(self, channel_input: bytes) -> bytes:
         """
         Send inputs to netconf server
 
         Args:
-            channel_input: string of the base xml message to send to netconf server
+            channel_input: bytes of the base xml message to send to netconf server
 
         Returns:
-            bytes: bytes result of message sent to netconf server
+            bytes: bytes result of message sent to netconf server; for netconf 1.1 this is the
+                de-framed payload
 
         Raises:
-            ScrapliTimeout: re-raises channel timeouts with additional message if channel input may
-                be big enough to require setting `use_compressed_parser` to false -- note that this
-                has only been seen as an issue with NXOS so far.
+            N/A
+
+        """
+        self._send_input_eager(channel_input=channel_input)
+        return self._read_reply_netconf(channel_input=channel_input)
+
+    def send_input_netconf_stream(self, channel_input: Iterable[bytes]) -> bytes:
+        """
+        Send inputs to netconf server part by part, as they are produced
+
+        Args:
+            channel_input: parts of the framed xml message to send to netconf server
+
+        Returns:
+            bytes: bytes result of message sent to netconf server, see `send_input_netconf`
+
+        Raises:
+            N/A
+
+        """
+        sent_tail, sent_size = self._send_input_stream_eager(channel_input=channel_input)
+        return self._read_reply_netconf(channel_input=sent_tail, channel_input_size=sent_size)
 
+    def _read_reply_netconf(  # noqa: mccabe pylint: disable=R0912
+        self, channel_input: bytes, channel_input_size: Optional[int] = None
+    ) -> bytes:
         """
-        bytes_final_channel_input = channel_input.encode()
+        Read the reply to an input sent to netconf server
 
-        buf: bytes
-        buf, _ = super().send_input(channel_input=channel_input, strip_prompt=False, eager=True)
+        Args:
+            channel_input: bytes sent to netconf server -- or the tail end of them for streamed
+                inputs -- used to determine if the server echoes inputs
+            channel_input_size: number of bytes sent to netconf server, if only the tail end of
+                them is passed as `channel_input`
 
-        if bytes_final_channel_input in buf:
-            # if we got the input AND the rpc-reply we can strip out our inputs so we just have the
-            # reply remaining
-            buf = buf.split(bytes_final_channel_input)[1]
+        Returns:
+            bytes: bytes result of message sent to netconf server; for netconf 1.1 this is the
+                de-framed payload
+
+        Raises:
+            ScrapliTimeout: re-raises channel timeouts with additional message if channel input may
+                be big enough to require setting `use_compressed_parser` to false -- note that this
+                has only been seen as an issue with NXOS so far.
 
+        """
         try:
-            buf = self._read_until_prompt(buf=buf)
+            decoded = self._use_message_decoder()
+            if decoded:
+                buf = self._read_until_message()
+                # notifications may arrive ahead of the reply once subscribed
+                while self._route_notification(payload=buf):
+                    buf = self._read_until_message()
+            else:
+                buf = self._read_until_prompt()
         except ScrapliTimeout as exc:
-            if len(channel_input) >= 4096:
+            if (len(channel_input) if channel_input_size is None else channel_input_size) >= 4096:
                 msg = (
                     "timed out finding prompt after sending input, input is greater than 4096 "
                     "chars, try setting 'use_compressed_parser' to False"
@@ -343,12 +504,12 @@ class NetconfChannel(Channel, BaseNetconfChannel):
                 _, _, buf = buf.partition(b"</hello>]]>]]>")
                 if buf:
                     # if we read past the end of the
-                    self._read_buf += buf
+                    self._read_buf.extend(buf)
 
                 # read up till our new input now to consume it from the channel
                 self._establishing_server_echo = True
-                self._read_until_input(bytes_final_channel_input)
-            elif bytes_final_channel_input in buf:
+                self._read_until_input(channel_input)
+            elif channel_input in buf:
                 self.logger.debug("server echoes inputs, setting _server_echo to 'true'")
                 self._server_echo = True
             else:
@@ -369,6 +530,164 @@ class NetconfChannel(Channel, BaseNetconfChannel):
             # netconf 1.1 with "chunking" style message format needs an extra return char here
             self.send_return()
 
+        if not decoded:
+            buf = self._deframe_reply(buf=buf)
+
         # we should be able to simply partition here and put any "over reads" back into the read buf
 
         return buf
+
+    @timeout_wrapper
+    def _read_until_replies(self, pending: List[str]) -> Dict[str, bytes]:
+        """
+        Read until replies to all outstanding requests have been received
+
+        Args:
+            pending: message-ids of outstanding requests, oldest first
+
+        Returns:
+            Dict[str, bytes]: mapping of message-id to de-framed reply payload
+
+        Raises:
+            N/A
+
+        """
+        replies: Dict[str, bytes] = {}
+
+        while pending:
+            self._demultiplex_reply(
+                payload=self._read_until_message(), pending=pending, replies=replies
+            )
+
+        return replies
+
+    def send_inputs_netconf(self, channel_inputs: Dict[str, bytes]) -> Dict[str, bytes]:
+        """
+        Send several inputs to netconf server without waiting for replies in between (pipelining)
+
+        All inputs are written to the channel back to back, only then are the replies read and
+        matched up to the inputs by their message-id. Servers that echo inputs back (or until we
+        know if the server echoes at all) are sent the inputs one at a time as usual instead.
+
+        Args:
+            channel_inputs: mapping of message-id to the bytes of the base xml message to send to
+                netconf server -- message-ids must match those in the messages
+
+        Returns:
+            Dict[str, bytes]: mapping of message-id to bytes result of the message sent to netconf
+                server, see `send_input_netconf`
+
+        Raises:
+            N/A
+
+        """
+        replies: Dict[str, bytes] = {}
+        pending = list(channel_inputs)
+
+        if pending and self._server_echo is None:
+            # echo behavior is determined by inspecting the whole first reply, so that one goes on
+            # its own
+            message_id = pending.pop(0)
+            replies[message_id] = self.send_input_netconf(channel_input=channel_inputs[message_id])
+
+        if self._server_echo:
+            for message_id in pending:
+                replies[message_id] = self.send_input_netconf(
+                    channel_input=channel_inputs[message_id]
+                )
+            return replies
+
+        if not pending:
+            return replies
+
+        self.logger.info("sending %s pipelined channel inputs", len(pending))
+
+        with self._channel_lock():
+            for message_id in pending:
+                self.write(channel_input=channel_inputs[message_id])
+                self.send_return()
+
+                if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+                    self.send_return()
+
+            replies.update(self._read_until_replies(pending=pending))
+
+        return replies
+
+    def read_notification(self) -> bytes:
+        """
+        Read the next notification, waiting for one to arrive if none are queued
+
+        Blocks for as long as it takes for a notification to arrive, bar the transport timeout.
+        Replies read while waiting have no request waiting for them (as that request would be
+        reading them itself) and are discarded.
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: de-framed notification message
+
+        Raises:
+            ScrapliValueError: if notifications are not enabled, i.e. there is no subscription
+
+        """
+        notifications = self._notifications
+        if notifications is None:
+            raise ScrapliValueError("no notification subscription, notifications are not enabled")
+
+        with self._channel_lock():
+            notification = notifications.get()
+            while notification is None:
+                payload = self._read_until_message()
+                if not self._route_notification(payload=payload):
+                    self.logger.warning(
+                        "discarding unexpected message while awaiting notifications: %r",
+                        payload[:256],
+                    )
+                notification = notifications.get()
+
+        return notification
+
+    def send_input_netconf_iter(self, channel_input: bytes) -> Iterator[bytes]:
+        """
+        Send inputs to netconf server, yielding the de-framed reply as it is read off the channel
+
+        Args:
+            channel_input: bytes of the base xml message to send to netconf server
+
+        Yields:
+            bytes: de-framed parts of the reply to the message sent to netconf server
+
+        Raises:
+            GeneratorExit: re-raised once the rest of the reply is read if iteration stops early
+
+        """
+        if self._server_echo is None:
+            # echo behavior is determined by inspecting the whole first reply, so until that has
+            # happened we cannot stream; just decode that reply in one go
+            decoder = self._build_message_decoder()
+            decoder.feed(self.send_input_netconf(channel_input=channel_input))
+            yield from decoder.pop_chunks()
+            return
+
+        self._send_input_eager(channel_input=channel_input)
+
+        decoder = self._build_message_decoder()
+
+        try:
+            while not decoder.complete:
+                decoder.feed(self.read())
+                yield from decoder.pop_chunks()
+        except GeneratorExit:
+            # caller stopped iterating early, finish reading the reply off the channel so it does
+            # not get mixed up with the reply to the next rpc
+            while not decoder.complete:
+                decoder.feed(self.read())
+                decoder.pop_chunks()
+            raise
+        finally:
+            self._restore_over_read(decoder=decoder)
+
+        if self._netconf_base_channel_args.netconf_version == NetconfVersion.VERSION_1_1:
+            self.send_return()
@@ -8,6 +8,12 @@ class XmlParserVersion(Enum):
     STANDARD_PARSER = "standard"
 
 
+class InputValidation(Enum):
+    PARSE = "parse"
+    CHECK = "check"
+    TRUST = "trust"
+
+
 class NetconfVersion(Enum):
     UNKNOWN = "unknown"
     VERSION_1_0 = "1.0"
@@ -1,9 +1,12 @@
 # pylint: disable=C0302
 """scrapli_netconf.driver.base_driver"""
 import importlib
+import re
 from dataclasses import fields
 from enum import Enum
-from typing import Any, Callable, List, Optional, Tuple, Union
+from functools import _CacheInfo, lru_cache, partial
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from lxml import etree
 from lxml.etree import _Element
@@ -11,14 +14,79 @@ from lxml.etree import _Element
 from scrapli.driver.base.base_driver import BaseDriver
 from scrapli.exceptions import ScrapliTypeError, ScrapliValueError
 from scrapli.helper import user_warning
+from scrapli_netconf.cache import CachedSession, CapabilityCache, SchemaCache
+from scrapli_netconf.capabilities import ServerCapabilities
 from scrapli_netconf.channel.base_channel import NetconfBaseChannelArgs
-from scrapli_netconf.constants import NetconfClientCapabilities, NetconfVersion, XmlParserVersion
+from scrapli_netconf.constants import (
+    InputValidation,
+    NetconfClientCapabilities,
+    NetconfVersion,
+    XmlParserVersion,
+)
 from scrapli_netconf.exceptions import CapabilityNotSupported
+from scrapli_netconf.framing import encode_message
+from scrapli_netconf.helper import (
+    XmlSource,
+    check_well_formed_document,
+    iter_well_formed_xml_source,
+    iter_xml_source,
+    strip_xml_declaration,
+)
+from scrapli_netconf.notifications import parse_notification
 from scrapli_netconf.response import NetconfResponse
 
 COMPRESSED_PARSER = etree.XMLParser(remove_blank_text=True, recover=True)
 STANDARD_PARSER = etree.XMLParser(remove_blank_text=False, recover=True)
 
+# datastore names/text values that lxml would serialize as-is; anything else is run through lxml
+SIMPLE_ELEMENT_NAME = re.compile(pattern=r"[A-Za-z_][\w.-]*")
+SIMPLE_TEXT = re.compile(pattern=r"[\w .:/@+-]*")
+# user provided subtree filters already wrapped in filter tags, and the type attribute of those
+SUBTREE_FILTER_ELEMENT = re.compile(pattern=rb"\s*<filter(?P<attributes>(?:\s[^>]*?)?)(?P<end>/?>)")
+FILTER_TYPE_ATTRIBUTE = re.compile(pattern=rb"""\stype\s*=\s*(?:"[^"]*"|'[^']*')""")
+# lxml reconciles elements in this namespace with the default namespace of the rpc element when
+# they are inserted into it, so anything containing it can't be spliced into a request as-is
+NETCONF_BASE_NAMESPACE = b"urn:ietf:params:xml:ns:netconf:base:1.0"
+
+# number of serialized filters (per filter, filter type and parser) kept for reuse, shared by all
+# drivers in the process -- pollers tend to send the same handful of filters over and over
+FILTER_CACHE_SIZE = 256
+
+# operations that return a single NetconfResponse, each has a matching `_pre_<operation>` method
+NETCONF_OPERATIONS = (
+    "get",
+    "get_config",
+    "edit_config",
+    "delete_config",
+    "commit",
+    "discard",
+    "lock",
+    "unlock",
+    "rpc",
+    "validate",
+    "copy_config",
+    "get_schema",
+)
+
+NETCONF_MONITORING_NAMESPACE = "urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring"
+# servers advertising either of these only list (some of) their yang 1.0 modules in the hello, the
+# full list of modules is in the yang library
+YANG_LIBRARY_CAPABILITIES = (
+    "urn:ietf:params:netconf:capability:yang-library:1.0",
+    "urn:ietf:params:netconf:capability:yang-library:1.1",
+)
+# yang library 1.0 (RFC 7895) lists the modules in "modules-state", NMDA servers (yang library 1.1,
+# RFC 8525) in "yang-library" -- "modules-state" being deprecated they may well leave it empty
+YANG_LIBRARY_FILTER = "<modules-state xmlns='urn:ietf:params:xml:ns:yang:ietf-yang-library'/>"
+YANG_LIBRARY_1_1_FILTER = "<yang-library xmlns='urn:ietf:params:xml:ns:yang:ietf-yang-library'/>"
+
+# number of schemas requested at a time when syncing schemas, each batch is cached before the next
+# one is requested so the replies of (potentially) hundreds of schemas are never all held at once
+SCHEMA_SYNC_BATCH_SIZE = 32
+
+NETCONF_NOTIFICATION_NAMESPACE = "urn:ietf:params:xml:ns:netconf:notification:1.0"
+NOTIFICATION_CAPABILITY = "urn:ietf:params:netconf:capability:notification:1.0"
+
 
 class NetconfBaseOperations(Enum):
     FILTER_SUBTREE = "<filter type='{filter_type}'></filter>"
@@ -44,6 +112,50 @@ class NetconfBaseOperations(Enum):
     UNLOCK = "<unlock><target><{target}/></target></unlock>"
     RPC = "<rpc xmlns='urn:ietf:params:xml:ns:netconf:base:1.0' message-id='{message_id}'></rpc>"
     VALIDATE = "<validate><source><{source}/></source></validate>"
+    GET_SCHEMA = f"<get-schema xmlns='{NETCONF_MONITORING_NAMESPACE}'></get-schema>"
+    CREATE_SUBSCRIPTION = (
+        f"<create-subscription xmlns='{NETCONF_NOTIFICATION_NAMESPACE}'></create-subscription>"
+    )
+
+
+class NetconfBaseOperationTemplates(Enum):
+    # byte for byte what lxml serializes the equivalent `NetconfBaseOperations` elements (with their
+    # children inserted) to, so requests can be built without a parse/serialize round trip
+    RPC = (
+        b"<?xml version='1.0' encoding='utf-8'?>\n"
+        b'<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="%b">%b</rpc>'
+    )
+    DATASTORE = b"<%b/>"
+    FILTER_SUBTREE = b'<filter type="subtree">%b</filter>'
+    WITH_DEFAULTS_SUBTREE = (
+        b'<with-defaults xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-with-defaults">'
+        b"%b</with-defaults>"
+    )
+    GET = b"<get>%b</get>"
+    GET_CONFIG = b"<get-config><source>%b</source>%b</get-config>"
+    EDIT_CONFIG = b"<edit-config><target>%b</target>%b</edit-config>"
+    DELETE_CONFIG = b"<delete-config><target>%b</target></delete-config>"
+    COPY_CONFIG = b"<copy-config><target>%b</target><source>%b</source></copy-config>"
+    COMMIT = b"<commit/>"
+    COMMIT_WITH_CHILDREN = b"<commit>%b</commit>"
+    COMMIT_CONFIRMED = b"<confirmed/>"
+    COMMIT_CONFIRMED_TIMEOUT = b"<confirm-timeout>%b</confirm-timeout>"
+    COMMIT_CONFIRMED_PERSIST = b"<persist>%b</persist>"
+    COMMIT_PERSIST_ID = b"<persist-id>%b</persist-id>"
+    DISCARD = b"<discard-changes/>"
+    LOCK = b"<lock><target>%b</target></lock>"
+    UNLOCK = b"<unlock><target>%b</target></unlock>"
+    VALIDATE = b"<validate><source>%b</source></validate>"
+    GET_SCHEMA = f'<get-schema xmlns="{NETCONF_MONITORING_NAMESPACE}">%b</get-schema>'.encode()
+    GET_SCHEMA_IDENTIFIER = b"<identifier>%b</identifier>"
+    GET_SCHEMA_VERSION = b"<version>%b</version>"
+    GET_SCHEMA_FORMAT = b"<format>%b</format>"
+    CREATE_SUBSCRIPTION = (
+        f'<create-subscription xmlns="{NETCONF_NOTIFICATION_NAMESPACE}">%b</create-subscription>'
+    ).encode()
+    CREATE_SUBSCRIPTION_STREAM = b"<stream>%b</stream>"
+    CREATE_SUBSCRIPTION_START_TIME = b"<startTime>%b</startTime>"
+    CREATE_SUBSCRIPTION_STOP_TIME = b"<stopTime>%b</stopTime>"
 
 
 class NetconfBaseDriver(BaseDriver):
@@ -51,8 +163,11 @@ class NetconfBaseDriver(BaseDriver):
     readable_datastores: List[str]
     writeable_datastores: List[str]
     strip_namespaces: bool
+    build_result: bool
     strict_datastores: bool
     flatten_input: bool
+    input_validation: InputValidation
+    capability_cache: Optional[CapabilityCache]
     _netconf_base_channel_args: NetconfBaseChannelArgs
 
     @property
@@ -90,7 +205,7 @@ class NetconfBaseDriver(BaseDriver):
         if not isinstance(value, NetconfVersion):
             raise ScrapliTypeError
 
-        self.logger.debug(f"setting 'netconf_version' value to '{value.value}'")
+        self.logger.debug("setting 'netconf_version' value to '%s'", value.value)
 
         self._netconf_base_channel_args.netconf_version = value
 
@@ -134,12 +249,12 @@ class NetconfBaseDriver(BaseDriver):
         if not isinstance(value, NetconfClientCapabilities):
             raise ScrapliTypeError
 
-        self.logger.debug(f"setting 'client_capabilities' value to '{value.value}'")
+        self.logger.debug("setting 'client_capabilities' value to '%s'", value.value)
 
         self._netconf_base_channel_args.client_capabilities = value
 
     @property
-    def server_capabilities(self) -> List[str]:
+    def server_capabilities(self) -> ServerCapabilities:
         """
         Getter for 'server_capabilities' attribute
 
@@ -147,16 +262,18 @@ class NetconfBaseDriver(BaseDriver):
             N/A
 
         Returns:
-            list: list of strings of server capabilities
+            ServerCapabilities: list of strings of server capabilities, indexed for lookups
 
         Raises:
             N/A
 
         """
-        return self._netconf_base_channel_args.server_capabilities or []
+        if self._netconf_base_channel_args.server_capabilities is None:
+            self._netconf_base_channel_args.server_capabilities = ServerCapabilities()
+        return self._netconf_base_channel_args.server_capabilities
 
     @server_capabilities.setter
-    def server_capabilities(self, value: NetconfClientCapabilities) -> None:
+    def server_capabilities(self, value: List[str]) -> None:
         """
         Setter for 'server_capabilities' attribute
 
@@ -173,9 +290,11 @@ class NetconfBaseDriver(BaseDriver):
         if not isinstance(value, list):
             raise ScrapliTypeError
 
-        self.logger.debug(f"setting 'server_capabilities' value to '{value}'")
+        self.logger.debug("setting 'server_capabilities' value to '%s'", value)
 
-        self._netconf_base_channel_args.server_capabilities = value
+        self._netconf_base_channel_args.server_capabilities = (
+            value if isinstance(value, ServerCapabilities) else ServerCapabilities(value)
+        )
 
     @staticmethod
     def _determine_preferred_netconf_version(
@@ -225,6 +344,90 @@ class NetconfBaseDriver(BaseDriver):
             return XmlParserVersion.COMPRESSED_PARSER
         return XmlParserVersion.STANDARD_PARSER
 
+    @staticmethod
+    def _determine_input_validation(input_validation: str) -> InputValidation:
+        """
+        Determine how user provided xml input is validated
+
+        Args:
+            input_validation: string indicating how to validate input; parse|check|trust
+
+        Returns:
+            InputValidation: how to validate user provided xml input
+
+        Raises:
+            ScrapliValueError: if input_validation is not a valid option
+
+        """
+        try:
+            return InputValidation(input_validation)
+        except ValueError:
+            raise ScrapliValueError(
+                "'input_validation' provided with invalid value, must be one of: 'parse', "
+                "'check', or 'trust'"
+            ) from None
+
+    @staticmethod
+    def _determine_capability_cache(
+        capability_cache: Optional[Union[str, CapabilityCache]],
+    ) -> Optional[CapabilityCache]:
+        """
+        Determine the capability cache to use, if any
+
+        Args:
+            capability_cache: directory to cache capabilities in, or a CapabilityCache (i.e. to
+                share one between drivers), or None to not cache anything
+
+        Returns:
+            Optional[CapabilityCache]: capability cache to use
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(capability_cache, str):
+            return CapabilityCache(path=capability_cache)
+        return capability_cache
+
+    def _resolve_input_validation(self, input_validation: Optional[str]) -> InputValidation:
+        """
+        Resolve how to validate the user provided xml input of an operation
+
+        Args:
+            input_validation: per operation override of the drivers `input_validation`, if any
+
+        Returns:
+            InputValidation: how to validate user provided xml input
+
+        Raises:
+            N/A
+
+        """
+        if input_validation is None:
+            return self.input_validation
+        return self._determine_input_validation(input_validation=input_validation)
+
+    @staticmethod
+    def _splice_input(xml_input: str, input_validation: InputValidation) -> bytes:
+        """
+        Encode user provided xml input to splice into a request as-is, checking it if need be
+
+        Args:
+            xml_input: user provided xml
+            input_validation: how to validate the xml; check|trust
+
+        Returns:
+            bytes: encoded xml input
+
+        Raises:
+            N/A
+
+        """
+        raw_input = xml_input.encode()
+        if input_validation == InputValidation.CHECK:
+            check_well_formed_document(document=raw_input)
+        return raw_input
+
     @property
     def xml_parser(self) -> etree.XMLParser:
         """
@@ -296,6 +499,113 @@ class NetconfBaseDriver(BaseDriver):
 
         return transport_class, plugin_transport_args
 
+    def _load_cached_session(self) -> None:
+        """
+        Load what the capability cache knows about the device, for the channel to check the hello
+        the server sends against
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self.capability_cache is None:
+            return
+
+        self._netconf_base_channel_args.cached_session = self.capability_cache.load(
+            host=self.host, port=self.port, transport=self.transport_name
+        ) or CachedSession(host=self.host, port=self.port, transport=self.transport_name)
+
+    def _store_cached_session(self) -> None:
+        """
+        Store the cached session of the device in the capability cache
+
+        Failing to store it is not worth failing the connection over, the device is just asked for
+        everything again next time.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        cached_session = self._netconf_base_channel_args.cached_session
+        if self.capability_cache is None or cached_session is None:
+            return
+
+        try:
+            self.capability_cache.store(session=cached_session)
+        except OSError as exc:
+            self.logger.warning("failed to store capability cache of '%s': %s", self.host, exc)
+
+    def _build_datastores(self) -> None:
+        """
+        Build the readable and writeable datastores, or reuse the cached ones if the hello is
+        unchanged since they were cached
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        cached_session = self._netconf_base_channel_args.cached_session
+
+        if (
+            cached_session is not None
+            and cached_session.readable_datastores is not None
+            and cached_session.writeable_datastores is not None
+        ):
+            self.readable_datastores = list(cached_session.readable_datastores)
+            self.writeable_datastores = list(cached_session.writeable_datastores)
+            return
+
+        self._build_readable_datastores()
+        self._build_writeable_datastores()
+
+        if cached_session is not None:
+            cached_session.readable_datastores = list(self.readable_datastores)
+            cached_session.writeable_datastores = list(self.writeable_datastores)
+            self._store_cached_session()
+
+    def _update_cached_server_echo(self, server_echo: Optional[bool]) -> None:
+        """
+        Update the cached session with whether the server echoes inputs, once that is known
+
+        Args:
+            server_echo: whether the server echoes inputs, None if that is not known
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        cached_session = self._netconf_base_channel_args.cached_session
+        if (
+            cached_session is None
+            or server_echo is None
+            or server_echo == cached_session.server_echo
+        ):
+            return
+
+        cached_session.server_echo = server_echo
+        self._store_cached_session()
+
     def _build_readable_datastores(self) -> None:
         """
         Build a list of readable datastores based on server's advertised capabilities
@@ -424,7 +734,7 @@ class NetconfBaseDriver(BaseDriver):
         # pylint did not seem to want to be ok with assigning this as a class attribute... and its
         # only used here so... here we are
         self.message_id: int  # pylint: disable=W0201
-        self.logger.debug(f"Building base element for message id {self.message_id}")
+        self.logger.debug("Building base element for message id %s", self.message_id)
         base_xml_str = NetconfBaseOperations.RPC.value.format(message_id=self.message_id)
         self.message_id += 1
         base_elem = etree.fromstring(text=base_xml_str)
@@ -459,16 +769,114 @@ class NetconfBaseDriver(BaseDriver):
         Returns:
             _Element: lxml filter element to use for netconf operation
 
+        Raises:
+            N/A
+
+        """
+        self._validate_filter_type(filter_type=filter_type)
+        return self._build_filter_element(
+            filter_=filter_, filter_type=filter_type, parser=self.xml_parser
+        )
+
+    def _serialize_filter(
+        self,
+        filter_: str,
+        filter_type: str = "subtree",
+        input_validation: InputValidation = InputValidation.PARSE,
+    ) -> Optional[bytes]:
+        """
+        Serialize the filter element for a given rpc, reusing previously serialized filters
+
+        Subtree filters that are not to be parsed are spliced into the filter element as-is (or
+        used as-is if already wrapped in filter tags, bar forcing the filter "type" to subtree as
+        the parsed path does); xpath filters are not user provided xml, so are always built the
+        same way.
+
+        Args:
+            filter_: strings of filters to build into a filter element or (for subtree) a full
+                filter string (in filter tags)
+            filter_type: type of filter; subtree|xpath
+            input_validation: how to validate subtree filters
+
+        Returns:
+            Optional[bytes]: serialized filter element, as `_serialize_element`
+
+        Raises:
+            N/A
+
+        """
+        self._validate_filter_type(filter_type=filter_type)
+
+        if filter_type == "subtree" and input_validation != InputValidation.PARSE:
+            raw_filter = filter_.encode()
+            if input_validation == InputValidation.CHECK:
+                # as when parsing, allow for several elements at the root of the filter
+                check_well_formed_document(document=b"<tmp>%b</tmp>" % raw_filter)
+            filter_element = SUBTREE_FILTER_ELEMENT.match(raw_filter)
+            if filter_element is None:
+                return NetconfBaseOperationTemplates.FILTER_SUBTREE.value % raw_filter
+            return b'<filter type="subtree"%b%b%b' % (
+                FILTER_TYPE_ATTRIBUTE.sub(b"", filter_element.group("attributes")),
+                filter_element.group("end"),
+                raw_filter[filter_element.end() :],  # noqa: E203
+            )
+
+        return self._serialize_filter_element(
+            filter_=filter_, filter_type=filter_type, parser=self.xml_parser
+        )
+
+    def _validate_filter_type(self, filter_type: str) -> None:
+        """
+        Validate the filter type is one the server supports
+
+        Args:
+            filter_type: type of filter; subtree|xpath
+
+        Returns:
+            None
+
         Raises:
             CapabilityNotSupported: if xpath selected and not supported on server
             ScrapliValueError: if filter_type is not one of subtree|xpath
 
+        """
+        if filter_type == "subtree":
+            return
+
+        if filter_type == "xpath":
+            if "urn:ietf:params:netconf:capability:xpath:1.0" not in self.server_capabilities:
+                msg = "xpath filter requested, but is not supported by the server"
+                self.logger.exception(msg)
+                raise CapabilityNotSupported(msg)
+            return
+
+        raise ScrapliValueError(
+            f"'filter_type' should be one of subtree|xpath, got '{filter_type}'"
+        )
+
+    @staticmethod
+    def _build_filter_element(filter_: str, filter_type: str, parser: etree.XMLParser) -> _Element:
+        """
+        Create filter element for a (validated) filter type
+
+        Args:
+            filter_: strings of filters to build into a filter element or (for subtree) a full
+                filter string (in filter tags)
+            filter_type: type of filter; subtree|xpath
+            parser: parser to parse the filter with
+
+        Returns:
+            _Element: lxml filter element to use for netconf operation
+
+        Raises:
+            N/A
+
         """
         if filter_type == "subtree":
             # tmp tags to place the users kinda not valid xml filter into
             _filter_ = f"<tmp>{filter_}</tmp>"
             # "validate" subtree filter by forcing it into xml, parser "flattens" it as well
-            tmp_xml_filter_element = etree.fromstring(_filter_, parser=self.xml_parser)
+            tmp_xml_filter_element = etree.fromstring(_filter_, parser=parser)
 
             if tmp_xml_filter_element.getchildren()[0].tag == "filter":
                 # if the user filter was already wrapped in filter tags we'll end up here, we will
@@ -485,24 +893,79 @@ class NetconfBaseDriver(BaseDriver):
                 for xml_filter_element in tmp_xml_filter_element:
                     # insert the subtree filter into the parent filter element
                     xml_filter_elem.insert(1, xml_filter_element)
-
-        elif filter_type == "xpath":
-            if "urn:ietf:params:netconf:capability:xpath:1.0" not in self.server_capabilities:
-                msg = "xpath filter requested, but is not supported by the server"
-                self.logger.exception(msg)
-                raise CapabilityNotSupported(msg)
+        else:
             xml_filter_elem = etree.fromstring(
                 NetconfBaseOperations.FILTER_XPATH.value.format(
                     filter_type=filter_type, xpath=filter_
                 ),
-                parser=self.xml_parser,
-            )
-        else:
-            raise ScrapliValueError(
-                f"'filter_type' should be one of subtree|xpath, got '{filter_type}'"
+                parser=parser,
             )
         return xml_filter_elem
 
+    @staticmethod
+    @lru_cache(maxsize=FILTER_CACHE_SIZE)
+    def _serialize_filter_element(
+        filter_: str, filter_type: str, parser: etree.XMLParser
+    ) -> Optional[bytes]:
+        """
+        Serialize the filter element for a (validated) filter type
+
+        Cached (see `FILTER_CACHE_SIZE`) across all drivers; the serialized filter is immutable so
+        is safe to share, unlike the lxml element which is inserted into (so modified by) a request.
+
+        Args:
+            filter_: strings of filters to build into a filter element or (for subtree) a full
+                filter string (in filter tags)
+            filter_type: type of filter; subtree|xpath
+            parser: parser to parse the filter with
+
+        Returns:
+            Optional[bytes]: serialized filter element, as `_serialize_element`
+
+        Raises:
+            N/A
+
+        """
+        return NetconfBaseDriver._serialize_element(
+            xml_element=NetconfBaseDriver._build_filter_element(
+                filter_=filter_, filter_type=filter_type, parser=parser
+            )
+        )
+
+    @staticmethod
+    def filter_cache_info() -> "_CacheInfo":
+        """
+        Statistics of the serialized filter cache shared by all drivers in the process
+
+        Args:
+            N/A
+
+        Returns:
+            _CacheInfo: hits, misses, maxsize and currsize of the cache
+
+        Raises:
+            N/A
+
+        """
+        return NetconfBaseDriver._serialize_filter_element.cache_info()  # pylint: disable=E1120
+
+    @staticmethod
+    def filter_cache_clear() -> None:
+        """
+        Clear the serialized filter cache shared by all drivers in the process
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        NetconfBaseDriver._serialize_filter_element.cache_clear()  # pylint: disable=E1120
+
     def _build_with_defaults(self, default_type: str = "report-all") -> _Element:
         """
         Create with-defaults element for a given operation
@@ -521,9 +984,8 @@ class NetconfBaseDriver(BaseDriver):
         """
 
         if default_type in ["report-all", "trim", "explicit", "report-all-tagged"]:
-            if not any(
-                "urn:ietf:params:netconf:capability:with-defaults:1.0" in sc
-                for sc in self.server_capabilities
+            if not self.server_capabilities.has_capability(
+                "urn:ietf:params:netconf:capability:with-defaults:1.0"
             ):
                 msg = "with-defaults requested, but is not supported by the server"
                 self.logger.exception(msg)
@@ -556,78 +1018,353 @@ class NetconfBaseDriver(BaseDriver):
         channel_input: bytes = etree.tostring(
             element_or_tree=xml_request, xml_declaration=True, encoding="utf-8"
         )
+        return self._frame_channel_input(request=channel_input)
 
-        if self.netconf_version == NetconfVersion.VERSION_1_0:
-            channel_input = channel_input + b"]]>]]>"
-        else:
-            # format message for chunk (netconf 1.1) style message
-            channel_input = b"#%b\n" % str(len(channel_input)).encode() + channel_input + b"\n##"
-
-        return channel_input
-
-    def _pre_get(self, filter_: str, filter_type: str = "subtree") -> NetconfResponse:
+    def _frame_channel_input(self, request: bytes) -> bytes:
         """
-        Handle pre "get" tasks for consistency between sync/async versions
-
-        *NOTE*
-        The channel input (filter_) is loaded up as an lxml etree element here, this is done with a
-        parser that removes whitespace. This has a somewhat undesirable effect of making any
-        "pretty" input not pretty, however... after we load the xml object (which we do to validate
-        that it is valid xml) we dump that xml object back to a string to be used as the actual
-        raw payload we send down the channel, which means we are sending "flattened" (not pretty/
-        indented xml) to the device. This is important it seems! Some devices seme to not mind
-        having the "nicely" formatted input (pretty xml). But! On devices that "echo" the inputs
-        back -- sometimes the device will respond to our rpc without "finishing" echoing our inputs
-        to the device, this breaks the core "read until input" processing that scrapli always does.
-        For whatever reason if there are no line breaks this does not seem to happen? /shrug. Note
-        that this comment applies to all of the "pre" methods that we parse a filter/payload!
+        Frame a serialized request for the current netconf version
 
         Args:
-            filter_: string filter to apply to the get
-            filter_type: type of filter; subtree|xpath
+            request: serialized request, including the xml declaration
 
         Returns:
-            NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
-                channel inputs (string and xml)
+            bytes: finalized bytes input -- with 1.0 delimiter or 1.1 encoding
 
         Raises:
             N/A
 
         """
-        self.logger.debug(
-            f"Building payload for 'get' operation. filter_type: {filter_type}, filter_: {filter_}"
-        )
+        if self.netconf_version == NetconfVersion.VERSION_1_0:
+            return request + b"]]>]]>"
 
-        # build base request and insert the get element
-        xml_request = self._build_base_elem()
-        xml_get_element = etree.fromstring(NetconfBaseOperations.GET.value)
-        xml_request.insert(0, xml_get_element)
+        # format message for chunk (netconf 1.1) style message
+        return b"#%d\n%b\n##" % (len(request), request)
 
-        # build filter element
-        xml_filter_elem = self._build_filter(filter_=filter_, filter_type=filter_type)
+    def _build_request(
+        self, operation: Optional[bytes], xml_operation: Callable[[_Element], None]
+    ) -> Tuple[bytes, Union[_Element, Callable[[], _Element]]]:
+        """
+        Build the finalized channel input for an operation, using the next message id
+
+        The serialized operation is spliced into the rpc envelope as bytes, giving exactly the same
+        channel input as inserting the operation element into `_build_base_elem` and finalizing
+        that, but without parsing and serializing the envelope (and operation) every time. If the
+        operation could not be serialized up front (see `_fill_template`) the request element is
+        built the long way round with `xml_operation` instead.
+
+        Args:
+            operation: serialized operation element, i.e. `<lock><target><running/></target></lock>`
+                or None if it must be built from `xml_operation`
+            xml_operation: function inserting the lxml element of the operation into the (otherwise
+                empty) lxml element of the request
+
+        Returns:
+            Tuple[bytes, Union[_Element, Callable[[], _Element]]]: finalized bytes input, and the
+                lxml element of the request -- or a function building it, so that it is only built
+                if it is needed
+
+        Raises:
+            N/A
+
+        """
+        if operation is None:
+            xml_request = self._build_base_elem()
+            xml_operation(xml_request)
+            return self._finalize_channel_input(xml_request=xml_request), xml_request
+
+        message_id = self.message_id
+        self.logger.debug("Building request for message id %s", message_id)
+        self.message_id += 1  # pylint: disable=W0201
+
+        request = NetconfBaseOperationTemplates.RPC.value % (str(message_id).encode(), operation)
+        return (
+            self._frame_channel_input(request=request),
+            partial(self._build_xml_request, message_id=message_id, operation=operation),
+        )
+
+    def _build_request_stream(
+        self, operation: Iterable[bytes]
+    ) -> Tuple[Iterator[bytes], Callable[[], _Element]]:
+        """
+        Build the finalized channel input for a streamed operation, using the next message id
+
+        The rpc envelope is wrapped around the parts of the operation and the whole lot is framed
+        as the parts are consumed, so the serialized operation is never held in memory -- for 1.1
+        sessions it is sent as many chunks rather than the single chunk other requests are sent as.
+
+        Args:
+            operation: parts of the serialized operation element(s)
+
+        Returns:
+            Tuple[Iterator[bytes], Callable[[], _Element]]: framed parts of the finalized channel
+                input, and a callable building the (operation-less) lxml element of the request
+
+        Raises:
+            N/A
+
+        """
+        message_id = self.message_id
+        self.logger.debug("Building streamed request for message id %s", message_id)
+        self.message_id += 1  # pylint: disable=W0201
+
+        rpc_start, _, rpc_end = NetconfBaseOperationTemplates.RPC.value.rpartition(b"%b")
+        parts = chain((rpc_start % str(message_id).encode(),), operation, (rpc_end,))
+        return (
+            encode_message(parts=parts, netconf_version=self.netconf_version),
+            partial(
+                etree.fromstring, NetconfBaseOperations.RPC.value.format(message_id=message_id)
+            ),
+        )
+
+    @staticmethod
+    def _build_xml_request(message_id: int, operation: bytes) -> _Element:
+        """
+        Build the lxml element of a request built with `_build_request`
 
-        # insert filter element into parent get element
-        get_element = xml_request.find("get")
-        get_element.insert(0, xml_filter_elem)
+        Operations with input that was not parsed (see `input_validation`) may have several root
+        elements -- or, if trusted, not be well-formed at all -- so the operation is parsed as the
+        children of a tmp element with a recovering parser rather than on its own.
+
+        Args:
+            message_id: message id of the request
+            operation: serialized operation element(s)
+
+        Returns:
+            _Element: lxml element of the request
+
+        Raises:
+            N/A
+
+        """
+        xml_request = etree.fromstring(
+            NetconfBaseOperations.RPC.value.format(message_id=message_id)
+        )
+        tmp_xml_operation = etree.fromstring(b"<tmp>%b</tmp>" % operation, parser=STANDARD_PARSER)
+        if tmp_xml_operation is not None:
+            xml_request.extend(tmp_xml_operation)
+        return xml_request
+
+    @staticmethod
+    def _insert_operation_element(
+        xml_request: _Element,
+        operation: NetconfBaseOperations,
+        parser: Optional[etree.XMLParser] = None,
+        children: Sequence[Union[_Element, str, bytes]] = (),
+        **kwargs: Any,
+    ) -> None:
+        """
+        Build the lxml element of an operation from its template and insert it into a request
+
+        Args:
+            xml_request: lxml element of the request
+            operation: operation template
+            parser: parser to parse the template (and any serialized children) with, lxml default
+                parser if not provided
+            children: elements, or serialized elements to parse, to append to the operation element
+                once it is in the request
+            kwargs: values to format the template with
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        xml_operation = etree.fromstring(operation.value.format(**kwargs), parser=parser)
+        xml_request.insert(0, xml_operation)
+        for child in children:
+            xml_operation.append(
+                etree.fromstring(child, parser=parser) if isinstance(child, (str, bytes)) else child
+            )
+
+    @staticmethod
+    def _fill_template(
+        template: NetconfBaseOperationTemplates, *values: Optional[bytes]
+    ) -> Optional[bytes]:
+        """
+        Fill an operation template with serialized values
 
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
+        Args:
+            template: operation template
+            values: serialized values to fill the template with, in order
+
+        Returns:
+            Optional[bytes]: serialized operation, None if any of the values could not be
+                serialized up front
+
+        Raises:
+            N/A
+
+        """
+        if None in values:
+            return None
+        return template.value % values
+
+    @staticmethod
+    def _join_serialized(values: Sequence[Optional[bytes]]) -> Optional[bytes]:
+        """
+        Join serialized sibling elements
+
+        Args:
+            values: serialized elements
+
+        Returns:
+            Optional[bytes]: joined elements, None if any of them could not be serialized up front
+
+        Raises:
+            N/A
+
+        """
+        joined = b""
+        for value in values:
+            if value is None:
+                return None
+            joined += value
+        return joined
+
+    @staticmethod
+    def _build_datastore(datastore: str) -> Optional[bytes]:
+        """
+        Serialize the (empty) element naming a datastore
+
+        Args:
+            datastore: name of the datastore, typically one of running|startup|candidate
+
+        Returns:
+            Optional[bytes]: serialized datastore element, i.e. `<running/>`, None if the name is
+                not a plain element name
+
+        Raises:
+            N/A
+
+        """
+        if SIMPLE_ELEMENT_NAME.fullmatch(datastore):
+            return NetconfBaseOperationTemplates.DATASTORE.value % datastore.encode()
+        return None
+
+    @staticmethod
+    def _build_text(value: Union[int, str]) -> Optional[bytes]:
+        """
+        Serialize a value as element text content
+
+        Args:
+            value: value of the element
+
+        Returns:
+            Optional[bytes]: serialized text content, None if the value is not plain text
+
+        Raises:
+            N/A
+
+        """
+        text = str(value)
+        if SIMPLE_TEXT.fullmatch(text):
+            return text.encode()
+        return None
+
+    @staticmethod
+    def _serialize_element(xml_element: _Element) -> Optional[bytes]:
+        """
+        Serialize an element (and its tail) to splice into a request
+
+        Args:
+            xml_element: lxml element to serialize
+
+        Returns:
+            Optional[bytes]: serialized element, None if it uses the netconf base namespace
+
+        Raises:
+            N/A
+
+        """
+        serialized_element: bytes = etree.tostring(
+            xml_element, encoding="utf-8", xml_declaration=False
+        )
+        if NETCONF_BASE_NAMESPACE in serialized_element:
+            return None
+        return serialized_element
+
+    def _pre_get(
+        self, filter_: str, filter_type: str = "subtree", input_validation: Optional[str] = None
+    ) -> NetconfResponse:
+        """
+        Handle pre "get" tasks for consistency between sync/async versions
+
+        *NOTE*
+        The channel input (filter_) is loaded up as an lxml etree element here, this is done with a
+        parser that removes whitespace. This has a somewhat undesirable effect of making any
+        "pretty" input not pretty, however... after we load the xml object (which we do to validate
+        that it is valid xml) we dump that xml object back to a string to be used as the actual
+        raw payload we send down the channel, which means we are sending "flattened" (not pretty/
+        indented xml) to the device. This is important it seems! Some devices seme to not mind
+        having the "nicely" formatted input (pretty xml). But! On devices that "echo" the inputs
+        back -- sometimes the device will respond to our rpc without "finishing" echoing our inputs
+        to the device, this breaks the core "read until input" processing that scrapli always does.
+        For whatever reason if there are no line breaks this does not seem to happen? /shrug. Note
+        that this comment applies to all of the "pre" methods that we parse a filter/payload!
+        Input that is not parsed (see `input_validation`) is sent exactly as provided, so should be
+        flattened already.
+
+        Args:
+            filter_: string filter to apply to the get
+            filter_type: type of filter; subtree|xpath
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
+                channel inputs (string and xml)
+
+        Raises:
+            N/A
+
+        """
+        self.logger.debug(
+            "Building payload for 'get' operation. filter_type: %s, filter_: %s",
+            filter_type,
+            filter_,
+        )
+
+        xml_filter = self._serialize_filter(
+            filter_=filter_,
+            filter_type=filter_type,
+            input_validation=self._resolve_input_validation(input_validation=input_validation),
+        )
+
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(NetconfBaseOperationTemplates.GET, xml_filter),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.GET,
+                children=[
+                    (
+                        xml_filter
+                        if xml_filter is not None
+                        else self._build_filter(filter_=filter_, filter_type=filter_type)
+                    )
+                ],
+            ),
+        )
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(f"Built payload for 'get' operation. Payload: {channel_input.decode()}")
+        self.logger.debug("Built payload for 'get' operation. Payload: %r", channel_input)
         return response
 
-    def _pre_get_config(
+    def _pre_get_config(  # pylint: disable=R0917
         self,
         source: str = "running",
         filter_: Optional[str] = None,
         filter_type: str = "subtree",
         default_type: Optional[str] = None,
+        input_validation: Optional[str] = None,
     ) -> NetconfResponse:
         """
         Handle pre "get_config" tasks for consistency between sync/async versions
@@ -637,6 +1374,8 @@ class NetconfBaseDriver(BaseDriver):
             filter_: string of filter(s) to apply to configuration
             filter_type: type of filter; subtree|xpath
             default_type: string of with-default mode to apply when retrieving configuration
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
@@ -647,51 +1386,74 @@ class NetconfBaseDriver(BaseDriver):
 
         """
         self.logger.debug(
-            f"Building payload for 'get-config' operation. source: {source}, filter_type: "
-            f"{filter_type}, filter: {filter_}, default_type: {default_type}"
+            "Building payload for 'get-config' operation. source: %s, filter_type: %s, filter: %s, "
+            "default_type: %s",
+            source,
+            filter_type,
+            filter_,
+            default_type,
         )
         self._validate_get_config_target(source=source)
 
-        # build base request and insert the get-config element
-        xml_request = self._build_base_elem()
-        xml_get_config_element = etree.fromstring(
-            NetconfBaseOperations.GET_CONFIG.value.format(source=source), parser=self.xml_parser
-        )
-        xml_request.insert(0, xml_get_config_element)
+        serialized_children = []
+        xml_children: List[Union[_Element, bytes]] = []
 
         if filter_ is not None:
-            xml_filter_elem = self._build_filter(filter_=filter_, filter_type=filter_type)
-            # insert filter element into parent get element
-            get_element = xml_request.find("get-config")
-            # insert *after* source, otherwise juniper seems to gripe, maybe/probably others as well
-            get_element.insert(1, xml_filter_elem)
+            # filter goes *after* source, otherwise juniper seems to gripe, maybe/probably others
+            xml_filter = self._serialize_filter(
+                filter_=filter_,
+                filter_type=filter_type,
+                input_validation=self._resolve_input_validation(input_validation=input_validation),
+            )
+            serialized_children.append(xml_filter)
+            xml_children.append(
+                xml_filter
+                if xml_filter is not None
+                else self._build_filter(filter_=filter_, filter_type=filter_type)
+            )
 
         if default_type is not None:
-            xml_with_defaults_elem = self._build_with_defaults(default_type=default_type)
-            get_element = xml_request.find("get-config")
-            get_element.insert(2, xml_with_defaults_elem)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
+            xml_with_defaults = self._build_with_defaults(default_type=default_type)
+            serialized_children.append(self._serialize_element(xml_element=xml_with_defaults))
+            xml_children.append(xml_with_defaults)
+
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.GET_CONFIG,
+                self._build_datastore(datastore=source),
+                self._join_serialized(values=serialized_children),
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.GET_CONFIG,
+                parser=self.xml_parser,
+                children=xml_children,
+                source=source,
+            ),
+        )
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'get-config' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'get-config' operation. Payload: %r", channel_input)
         return response
 
-    def _pre_edit_config(self, config: str, target: str = "running") -> NetconfResponse:
+    def _pre_edit_config(
+        self, config: str, target: str = "running", input_validation: Optional[str] = None
+    ) -> NetconfResponse:
         """
         Handle pre "edit_config" tasks for consistency between sync/async versions
 
         Args:
             config: configuration to send to device
             target: configuration source to target; running|startup|candidate
+            input_validation: how to validate the config; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
@@ -702,37 +1464,110 @@ class NetconfBaseDriver(BaseDriver):
 
         """
         self.logger.debug(
-            f"Building payload for 'edit-config' operation. target: {target}, config: {config}"
+            "Building payload for 'edit-config' operation. target: %s, config: %s", target, config
         )
         self._validate_edit_config_target(target=target)
 
-        xml_config = etree.fromstring(config, parser=self.xml_parser)
+        _input_validation = self._resolve_input_validation(input_validation=input_validation)
+        xml_config: Union[_Element, str]
+        if _input_validation == InputValidation.PARSE:
+            xml_config = etree.fromstring(config, parser=self.xml_parser)
+            serialized_config = self._serialize_element(xml_element=xml_config)
+        else:
+            xml_config = config
+            serialized_config = self._splice_input(
+                xml_input=config, input_validation=_input_validation
+            )
 
-        # build base request and insert the edit-config element
-        xml_request = self._build_base_elem()
-        xml_edit_config_element = etree.fromstring(
-            NetconfBaseOperations.EDIT_CONFIG.value.format(target=target)
+        # config goes after target just for nice output/readability
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.EDIT_CONFIG,
+                self._build_datastore(datastore=target),
+                serialized_config,
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.EDIT_CONFIG,
+                children=[xml_config],
+                target=target,
+            ),
         )
-        xml_request.insert(0, xml_edit_config_element)
-
-        # insert parent filter element to first position so that target stays first just for nice
-        # output/readability
-        edit_config_element = xml_request.find("edit-config")
-        edit_config_element.insert(1, xml_config)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
+        self.logger.debug("Built payload for 'edit-config' operation. Payload: %r", channel_input)
+        return response
+
+    def _pre_edit_config_from(
+        self, config: XmlSource, target: str = "running", input_validation: Optional[str] = None
+    ) -> Tuple[NetconfResponse, Iterator[bytes]]:
+        """
+        Handle pre "edit_config_from" tasks for consistency between sync/async versions
+
+        Paths and seekable file objects are checked to be well-formed here, other sources as the
+        returned channel input is consumed; trusted configs are not checked at all. The config is
+        never parsed into a tree, so "parse" validation is the same as "check" here.
+
+        Args:
+            config: path to a file, file object opened in binary mode, or iterable of bytes of the
+                configuration to send to device
+            target: configuration source to target; running|startup|candidate
+            input_validation: how to validate the config; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Returns:
+            Tuple[NetconfResponse, Iterator[bytes]]: scrapli_netconf NetconfResponse object -- as
+                the request is never held in memory its channel input is empty and its xml input
+                holds only the rpc element -- and framed parts of the channel input to send
+
+        Raises:
+            N/A
+
+        """
         self.logger.debug(
-            f"Built payload for 'edit-config' operation. Payload: {channel_input.decode()}"
+            "Building payload for 'edit-config' operation from stream. target: %s", target
         )
-        return response
+        self._validate_edit_config_target(target=target)
+
+        datastore = self._build_datastore(datastore=target)
+        if datastore is None:
+            datastore = etree.tostring(etree.fromstring(f"<{target}/>", parser=self.xml_parser))
+
+        if (
+            self._resolve_input_validation(input_validation=input_validation)
+            == InputValidation.TRUST
+        ):
+            config_parts = iter_xml_source(source=config)
+        else:
+            config_parts = iter_well_formed_xml_source(source=config)
+
+        edit_config_start, _, edit_config_end = (
+            NetconfBaseOperationTemplates.EDIT_CONFIG.value % (datastore, b"%b")
+        ).rpartition(b"%b")
+        channel_input, xml_request = self._build_request_stream(
+            operation=chain(
+                (edit_config_start,),
+                strip_xml_declaration(config_parts),
+                (edit_config_end,),
+            )
+        )
+
+        response = NetconfResponse(
+            host=self.host,
+            channel_input=b"",
+            xml_input=xml_request,
+            netconf_version=self.netconf_version,
+            strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
+        )
+        return response, channel_input
 
     def _pre_delete_config(self, target: str = "running") -> NetconfResponse:
         """
@@ -749,27 +1584,30 @@ class NetconfBaseDriver(BaseDriver):
             N/A
 
         """
-        self.logger.debug(f"Building payload for 'delete-config' operation. target: {target}")
+        self.logger.debug("Building payload for 'delete-config' operation. target: %s", target)
         self._validate_delete_config_target(target=target)
 
-        xml_request = self._build_base_elem()
-        xml_validate_element = etree.fromstring(
-            NetconfBaseOperations.DELETE_CONFIG.value.format(target=target), parser=self.xml_parser
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.DELETE_CONFIG, self._build_datastore(datastore=target)
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.DELETE_CONFIG,
+                parser=self.xml_parser,
+                target=target,
+            ),
         )
-        xml_request.insert(0, xml_validate_element)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'delete-config' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'delete-config' operation. Payload: %r", channel_input)
         return response
 
     def _pre_commit(
@@ -801,10 +1639,6 @@ class NetconfBaseDriver(BaseDriver):
 
         """
         self.logger.debug("Building payload for 'commit' operation")
-        xml_request = self._build_base_elem()
-        xml_commit_element = etree.fromstring(
-            NetconfBaseOperations.COMMIT.value, parser=self.xml_parser
-        )
 
         if persist and persist_id:
             raise ScrapliValueError(
@@ -827,47 +1661,73 @@ class NetconfBaseDriver(BaseDriver):
                 self.logger.exception(msg)
                 raise CapabilityNotSupported(msg)
 
+        # serialized children of the commit element, and the templates they are built from
+        commit_children: List[Optional[bytes]] = []
+        xml_commit_children: List[str] = []
+
         if confirmed:
-            xml_confirmed_element = etree.fromstring(
-                NetconfBaseOperations.COMMIT_CONFIRMED.value, parser=self.xml_parser
-            )
-            xml_commit_element.append(xml_confirmed_element)
+            commit_children.append(NetconfBaseOperationTemplates.COMMIT_CONFIRMED.value)
+            xml_commit_children.append(NetconfBaseOperations.COMMIT_CONFIRMED.value)
 
             if timeout is not None:
-                xml_timeout_element = etree.fromstring(
-                    NetconfBaseOperations.COMMIT_CONFIRMED_TIMEOUT.value.format(timeout=timeout),
-                    parser=self.xml_parser,
+                commit_children.append(
+                    self._fill_template(
+                        NetconfBaseOperationTemplates.COMMIT_CONFIRMED_TIMEOUT,
+                        self._build_text(value=timeout),
+                    )
+                )
+                xml_commit_children.append(
+                    NetconfBaseOperations.COMMIT_CONFIRMED_TIMEOUT.value.format(timeout=timeout)
                 )
-                xml_commit_element.append(xml_timeout_element)
 
             if persist is not None:
-                xml_persist_element = etree.fromstring(
-                    NetconfBaseOperations.COMMIT_CONFIRMED_PERSIST.value.format(persist=persist),
-                    parser=self.xml_parser,
+                commit_children.append(
+                    self._fill_template(
+                        NetconfBaseOperationTemplates.COMMIT_CONFIRMED_PERSIST,
+                        self._build_text(value=persist),
+                    )
+                )
+                xml_commit_children.append(
+                    NetconfBaseOperations.COMMIT_CONFIRMED_PERSIST.value.format(persist=persist)
                 )
-                xml_commit_element.append(xml_persist_element)
 
         if persist_id is not None:
-            xml_persist_id_element = etree.fromstring(
-                NetconfBaseOperations.COMMIT_PERSIST_ID.value.format(persist_id=persist_id),
-                parser=self.xml_parser,
+            commit_children.append(
+                self._fill_template(
+                    NetconfBaseOperationTemplates.COMMIT_PERSIST_ID,
+                    self._build_text(value=persist_id),
+                )
+            )
+            xml_commit_children.append(
+                NetconfBaseOperations.COMMIT_PERSIST_ID.value.format(persist_id=persist_id)
             )
-            xml_commit_element.append(xml_persist_id_element)
 
-        xml_request.insert(0, xml_commit_element)
+        xml_commit: Optional[bytes] = NetconfBaseOperationTemplates.COMMIT.value
+        if commit_children:
+            xml_commit = self._fill_template(
+                NetconfBaseOperationTemplates.COMMIT_WITH_CHILDREN,
+                self._join_serialized(values=commit_children),
+            )
 
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
+        channel_input, xml_request = self._build_request(
+            operation=xml_commit,
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.COMMIT,
+                parser=self.xml_parser,
+                children=xml_commit_children,
+            ),
+        )
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'commit' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'commit' operation. Payload: %r", channel_input)
         return response
 
     def _pre_discard(self) -> NetconfResponse:
@@ -886,24 +1746,24 @@ class NetconfBaseDriver(BaseDriver):
 
         """
         self.logger.debug("Building payload for 'discard' operation.")
-        xml_request = self._build_base_elem()
-        xml_commit_element = etree.fromstring(
-            NetconfBaseOperations.DISCARD.value, parser=self.xml_parser
+        channel_input, xml_request = self._build_request(
+            operation=NetconfBaseOperationTemplates.DISCARD.value,
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.DISCARD,
+                parser=self.xml_parser,
+            ),
         )
-        xml_request.insert(0, xml_commit_element)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'discard' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'discard' operation. Payload: %r", channel_input)
         return response
 
     def _pre_lock(self, target: str) -> NetconfResponse:
@@ -924,22 +1784,27 @@ class NetconfBaseDriver(BaseDriver):
         self.logger.debug("Building payload for 'lock' operation.")
         self._validate_edit_config_target(target=target)
 
-        xml_request = self._build_base_elem()
-        xml_lock_element = etree.fromstring(
-            NetconfBaseOperations.LOCK.value.format(target=target), parser=self.xml_parser
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.LOCK, self._build_datastore(datastore=target)
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.LOCK,
+                parser=self.xml_parser,
+                target=target,
+            ),
         )
-        xml_request.insert(0, xml_lock_element)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(f"Built payload for 'lock' operation. Payload: {channel_input.decode()}")
+        self.logger.debug("Built payload for 'lock' operation. Payload: %r", channel_input)
         return response
 
     def _pre_unlock(self, target: str) -> NetconfResponse:
@@ -960,32 +1825,39 @@ class NetconfBaseDriver(BaseDriver):
         self.logger.debug("Building payload for 'unlock' operation.")
         self._validate_edit_config_target(target=target)
 
-        xml_request = self._build_base_elem()
-        xml_lock_element = etree.fromstring(
-            NetconfBaseOperations.UNLOCK.value.format(target=target), parser=self.xml_parser
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.UNLOCK, self._build_datastore(datastore=target)
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.UNLOCK,
+                parser=self.xml_parser,
+                target=target,
+            ),
         )
-        xml_request.insert(0, xml_lock_element)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'unlock' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'unlock' operation. Payload: %r", channel_input)
         return response
 
-    def _pre_rpc(self, filter_: Union[str, _Element]) -> NetconfResponse:
+    def _pre_rpc(
+        self, filter_: Union[str, _Element], input_validation: Optional[str] = None
+    ) -> NetconfResponse:
         """
         Handle pre "rpc" tasks for consistency between sync/async versions
 
         Args:
             filter_: filter/rpc to execute
+            input_validation: how to validate a string filter/rpc; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
@@ -996,28 +1868,74 @@ class NetconfBaseDriver(BaseDriver):
 
         """
         self.logger.debug("Building payload for 'rpc' operation.")
-        xml_request = self._build_base_elem()
 
-        # build filter element
-        if isinstance(filter_, str):
+        xml_request: Union[_Element, Callable[[], _Element]]
+
+        _input_validation = self._resolve_input_validation(input_validation=input_validation)
+
+        if isinstance(filter_, str) and _input_validation != InputValidation.PARSE:
+            # spliced input is never None, so `xml_operation` is never called
+            channel_input, xml_request = self._build_request(
+                operation=self._splice_input(xml_input=filter_, input_validation=_input_validation),
+                xml_operation=lambda xml_request: None,
+            )
+        elif isinstance(filter_, str):
             xml_filter_elem = etree.fromstring(filter_, parser=self.xml_parser)
+            channel_input, xml_request = self._build_request(
+                operation=self._serialize_element(xml_element=xml_filter_elem),
+                xml_operation=lambda xml_request: xml_request.insert(0, xml_filter_elem),
+            )
         else:
-            xml_filter_elem = filter_
+            # the provided element becomes part of the request element, as it always has
+            xml_request = self._build_base_elem()
+            xml_request.insert(0, filter_)
+            channel_input = self._finalize_channel_input(xml_request=xml_request)
+
+        response = NetconfResponse(
+            host=self.host,
+            channel_input=channel_input,
+            xml_input=xml_request,
+            netconf_version=self.netconf_version,
+            strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
+        )
+        self.logger.debug("Built payload for 'rpc' operation. Payload: %r", channel_input)
+        return response
 
-        # insert filter element
-        xml_request.insert(0, xml_filter_elem)
+    def _pre_rpc_from(self, operation: XmlSource) -> Tuple[NetconfResponse, Iterator[bytes]]:
+        """
+        Handle pre "rpc_from" tasks for consistency between sync/async versions
 
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
+        The operation is not read here, only once the returned channel input is consumed.
+
+        Args:
+            operation: path to a file, file object opened in binary mode, or iterable of bytes of
+                the serialized operation element(s) to execute
+
+        Returns:
+            Tuple[NetconfResponse, Iterator[bytes]]: scrapli_netconf NetconfResponse object -- as
+                the request is never held in memory its channel input is empty and its xml input
+                holds only the rpc element -- and framed parts of the channel input to send
+
+        Raises:
+            N/A
+
+        """
+        self.logger.debug("Building payload for 'rpc' operation from stream.")
+
+        channel_input, xml_request = self._build_request_stream(
+            operation=iter_xml_source(source=operation)
+        )
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=b"",
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(f"Built payload for 'rpc' operation. Payload: {channel_input.decode()}")
-        return response
+        return response, channel_input
 
     def _pre_validate(self, source: str) -> NetconfResponse:
         """
@@ -1049,24 +1967,27 @@ class NetconfBaseDriver(BaseDriver):
 
         self._validate_edit_config_target(target=source)
 
-        xml_request = self._build_base_elem()
-        xml_validate_element = etree.fromstring(
-            NetconfBaseOperations.VALIDATE.value.format(source=source), parser=self.xml_parser
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.VALIDATE, self._build_datastore(datastore=source)
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.VALIDATE,
+                parser=self.xml_parser,
+                source=source,
+            ),
         )
-        xml_request.insert(0, xml_validate_element)
-
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
-        self.logger.debug(
-            f"Built payload for 'validate' operation. Payload: {channel_input.decode()}"
-        )
+        self.logger.debug("Built payload for 'validate' operation. Payload: %r", channel_input)
         return response
 
     def _pre_copy_config(self, source: str, target: str) -> NetconfResponse:
@@ -1092,23 +2013,454 @@ class NetconfBaseDriver(BaseDriver):
 
         self._validate_edit_config_target(target=target)
 
-        xml_request = self._build_base_elem()
-        xml_validate_element = etree.fromstring(
-            NetconfBaseOperations.COPY_CONFIG.value.format(source=source, target=target),
-            parser=self.xml_parser,
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.COPY_CONFIG,
+                self._build_datastore(datastore=target),
+                self._build_datastore(datastore=source),
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.COPY_CONFIG,
+                parser=self.xml_parser,
+                source=source,
+                target=target,
+            ),
+        )
+
+        response = NetconfResponse(
+            host=self.host,
+            channel_input=channel_input,
+            xml_input=xml_request,
+            netconf_version=self.netconf_version,
+            strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
+        )
+        self.logger.debug("Built payload for 'copy-config' operation. Payload: %r", channel_input)
+        return response
+
+    def _pre_get_schema(
+        self, identifier: str, version: Optional[str] = None, format_: str = "yang"
+    ) -> NetconfResponse:
+        """
+        Handle pre "get_schema" tasks for consistency between sync/async versions
+
+        Args:
+            identifier: name of the schema, i.e. the name of the yang module
+            version: version of the schema, i.e. the revision of the yang module, the server picks
+                one if not provided
+            format_: format of the schema; typically one of yang|yin|xsd
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
+                channel inputs (string and xml)
+
+        Raises:
+            CapabilityNotSupported: if the server does not support ietf-netconf-monitoring
+
+        """
+        self.logger.debug("Building payload for 'get_schema' operation.")
+
+        # servers with a yang library need not list ietf-netconf-monitoring in their hello
+        if not (
+            self.server_capabilities.supports_module("ietf-netconf-monitoring")
+            or self._uses_yang_library()
+        ):
+            msg = "get-schema requested, but ietf-netconf-monitoring is not supported by the server"
+            self.logger.exception(msg)
+            raise CapabilityNotSupported(msg)
+
+        # serialized children of the get-schema element, and their tags and text
+        get_schema_children: List[Optional[bytes]] = []
+        xml_get_schema_children: List[_Element] = []
+
+        for template, tag, value in (
+            (NetconfBaseOperationTemplates.GET_SCHEMA_IDENTIFIER, "identifier", identifier),
+            (NetconfBaseOperationTemplates.GET_SCHEMA_VERSION, "version", version),
+            (NetconfBaseOperationTemplates.GET_SCHEMA_FORMAT, "format", format_),
+        ):
+            if value is None:
+                continue
+            get_schema_children.append(self._fill_template(template, self._build_text(value=value)))
+            xml_child = etree.Element(f"{{{NETCONF_MONITORING_NAMESPACE}}}{tag}")
+            xml_child.text = value
+            xml_get_schema_children.append(xml_child)
+
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.GET_SCHEMA,
+                self._join_serialized(values=get_schema_children),
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.GET_SCHEMA,
+                parser=self.xml_parser,
+                children=xml_get_schema_children,
+            ),
+        )
+
+        response = NetconfResponse(
+            host=self.host,
+            channel_input=channel_input,
+            xml_input=xml_request,
+            netconf_version=self.netconf_version,
+            strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
+        )
+        self.logger.debug("Built payload for 'get_schema' operation. Payload: %r", channel_input)
+        return response
+
+    @staticmethod
+    def _extract_schema(response: NetconfResponse) -> Optional[str]:
+        """
+        Extract the schema from the reply to a get-schema operation
+
+        Args:
+            response: NetconfResponse of the get-schema operation
+
+        Returns:
+            Optional[str]: the schema, None if the reply failed or does not contain one
+
+        Raises:
+            N/A
+
+        """
+        if response.failed or response.xml_result is None:
+            return None
+        xml_data = response.xml_result.find("{*}data")
+        if xml_data is None:
+            return None
+        schema: Optional[str] = xml_data.text
+        return schema
+
+    @staticmethod
+    def _determine_schema_cache(schema_cache: Union[str, SchemaCache]) -> SchemaCache:
+        """
+        Determine the schema cache to sync schemas into
+
+        Args:
+            schema_cache: directory to cache schemas in, or a SchemaCache
+
+        Returns:
+            SchemaCache: schema cache to use
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(schema_cache, str):
+            return SchemaCache(path=schema_cache)
+        return schema_cache
+
+    def _uses_yang_library(self) -> bool:
+        """
+        Determine if the modules of the server are to be read from its yang library
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if the server advertises the yang library capability
+
+        Raises:
+            N/A
+
+        """
+        return self._yang_library_filter() is not None
+
+    def _yang_library_filter(self) -> Optional[str]:
+        """
+        Determine the filter to get the modules of the server from its yang library with
+
+        Args:
+            N/A
+
+        Returns:
+            Optional[str]: filter for the yang library version the server advertises, None if it
+                does not advertise a yang library
+
+        Raises:
+            N/A
+
+        """
+        yang_library_1_0, yang_library_1_1 = YANG_LIBRARY_CAPABILITIES
+        if self.server_capabilities.has_capability(yang_library_1_1):
+            return YANG_LIBRARY_1_1_FILTER
+        if self.server_capabilities.has_capability(yang_library_1_0):
+            return YANG_LIBRARY_FILTER
+        return None
+
+    def _pre_sync_schemas(
+        self,
+        schema_cache: SchemaCache,
+        modules: Optional[Iterable[str]],
+        yang_library: Optional[NetconfResponse],
+    ) -> List[List[Tuple[str, Optional[str]]]]:
+        """
+        Handle pre "sync_schemas" tasks for consistency between sync/async versions
+
+        The modules (and submodules) of the server are read from the reply to a get of its yang
+        library, if there is one and it lists any, otherwise from the capabilities it advertised.
+        Schemas without a revision can not be told apart from other revisions of the same module,
+        so are always fetched (and not cached).
+
+        Args:
+            schema_cache: schema cache to sync into
+            modules: names of the modules to sync, all modules of the server if not provided
+            yang_library: NetconfResponse of a get of the yang library of the server, if any
+
+        Returns:
+            List[List[Tuple[str, Optional[str]]]]: batches of names and revisions of the modules
+                whose schemas are not cached
+
+        Raises:
+            N/A
+
+        """
+        module_names = None if modules is None else set(modules)
+
+        module_revisions: Dict[Tuple[str, Optional[str]], None] = {}
+        if (
+            yang_library is not None
+            and not yang_library.failed
+            and yang_library.xml_result is not None
+        ):
+            for xml_module in yang_library.xml_result.iter(
+                "{*}module", "{*}submodule", "{*}import-only-module"
+            ):
+                name = xml_module.findtext("{*}name")
+                if name:
+                    module_revisions[(name, xml_module.findtext("{*}revision") or None)] = None
+
+        if not module_revisions:
+            if yang_library is not None:
+                self.logger.debug("no modules found in yang library, using server capabilities")
+            for module in self.server_capabilities.modules.values():
+                module_revisions[(module.name, module.revision)] = None
+
+        missing = [
+            (name, revision)
+            for name, revision in module_revisions
+            if (module_names is None or name in module_names)
+            and (revision is None or not schema_cache.has(name=name, revision=revision))
+        ]
+        self.logger.debug(
+            "%s of %s schemas are not cached, fetching them", len(missing), len(module_revisions)
         )
-        xml_request.insert(0, xml_validate_element)
 
-        channel_input = self._finalize_channel_input(xml_request=xml_request)
+        return [
+            missing[index : index + SCHEMA_SYNC_BATCH_SIZE]
+            for index in range(0, len(missing), SCHEMA_SYNC_BATCH_SIZE)
+        ]
+
+    def _post_sync_schemas(
+        self,
+        schema_cache: SchemaCache,
+        module_revisions: Sequence[Tuple[str, Optional[str]]],
+        responses: Sequence[NetconfResponse],
+    ) -> Dict[Tuple[str, Optional[str]], NetconfResponse]:
+        """
+        Handle post "sync_schemas" tasks for consistency between sync/async versions
+
+        Args:
+            schema_cache: schema cache to sync into
+            module_revisions: names and revisions of the modules whose schemas were fetched
+            responses: NetconfResponses of the get-schema operations, in the same order
+
+        Returns:
+            Dict[Tuple[str, Optional[str]], NetconfResponse]: the responses by module name and
+                revision
+
+        Raises:
+            N/A
+
+        """
+        for (name, revision), response in zip(module_revisions, responses):
+            schema = self._extract_schema(response=response)
+            if schema is None:
+                self.logger.warning("failed to fetch schema of module '%s@%s'", name, revision)
+            elif revision is not None:
+                schema_cache.store(name=name, revision=revision, schema=schema)
+
+        return dict(zip(module_revisions, responses))
+
+    def _pre_create_subscription(  # pylint: disable=R0917
+        self,
+        stream: Optional[str] = None,
+        filter_: Optional[str] = None,
+        filter_type: str = "subtree",
+        start_time: Optional[str] = None,
+        stop_time: Optional[str] = None,
+        input_validation: Optional[str] = None,
+    ) -> NetconfResponse:
+        """
+        Handle pre "create_subscription" tasks for consistency between sync/async versions
+
+        Args:
+            stream: name of the event stream to subscribe to, the "NETCONF" stream if not provided
+            filter_: string filter selecting the notifications to send
+            filter_type: type of filter; subtree|xpath
+            start_time: date and time to replay notifications from, i.e. `2024-01-01T00:00:00Z`
+            stop_time: date and time to stop sending notifications at, requires start_time
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object containing all the necessary
+                channel inputs (string and xml)
+
+        Raises:
+            CapabilityNotSupported: if the server does not support notifications
+            ScrapliValueError: if stop_time is provided without start_time
+
+        """
+        self.logger.debug("Building payload for 'create_subscription' operation.")
+
+        if not self.server_capabilities.has_capability(NOTIFICATION_CAPABILITY):
+            msg = "create-subscription requested, but notifications are not supported by the server"
+            self.logger.exception(msg)
+            raise CapabilityNotSupported(msg)
+
+        if stop_time is not None and start_time is None:
+            raise ScrapliValueError("'stop_time' can only be used in combination with 'start_time'")
+
+        # serialized children of the create-subscription element, and the elements themselves, in
+        # the order RFC 5277 section 2.1.1 has them in
+        subscription_children: List[Optional[bytes]] = []
+        xml_subscription_children: List[Union[_Element, bytes]] = []
+
+        if stream is not None:
+            subscription_children.append(
+                self._fill_template(
+                    NetconfBaseOperationTemplates.CREATE_SUBSCRIPTION_STREAM,
+                    self._build_text(value=stream),
+                )
+            )
+            xml_subscription_children.append(self._build_notification_element("stream", stream))
+
+        if filter_ is not None:
+            xml_filter = self._serialize_filter(
+                filter_=filter_,
+                filter_type=filter_type,
+                input_validation=self._resolve_input_validation(input_validation=input_validation),
+            )
+            subscription_children.append(xml_filter)
+            xml_subscription_children.append(
+                xml_filter
+                if xml_filter is not None
+                else self._build_filter(filter_=filter_, filter_type=filter_type)
+            )
+
+        for template, tag, value in (
+            (NetconfBaseOperationTemplates.CREATE_SUBSCRIPTION_START_TIME, "startTime", start_time),
+            (NetconfBaseOperationTemplates.CREATE_SUBSCRIPTION_STOP_TIME, "stopTime", stop_time),
+        ):
+            if value is None:
+                continue
+            subscription_children.append(
+                self._fill_template(template, self._build_text(value=value))
+            )
+            xml_subscription_children.append(self._build_notification_element(tag, value))
+
+        channel_input, xml_request = self._build_request(
+            operation=self._fill_template(
+                NetconfBaseOperationTemplates.CREATE_SUBSCRIPTION,
+                self._join_serialized(values=subscription_children),
+            ),
+            xml_operation=partial(
+                self._insert_operation_element,
+                operation=NetconfBaseOperations.CREATE_SUBSCRIPTION,
+                parser=self.xml_parser,
+                children=xml_subscription_children,
+            ),
+        )
 
         response = NetconfResponse(
             host=self.host,
-            channel_input=channel_input.decode(),
+            channel_input=channel_input,
             xml_input=xml_request,
             netconf_version=self.netconf_version,
             strip_namespaces=self.strip_namespaces,
+            build_result=self.build_result,
         )
         self.logger.debug(
-            f"Built payload for 'copy-config' operation. Payload: {channel_input.decode()}"
+            "Built payload for 'create_subscription' operation. Payload: %r", channel_input
         )
         return response
+
+    @staticmethod
+    def _build_notification_element(tag: str, text: str) -> _Element:
+        """
+        Build a child element of the create-subscription element
+
+        Args:
+            tag: tag of the element, without namespace
+            text: text of the element
+
+        Returns:
+            _Element: lxml element in the notification namespace
+
+        Raises:
+            N/A
+
+        """
+        xml_element = etree.Element(f"{{{NETCONF_NOTIFICATION_NAMESPACE}}}{tag}")
+        xml_element.text = text
+        return xml_element
+
+    def _parse_notification(self, notification: bytes) -> Optional[_Element]:
+        """
+        Parse a notification read off the channel, stripping namespaces if so configured
+
+        Args:
+            notification: de-framed notification message
+
+        Returns:
+            Optional[_Element]: lxml element of the notification, None if it could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        xml_notification = parse_notification(
+            notification=notification, strip_namespaces=self.strip_namespaces
+        )
+        if xml_notification is None:
+            self.logger.warning("discarding unparsable notification: %r", notification[:256])
+        return xml_notification
+
+    def _pre_pipeline(
+        self, operations: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[List[NetconfResponse], Dict[str, bytes]]:
+        """
+        Handle pre "pipeline" tasks for consistency between sync/async versions
+
+        Args:
+            operations: sequence of tuples of operation name and the kwargs for that operation
+
+        Returns:
+            Tuple[List[NetconfResponse], Dict[str, bytes]]: responses in the order of the provided
+                operations, and a mapping of their message-ids to channel inputs to send (in the
+                same order)
+
+        Raises:
+            ScrapliValueError: if an operation is not one that can be pipelined
+
+        """
+        responses = []
+        channel_inputs = {}
+
+        for operation, kwargs in operations:
+            if operation not in NETCONF_OPERATIONS:
+                raise ScrapliValueError(
+                    f"operation '{operation}' cannot be pipelined, must be one of "
+                    f"{', '.join(NETCONF_OPERATIONS)}"
+                )
+            # the operation is built with the current message id
+            message_id = str(self.message_id)
+            response = getattr(self, f"_pre_{operation}")(**kwargs)
+            responses.append(response)
+            channel_inputs[message_id] = response.raw_channel_input
+
+        self.logger.debug("Built payloads for %s pipelined operations", len(responses))
+        return responses, channel_inputs
@@ -1,17 +1,25 @@
 """scrapli_netconf.driver.sync_driver"""
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from lxml.etree import _Element
 
 from scrapli import Driver
+from scrapli_netconf.cache import CapabilityCache, SchemaCache
+from scrapli_netconf.capabilities import ServerCapabilities
 from scrapli_netconf.channel.base_channel import NetconfBaseChannelArgs
 from scrapli_netconf.channel.sync_channel import NetconfChannel
 from scrapli_netconf.driver.base_driver import NetconfBaseDriver
-from scrapli_netconf.response import NetconfResponse
+from scrapli_netconf.helper import XmlSource
+from scrapli_netconf.notifications import (
+    NOTIFICATION_QUEUE_SIZE,
+    NotificationStats,
+    is_notification_complete,
+)
+from scrapli_netconf.response import NetconfDataStream, NetconfResponse
 
 
-class NetconfDriver(Driver, NetconfBaseDriver):
+class NetconfDriver(Driver, NetconfBaseDriver):  # pylint: disable=R0904
     # kinda hate this but need to tell mypy that channel in netconf land is in fact a channel of
     # type `NetconfChannel`
     channel: NetconfChannel
@@ -44,6 +52,9 @@ class NetconfDriver(Driver, NetconfBaseDriver):
         channel_lock: bool = False,
         preferred_netconf_version: Optional[str] = None,
         use_compressed_parser: bool = True,
+        build_result: bool = True,
+        input_validation: str = "parse",
+        capability_cache: Optional[Union[str, CapabilityCache]] = None,
     ) -> None:
         super().__init__(
             host=host,
@@ -87,8 +98,11 @@ class NetconfDriver(Driver, NetconfBaseDriver):
         )
 
         self.strip_namespaces = strip_namespaces
+        self.build_result = build_result
+        self.input_validation = self._determine_input_validation(input_validation=input_validation)
+        self.capability_cache = self._determine_capability_cache(capability_cache=capability_cache)
         self.strict_datastores = strict_datastores
-        self.server_capabilities: List[str] = []
+        self.server_capabilities = ServerCapabilities()
         self.readable_datastores: List[str] = []
         self.writeable_datastores: List[str] = []
         self.message_id = 101
@@ -120,20 +134,44 @@ class NetconfDriver(Driver, NetconfBaseDriver):
                 auth_private_key_passphrase=self.auth_private_key_passphrase,
             )
 
+        self._load_cached_session()
         self.channel.open_netconf()
 
-        self._build_readable_datastores()
-        self._build_writeable_datastores()
+        self._build_datastores()
 
         self._post_open_closing_log(closing=False)
 
-    def get(self, filter_: str, filter_type: str = "subtree") -> NetconfResponse:
+    def close(self) -> None:
+        """
+        Close netconf connection
+
+        Whether the server echoes inputs is cached, if the driver has a capability cache and that
+        was learned during the session.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._update_cached_server_echo(server_echo=self.channel.server_echo)
+        super().close()
+
+    def get(
+        self, filter_: str, filter_type: str = "subtree", input_validation: Optional[str] = None
+    ) -> NetconfResponse:
         """
         Netconf get operation
 
         Args:
             filter_: filter to apply to the get
             filter_type: type of filter; subtree|xpath
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object
@@ -142,17 +180,20 @@ class NetconfDriver(Driver, NetconfBaseDriver):
             N/A
 
         """
-        response = self._pre_get(filter_=filter_, filter_type=filter_type)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        response = self._pre_get(
+            filter_=filter_, filter_type=filter_type, input_validation=input_validation
+        )
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
-    def get_config(
+    def get_config(  # pylint: disable=R0917
         self,
         source: str = "running",
         filter_: Optional[str] = None,
         filter_type: str = "subtree",
         default_type: Optional[str] = None,
+        input_validation: Optional[str] = None,
     ) -> NetconfResponse:
         """
         Netconf get-config operation
@@ -162,6 +203,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
             filter_: string of filter(s) to apply to configuration
             filter_type: type of filter; subtree|xpath
             default_type: string of with-default mode to apply when retrieving configuration
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object
@@ -171,20 +214,117 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_get_config(
-            source=source, filter_=filter_, filter_type=filter_type, default_type=default_type
+            source=source,
+            filter_=filter_,
+            filter_type=filter_type,
+            default_type=default_type,
+            input_validation=input_validation,
         )
-        raw_response = self.channel.send_input_netconf(response.channel_input)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
 
-        response.record_response(raw_response)
+        response.record_response(raw_response, deframed=True)
         return response
 
-    def edit_config(self, config: str, target: str = "running") -> NetconfResponse:
+    def _stream_data(self, response: NetconfResponse) -> Iterator[_Element]:
+        """
+        Send a prepared request, yielding the children of the reply's "data" element as parsed
+
+        Args:
+            response: NetconfResponse object containing the channel input to send
+
+        Yields:
+            _Element: each child of the reply's "data" element as soon as it has been parsed
+
+        Raises:
+            N/A
+
+        """
+        data_stream = NetconfDataStream(strip_namespaces=self.strip_namespaces)
+
+        for payload in self.channel.send_input_netconf_iter(response.raw_channel_input):
+            yield from data_stream.feed(payload)
+
+        yield from data_stream.close()
+
+        data_stream.raise_for_status()
+
+    def stream_get(
+        self, filter_: str, filter_type: str = "subtree", input_validation: Optional[str] = None
+    ) -> Iterator[_Element]:
+        """
+        Netconf get operation, yielding the reply's data as it is read instead of a response
+
+        Each element directly under the reply's "data" element is yielded as soon as it has been
+        read and parsed, and is not retained afterwards -- this keeps memory use low for very large
+        replies. Raises `ScrapliCommandFailure` once the reply has been consumed if it contained any
+        rpc errors.
+
+        Args:
+            filter_: filter to apply to the get
+            filter_type: type of filter; subtree|xpath
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Yields:
+            _Element: each child of the reply's "data" element
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_get(
+            filter_=filter_, filter_type=filter_type, input_validation=input_validation
+        )
+        yield from self._stream_data(response=response)
+
+    def stream_get_config(  # pylint: disable=R0917
+        self,
+        source: str = "running",
+        filter_: Optional[str] = None,
+        filter_type: str = "subtree",
+        default_type: Optional[str] = None,
+        input_validation: Optional[str] = None,
+    ) -> Iterator[_Element]:
+        """
+        Netconf get-config operation, yielding the reply's data as it is read instead of a response
+
+        See `stream_get` for details.
+
+        Args:
+            source: configuration source to get; typically one of running|startup|candidate
+            filter_: string of filter(s) to apply to configuration
+            filter_type: type of filter; subtree|xpath
+            default_type: string of with-default mode to apply when retrieving configuration
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Yields:
+            _Element: each child of the reply's "data" element
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_get_config(
+            source=source,
+            filter_=filter_,
+            filter_type=filter_type,
+            default_type=default_type,
+            input_validation=input_validation,
+        )
+        yield from self._stream_data(response=response)
+
+    def edit_config(
+        self, config: str, target: str = "running", input_validation: Optional[str] = None
+    ) -> NetconfResponse:
         """
         Netconf get-config operation
 
         Args:
             config: configuration to send to device
             target: configuration source to target; running|startup|candidate
+            input_validation: how to validate the config; parse|check|trust, the drivers
+                `input_validation` if not provided
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object
@@ -193,9 +333,46 @@ class NetconfDriver(Driver, NetconfBaseDriver):
             N/A
 
         """
-        response = self._pre_edit_config(config=config, target=target)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        response = self._pre_edit_config(
+            config=config, target=target, input_validation=input_validation
+        )
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
+        return response
+
+    def edit_config_from(
+        self, config: XmlSource, target: str = "running", input_validation: Optional[str] = None
+    ) -> NetconfResponse:
+        """
+        Netconf edit-config operation, sending the config as it is read
+
+        Like `edit_config`, but rather than a string the config -- the `config` element, as for
+        `edit_config` -- is given as a path to a file, a file object opened in binary mode, or an
+        iterable of bytes such as a generator. The config is never held in memory as a whole; it is
+        checked to be well-formed xml and sent part by part as it is read. Paths and seekable files
+        are checked in full before anything is sent, other sources only as they are sent -- should
+        those turn out not to be well-formed, part of the request has already been sent, so the
+        connection should be closed.
+
+        Args:
+            config: path to a file, file object opened in binary mode, or iterable of bytes of the
+                configuration to send to device
+            target: configuration source to target; running|startup|candidate
+            input_validation: how to validate the config; parse|check|trust, the drivers
+                `input_validation` if not provided
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object
+
+        Raises:
+            N/A
+
+        """
+        response, channel_input = self._pre_edit_config_from(
+            config=config, target=target, input_validation=input_validation
+        )
+        raw_response = self.channel.send_input_netconf_stream(channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def delete_config(self, target: str = "candidate") -> NetconfResponse:
@@ -213,8 +390,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_delete_config(target=target)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def commit(
@@ -248,8 +425,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
             persist=persist,
             persist_id=persist_id,
         )
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def discard(self) -> NetconfResponse:
@@ -267,8 +444,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_discard()
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def lock(self, target: str) -> NetconfResponse:
@@ -286,8 +463,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_lock(target=target)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def unlock(self, target: str) -> NetconfResponse:
@@ -305,11 +482,13 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_unlock(target=target)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
-    def rpc(self, filter_: Union[str, _Element]) -> NetconfResponse:
+    def rpc(
+        self, filter_: Union[str, _Element], input_validation: Optional[str] = None
+    ) -> NetconfResponse:
         """
         Netconf "rpc" operation
 
@@ -319,6 +498,35 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         Args:
             filter_: filter/rpc to execute
+            input_validation: how to validate the filter/rpc, if a string; parse|check|trust, the
+                drivers `input_validation` if not provided
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_rpc(filter_=filter_, input_validation=input_validation)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
+        return response
+
+    def rpc_from(self, operation: XmlSource) -> NetconfResponse:
+        """
+        Netconf "rpc" operation, sending the operation as it is produced
+
+        Like `rpc`, but rather than a string or lxml element the (already serialized) operation is
+        given as a path to a file, a file object opened in binary mode, or an iterable of bytes
+        such as a generator. The operation is wrapped in the rpc envelope and framed part by part
+        as it is read, so producing and sending the request overlap and the request as a whole is
+        never held in memory. The operation is sent exactly as provided, it is not parsed or
+        validated at all.
+
+        Args:
+            operation: path to a file, file object opened in binary mode, or iterable of bytes of
+                the serialized operation element(s) to execute
 
         Returns:
             NetconfResponse: scrapli_netconf NetconfResponse object
@@ -327,9 +535,9 @@ class NetconfDriver(Driver, NetconfBaseDriver):
             N/A
 
         """
-        response = self._pre_rpc(filter_=filter_)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        response, channel_input = self._pre_rpc_from(operation=operation)
+        raw_response = self.channel.send_input_netconf_stream(channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def validate(self, source: str) -> NetconfResponse:
@@ -347,8 +555,8 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_validate(source=source)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
 
     def copy_config(self, source: str, target: str) -> NetconfResponse:
@@ -367,6 +575,215 @@ class NetconfDriver(Driver, NetconfBaseDriver):
 
         """
         response = self._pre_copy_config(source=source, target=target)
-        raw_response = self.channel.send_input_netconf(response.channel_input)
-        response.record_response(raw_response)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
+        return response
+
+    def get_schema(
+        self, identifier: str, version: Optional[str] = None, format_: str = "yang"
+    ) -> NetconfResponse:
+        """
+        Netconf "get-schema" operation
+
+        Args:
+            identifier: name of the schema, i.e. the name of the yang module
+            version: version of the schema, i.e. the revision of the yang module, the server picks
+                one if not provided
+            format_: format of the schema; typically one of yang|yin|xsd
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_get_schema(identifier=identifier, version=version, format_=format_)
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
         return response
+
+    def sync_schemas(
+        self, schema_cache: Union[str, SchemaCache], modules: Optional[Iterable[str]] = None
+    ) -> Dict[Tuple[str, Optional[str]], NetconfResponse]:
+        """
+        Fetch the yang schemas of the modules of the server that are not in the schema cache yet
+
+        Schemas are fetched with get-schema operations, pipelined in batches (see `pipeline`), and
+        stored in the cache as they arrive -- so syncing a fleet of devices running the same few
+        software versions only downloads each module once.
+
+        Args:
+            schema_cache: directory to cache schemas in, or a SchemaCache (i.e. to share one)
+            modules: names of the modules to sync, all modules of the server if not provided
+
+        Returns:
+            Dict[Tuple[str, Optional[str]], NetconfResponse]: responses of the get-schema operations
+                that were sent, by module name and revision -- modules that were already cached are
+                not included
+
+        Raises:
+            N/A
+
+        """
+        schema_cache = self._determine_schema_cache(schema_cache=schema_cache)
+
+        yang_library = None
+        yang_library_filter = self._yang_library_filter()
+        if yang_library_filter is not None:
+            yang_library = self.get(filter_=yang_library_filter)
+
+        responses = {}
+        for module_revisions in self._pre_sync_schemas(
+            schema_cache=schema_cache, modules=modules, yang_library=yang_library
+        ):
+            batch_responses = self.pipeline(
+                operations=[
+                    ("get_schema", {"identifier": name, "version": revision})
+                    for name, revision in module_revisions
+                ]
+            )
+            responses.update(
+                self._post_sync_schemas(
+                    schema_cache=schema_cache,
+                    module_revisions=module_revisions,
+                    responses=batch_responses,
+                )
+            )
+
+        return responses
+
+    def create_subscription(  # pylint: disable=R0917
+        self,
+        stream: Optional[str] = None,
+        filter_: Optional[str] = None,
+        filter_type: str = "subtree",
+        start_time: Optional[str] = None,
+        stop_time: Optional[str] = None,
+        input_validation: Optional[str] = None,
+        queue_size: int = NOTIFICATION_QUEUE_SIZE,
+    ) -> NetconfResponse:
+        """
+        Netconf "create-subscription" operation, subscribing to event notifications (RFC 5277)
+
+        Once subscribed, notifications are routed to a queue of at most `queue_size` as they are
+        read off the channel, and can be consumed with `notifications`.
+
+        Args:
+            stream: name of the event stream to subscribe to, the "NETCONF" stream if not provided
+            filter_: string filter selecting the notifications to send
+            filter_type: type of filter; subtree|xpath
+            start_time: date and time to replay notifications from, i.e. `2024-01-01T00:00:00Z`
+            stop_time: date and time to stop sending notifications at, requires start_time
+            input_validation: how to validate the filter; parse|check|trust, the drivers
+                `input_validation` if not provided
+            queue_size: number of notifications to hold for the consumer at most
+
+        Returns:
+            NetconfResponse: scrapli_netconf NetconfResponse object
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_create_subscription(
+            stream=stream,
+            filter_=filter_,
+            filter_type=filter_type,
+            start_time=start_time,
+            stop_time=stop_time,
+            input_validation=input_validation,
+        )
+        subscribed = self.channel.notifications is not None
+        # enabled before sending, as the first notification may follow hot on the heels of the reply
+        self.channel.enable_notifications(maxsize=queue_size)
+
+        raw_response = self.channel.send_input_netconf(response.raw_channel_input)
+        response.record_response(raw_response, deframed=True)
+
+        if response.failed and not subscribed:
+            self.channel.disable_notifications()
+        return response
+
+    def notifications(self) -> Iterator[_Element]:
+        """
+        Iterate over the notifications of the subscription, waiting for each one to arrive
+
+        Ends once the server signals the subscription is complete (i.e. its stop time has passed),
+        otherwise only when the caller stops iterating.
+
+        Args:
+            N/A
+
+        Yields:
+            _Element: lxml element of the notification, namespaces stripped as per
+                `strip_namespaces`
+
+        Raises:
+            N/A
+
+        """
+        while True:
+            xml_notification = self._parse_notification(
+                notification=self.channel.read_notification()
+            )
+            if xml_notification is None:
+                continue
+            yield xml_notification
+            if is_notification_complete(xml_notification=xml_notification):
+                return
+
+    @property
+    def notification_stats(self) -> Optional[NotificationStats]:
+        """
+        Getter for 'notification_stats' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            Optional[NotificationStats]: counts of the notifications received, delivered and
+                dropped, None if there is no notification subscription
+
+        Raises:
+            N/A
+
+        """
+        notifications = self.channel.notifications
+        if notifications is None:
+            return None
+        return notifications.stats
+
+    def pipeline(self, operations: Sequence[Tuple[str, Dict[str, Any]]]) -> List[NetconfResponse]:
+        """
+        Send several netconf operations without waiting for the reply to each one in between
+
+        All operations are written to the session back to back and the replies are then matched up
+        to them by message-id; this saves a round trip per operation which adds up quickly on high
+        latency links. Operations are given as tuples of the name of the operation method and the
+        kwargs for it, for example:
+
+            conn.pipeline([("get_config", {"source": "running"}), ("get", {"filter_": filter_})])
+
+        Note that servers that echo inputs back are sent the operations one at a time as usual.
+
+        Args:
+            operations: sequence of tuples of operation name (get|get_config|edit_config|
+                delete_config|commit|discard|lock|unlock|rpc|validate|copy_config|
+                get_schema) and kwargs
+
+        Returns:
+            List[NetconfResponse]: scrapli_netconf NetconfResponse objects in the order of the
+                provided operations
+
+        Raises:
+            N/A
+
+        """
+        responses, channel_inputs = self._pre_pipeline(operations=operations)
+        raw_responses = self.channel.send_inputs_netconf(channel_inputs=channel_inputs)
+
+        for response, message_id in zip(responses, channel_inputs):
+            response.record_response(raw_responses[message_id], deframed=True)
+
+        return responses
@@ -9,3 +9,7 @@ class CouldNotExchangeCapabilities(ScrapliException):
 
 class CapabilityNotSupported(ScrapliException):
     """Exception for unsupported capabilities"""
+
+
+class InvalidMessageFraming(ScrapliException):
+    """Exception for netconf messages that do not adhere to the expected framing"""
@@ -0,0 +1,354 @@
+"""scrapli_netconf.fleet"""
+
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.driver.async_driver import AsyncNetconfDriver
+from scrapli_netconf.driver.base_driver import NETCONF_OPERATIONS
+from scrapli_netconf.pool.async_pool import AsyncNetconfConnectionPool
+from scrapli_netconf.response import NetconfResponse
+
+LOG = getLogger("scrapli_netconf.fleet")
+
+
+@dataclass()
+class FleetResult:
+    host: str
+    response: Optional[NetconfResponse] = None
+    exception: Optional[BaseException] = None
+    attempts: int = 0
+    elapsed_time: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        """
+        Determine if the operation failed on this host
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if the operation raised (after all retries) or the reply was an rpc-error
+
+        Raises:
+            N/A
+
+        """
+        return self.response is None or self.response.failed
+
+
+@dataclass()
+class FleetStats:
+    hosts: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed_time: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    def record(self, result: FleetResult) -> None:
+        """
+        Record the result of a host
+
+        Args:
+            result: result of the host
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.hosts += 1
+        if result.failed:
+            self.failed += 1
+        else:
+            self.succeeded += 1
+        self.latencies.append(result.elapsed_time)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Getter for 'throughput' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            float: hosts completed per second
+
+        Raises:
+            N/A
+
+        """
+        if not self.elapsed_time:
+            return 0.0
+        return self.hosts / self.elapsed_time
+
+    def percentile(self, percent: float) -> float:
+        """
+        Latency (per host, including any retries) at the given percentile, by nearest rank
+
+        Args:
+            percent: percentile to fetch, 0-100
+
+        Returns:
+            float: latency in seconds, 0.0 if no hosts have completed
+
+        Raises:
+            N/A
+
+        """
+        if not self.latencies:
+            return 0.0
+
+        latencies = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the run
+
+        Args:
+            N/A
+
+        Returns:
+            Dict[str, float]: host counts, throughput and latency percentiles
+
+        Raises:
+            N/A
+
+        """
+        return {
+            "hosts": self.hosts,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_time": self.elapsed_time,
+            "throughput": self.throughput,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.percentile(100),
+        }
+
+
+class AsyncNetconfFleet:
+    def __init__(  # pylint: disable=R0917
+        self,
+        inventory: Iterable[Dict[str, Any]],
+        defaults: Optional[Dict[str, Any]] = None,
+        concurrency: int = 100,
+        timeout_host: float = 120.0,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+        retry_backoff_max: float = 30.0,
+        pool: Optional[AsyncNetconfConnectionPool] = None,
+    ) -> None:
+        """
+        Run netconf operations across many hosts concurrently
+
+        Each host is handled from start (opening the connection) to finish (closing it) within
+        `timeout_host`, so slow or dead hosts only ever hold up one of the `concurrency` slots.
+        Failed attempts (exceptions -- a reply containing rpc-errors is a result, not a failure to
+        retry) are retried with exponential backoff.
+
+        Args:
+            inventory: AsyncNetconfDriver arguments for each host, i.e. `{"host": "172.18.0.11"}`
+            defaults: AsyncNetconfDriver arguments common to all hosts, i.e. credentials and
+                `transport`, which should be "asyncssh" -- host arguments take precedence
+            concurrency: maximum number of hosts to work on at any one time
+            timeout_host: seconds each attempt on a host (connect, operation, close) may take
+            retries: number of times to retry a host after a failed attempt
+            retry_backoff: seconds to wait before the first retry, doubling for every retry after
+            retry_backoff_max: maximum seconds to wait between retries
+            pool: connection pool to take sessions from rather than opening and closing a session
+                for every host
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            ScrapliValueError: if concurrency is less than one
+
+        """
+        if concurrency < 1:
+            raise ScrapliValueError("`concurrency` must be at least one")
+
+        self.inventory = inventory
+        self.defaults = defaults or {}
+        self.concurrency = concurrency
+        self.timeout_host = timeout_host
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.pool = pool
+
+        self.stats = FleetStats()
+
+    async def _execute(
+        self, driver_kwargs: Dict[str, Any], operation: str, operation_kwargs: Dict[str, Any]
+    ) -> NetconfResponse:
+        """
+        Run the operation on a host once
+
+        Args:
+            driver_kwargs: AsyncNetconfDriver arguments for the host
+            operation: name of the operation method to run
+            operation_kwargs: arguments for the operation
+
+        Returns:
+            NetconfResponse: response of the operation
+
+        Raises:
+            N/A
+
+        """
+        response: NetconfResponse
+
+        if self.pool is not None:
+            async with self.pool.connection(**driver_kwargs) as conn:
+                response = await getattr(conn, operation)(**operation_kwargs)
+            return response
+
+        async with AsyncNetconfDriver(**driver_kwargs) as conn:
+            response = await getattr(conn, operation)(**operation_kwargs)
+        return response
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before retrying after the given (failed) attempt
+
+        Jittered so hosts that failed together (i.e. a flapping link) do not all retry together.
+
+        Args:
+            attempt: number of the attempt that failed, starting from one
+
+        Returns:
+            float: seconds to wait
+
+        Raises:
+            N/A
+
+        """
+        delay: float = min(self.retry_backoff * 2 ** (attempt - 1), self.retry_backoff_max)
+        return delay * random.uniform(0.5, 1.0)  # nosec
+
+    async def _run_host(
+        self, driver_kwargs: Dict[str, Any], operation: str, operation_kwargs: Dict[str, Any]
+    ) -> FleetResult:
+        """
+        Run the operation on a host, retrying as needed
+
+        Args:
+            driver_kwargs: AsyncNetconfDriver arguments for the host
+            operation: name of the operation method to run
+            operation_kwargs: arguments for the operation
+
+        Returns:
+            FleetResult: result of the host
+
+        Raises:
+            N/A
+
+        """
+        result = FleetResult(host=str(driver_kwargs.get("host", "")))
+        start_time = time.monotonic()
+
+        while True:
+            result.attempts += 1
+
+            try:
+                result.response = await asyncio.wait_for(
+                    self._execute(
+                        driver_kwargs=driver_kwargs,
+                        operation=operation,
+                        operation_kwargs=operation_kwargs,
+                    ),
+                    timeout=self.timeout_host,
+                )
+                result.exception = None
+                break
+            except Exception as exc:  # pylint: disable=W0703
+                LOG.warning("attempt %s on host %s failed: %r", result.attempts, result.host, exc)
+                result.exception = exc
+
+            if result.attempts > self.retries:
+                break
+
+            await asyncio.sleep(self._retry_delay(attempt=result.attempts))
+
+        result.elapsed_time = time.monotonic() - start_time
+        return result
+
+    async def run(self, operation: str, **operation_kwargs: Any) -> AsyncIterator[FleetResult]:
+        """
+        Run an operation on every host in the inventory, yielding results as hosts complete
+
+        Results are yielded in the order hosts complete, not inventory order. Once all results have
+        been yielded `stats` holds the throughput and latency figures for the run.
+
+        Args:
+            operation: name of the operation to run; get|get_config|edit_config|delete_config|
+                commit|discard|lock|unlock|rpc|validate|copy_config|get_schema
+            operation_kwargs: arguments for the operation, i.e. `filter_`
+
+        Yields:
+            FleetResult: result of each host
+
+        Raises:
+            ScrapliValueError: if the operation is not one that can be run across the fleet
+
+        """
+        if operation not in NETCONF_OPERATIONS:
+            raise ScrapliValueError(
+                f"operation '{operation}' cannot be run across the fleet, must be one of "
+                f"{', '.join(NETCONF_OPERATIONS)}"
+            )
+
+        self.stats = FleetStats()
+        start_time = time.monotonic()
+
+        inventory = iter(self.inventory)
+        results: "asyncio.Queue[Optional[FleetResult]]" = asyncio.Queue()
+
+        async def _worker() -> None:
+            try:
+                # workers share the one inventory iterator, taking the next host when they are free
+                for host_kwargs in inventory:
+                    await results.put(
+                        await self._run_host(
+                            driver_kwargs={**self.defaults, **host_kwargs},
+                            operation=operation,
+                            operation_kwargs=operation_kwargs,
+                        )
+                    )
+            finally:
+                await results.put(None)
+
+        workers = [asyncio.create_task(_worker()) for _ in range(self.concurrency)]
+        running_workers = len(workers)
+
+        try:
+            while running_workers:
+                result = await results.get()
+
+                if result is None:
+                    running_workers -= 1
+                    continue
+
+                self.stats.record(result=result)
+                self.stats.elapsed_time = time.monotonic() - start_time
+                yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        LOG.info("fleet run of '%s' complete: %s", operation, self.stats.summary())
@@ -0,0 +1,496 @@
+"""scrapli_netconf.framing"""
+
+from typing import Iterable, Iterator, List, Union
+
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.exceptions import InvalidMessageFraming
+
+# whitespace skipped between chunks, as the original (strip everything) chunk parsing did
+WHITESPACE_BYTES = b" \t\r\n"
+CHUNK_DELIMITER_BYTE = 35
+
+END_OF_MESSAGE_DELIMITER = b"]]>]]>"
+
+# rfc6242 caps chunk size at 4294967295, so a chunk size is never more than 10 digits, we allow one
+# extra byte for a "\r" some transports may have slipped in before the newline
+MAX_CHUNK_SIZE = 4294967295
+MAX_CHUNK_SIZE_LEN = 11
+
+ZERO_BYTE = 48
+
+# size of the chunks outgoing 1.1 messages are encoded into
+SEND_CHUNK_SIZE = 65536
+
+
+class ChunkedMessageDecoder:
+    def __init__(self, skip_leading_noise: bool = False) -> None:
+        """
+        Incremental netconf 1.1 "chunked" message decoder
+
+        Bytes are fed to the decoder as they are read off of the channel; each byte is examined at
+        most once (chunk bodies are never scanned at all, only sliced), and the decoder knows the
+        moment the end of chunks marker ("##") arrives, so there is no need to keep re-searching an
+        ever growing buffer for a prompt. Chunk bodies are kept as memoryview slices of the fed
+        bytes and only joined (copied) once when the payload is requested.
+
+        Args:
+            skip_leading_noise: ignore any bytes before the first chunk header rather than raising
+                -- this allows for things like the tail end of echoed inputs on the channel.
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.skip_leading_noise = skip_leading_noise
+        self.chunks: List[memoryview] = []
+        self.complete = False
+        self.remainder = b""
+        self._pending = b""
+        self._chunk_remaining = 0
+        self._chunk_seen = False
+
+    @property
+    def payload(self) -> bytes:
+        """
+        Getter for the de-framed payload decoded so far
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: joined chunk bodies
+
+        Raises:
+            N/A
+
+        """
+        return b"".join(self.chunks)
+
+    def pop_chunks(self) -> List[bytes]:
+        """
+        Return and forget the payload decoded since the last call
+
+        Used when streaming a reply so that already handled parts of the payload are not held on
+        to for the life of the message.
+
+        Args:
+            N/A
+
+        Returns:
+            List[bytes]: payload decoded since the last call
+
+        Raises:
+            N/A
+
+        """
+        chunks = [chunk.tobytes() for chunk in self.chunks if chunk]
+        self.chunks = []
+        return chunks
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Getter indicating if decoding stopped part way through a chunk header or body
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if fed data ended inside of a chunk header or body
+
+        Raises:
+            N/A
+
+        """
+        return bool(self._pending) or self._chunk_remaining > 0
+
+    def feed(self, data: bytes) -> bool:  # noqa: C901 pylint: disable=R0912
+        """
+        Feed bytes read from the channel to the decoder
+
+        Any bytes fed *after* the end of chunks marker are stored in the `remainder` attribute so
+        the channel can put them back in its read buffer.
+
+        Args:
+            data: bytes read from the channel
+
+        Returns:
+            bool: True if the end of message has been seen, otherwise False
+
+        Raises:
+            InvalidMessageFraming: if a chunk marker is missing, or a chunk size cannot be parsed
+
+        """
+        if self._pending:
+            data = self._pending + data
+            self._pending = b""
+
+        view = memoryview(data)
+        data_len = len(data)
+        chunks = self.chunks
+        chunk_remaining = self._chunk_remaining
+        cursor = 0
+
+        while cursor < data_len:
+            if chunk_remaining:
+                chunk_end = min(cursor + chunk_remaining, data_len)
+                chunks.append(view[cursor:chunk_end])
+                chunk_remaining -= chunk_end - cursor
+                cursor = chunk_end
+                continue
+
+            if data[cursor] in WHITESPACE_BYTES:
+                cursor += 1
+                continue
+
+            if data[cursor] != CHUNK_DELIMITER_BYTE:
+                if self._chunk_seen or not self.skip_leading_noise:
+                    raise InvalidMessageFraming(f"chunk marker missing, got {data[cursor]}")
+
+                next_marker = data.find(b"#", cursor)
+                cursor = next_marker if next_marker != -1 else data_len
+                continue
+
+            if cursor + 1 == data_len:
+                self._pending = data[cursor:]
+                break
+
+            if data[cursor + 1] == CHUNK_DELIMITER_BYTE:
+                if not self._chunk_seen and self.skip_leading_noise:
+                    # end of chunks marker w/out any chunks -- leftovers from an echo, move on
+                    cursor += 2
+                    continue
+
+                self.complete = True
+                self.remainder = data[cursor + 2 :]  # noqa: E203
+                return True
+
+            chunk_size_end = data.find(b"\n", cursor + 1, cursor + MAX_CHUNK_SIZE_LEN + 2)
+
+            if chunk_size_end == -1:
+                if data_len - cursor <= MAX_CHUNK_SIZE_LEN + 1:
+                    # chunk header is split across reads, wait for the rest of it
+                    self._pending = data[cursor:]
+                    break
+                raise InvalidMessageFraming("failed parsing chunk size")
+
+            chunk_remaining = _parse_chunk_size(data[cursor + 1 : chunk_size_end])  # noqa: E203
+            self._chunk_seen = True
+            cursor = chunk_size_end + 1
+
+        self._chunk_remaining = chunk_remaining
+
+        return False
+
+
+class DelimitedMessageDecoder:
+    def __init__(self) -> None:
+        """
+        Incremental netconf 1.0 "end of message" delimited message decoder
+
+        Bytes are fed to the decoder as they are read off of the channel; only the newly fed bytes
+        are searched for the delimiter. If a read ends with what may be the start of a delimiter
+        those few bytes are held back until the next read so a delimiter split across reads is
+        still found.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.chunks: List[memoryview] = []
+        self.complete = False
+        self.remainder = b""
+        self._pending = b""
+
+    @property
+    def payload(self) -> bytes:
+        """
+        Getter for the de-framed payload decoded so far
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: message payload w/out the end of message delimiter
+
+        Raises:
+            N/A
+
+        """
+        return b"".join(self.chunks)
+
+    def pop_chunks(self) -> List[bytes]:
+        """
+        Return and forget the payload decoded since the last call
+
+        Args:
+            N/A
+
+        Returns:
+            List[bytes]: payload decoded since the last call
+
+        Raises:
+            N/A
+
+        """
+        chunks = [chunk.tobytes() for chunk in self.chunks if chunk]
+        self.chunks = []
+        return chunks
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Feed bytes read from the channel to the decoder
+
+        Any bytes fed *after* the delimiter are stored in the `remainder` attribute so the channel
+        can put them back in its read buffer.
+
+        Args:
+            data: bytes read from the channel
+
+        Returns:
+            bool: True if the end of message has been seen, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        if self._pending:
+            data = self._pending + data
+            self._pending = b""
+
+        view = memoryview(data)
+        delimiter_index = data.find(END_OF_MESSAGE_DELIMITER)
+
+        if delimiter_index != -1:
+            self.chunks.append(view[:delimiter_index])
+            self.complete = True
+            self.remainder = data[delimiter_index + len(END_OF_MESSAGE_DELIMITER) :]  # noqa: E203
+            return True
+
+        for pending_len in range(len(END_OF_MESSAGE_DELIMITER) - 1, 0, -1):
+            if data.endswith(END_OF_MESSAGE_DELIMITER[:pending_len]):
+                self._pending = data[-pending_len:]
+                self.chunks.append(view[:-pending_len])
+                break
+        else:
+            self.chunks.append(view)
+
+        return False
+
+
+MessageDecoder = Union[ChunkedMessageDecoder, DelimitedMessageDecoder]
+
+
+def build_message_decoder(netconf_version: NetconfVersion) -> MessageDecoder:
+    """
+    Build the appropriate message decoder for the given netconf version
+
+    Args:
+        netconf_version: netconf version of the session
+
+    Returns:
+        MessageDecoder: chunk decoder for 1.1 sessions, end of message delimiter decoder otherwise
+
+    Raises:
+        N/A
+
+    """
+    if netconf_version == NetconfVersion.VERSION_1_1:
+        return ChunkedMessageDecoder(skip_leading_noise=True)
+    return DelimitedMessageDecoder()
+
+
+def decode_chunked_message(raw: bytes) -> bytes:
+    """
+    Decode a complete netconf 1.1 "chunked" message into its (de-framed) payload
+
+    Any newlines (or carriage returns) between chunks are ignored, decoding stops at the end of
+    chunks marker ("##") if present.
+
+    Args:
+        raw: bytes of the chunk framed message as read from the channel
+
+    Returns:
+        bytes: de-framed message payload
+
+    Raises:
+        InvalidMessageFraming: if a chunk marker is missing, a chunk size cannot be parsed, or a
+            chunk is shorter than its advertised size
+
+    """
+    decoder = ChunkedMessageDecoder()
+    decoder.feed(raw)
+
+    if decoder.truncated:
+        raise InvalidMessageFraming("message ended part way through a chunk")
+
+    if not decoder.chunks:
+        raise InvalidMessageFraming("no chunk marker at start of data")
+
+    return decoder.payload
+
+
+def _parse_chunk_size(chunk_size: bytes) -> int:
+    """
+    Parse the size out of a netconf 1.1 chunk header
+
+    rfc6242 chunk-size is 1*DIGIT1 *DIGIT, int() alone would also accept signs, leading zeros,
+    whitespace and underscores; bytes.isdigit only ever matches ascii digits.
+
+    Args:
+        chunk_size: bytes between the chunk marker and the newline ending the chunk header
+
+    Returns:
+        int: chunk size
+
+    Raises:
+        InvalidMessageFraming: if chunk size is not a valid rfc6242 chunk size
+
+    """
+    if chunk_size[-1:] == b"\r":
+        chunk_size = chunk_size[:-1]
+
+    if not chunk_size.isdigit() or chunk_size[0] == ZERO_BYTE:
+        raise InvalidMessageFraming(f"failed parsing chunk size, got {chunk_size!r}")
+
+    size = int(chunk_size)
+    if size > MAX_CHUNK_SIZE:
+        raise InvalidMessageFraming(f"chunk size {size} exceeds {MAX_CHUNK_SIZE}")
+
+    return size
+
+
+def _frame_chunk(body: Union[bytes, bytearray, memoryview], first: bool) -> bytes:
+    """
+    Frame a single chunk of an outgoing netconf 1.1 message
+
+    The first chunk has no leading newline, matching the single chunk framing requests have always
+    been sent with.
+
+    Args:
+        body: chunk body
+        first: True if this is the first chunk of the message
+
+    Returns:
+        bytes: framed chunk
+
+    Raises:
+        N/A
+
+    """
+    if first:
+        return b"#%d\n" % len(body) + body
+    return b"\n#%d\n" % len(body) + body
+
+
+def encode_chunked_message(
+    parts: Iterable[bytes], chunk_size: int = SEND_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Incrementally encode an outgoing netconf 1.1 message from the parts of its payload
+
+    Parts are packed into chunks of `chunk_size` bytes as they are consumed -- small parts are
+    gathered up and large parts are sliced up (without copying) -- so each chunk is yielded as soon
+    as there is enough payload for it, and the payload as a whole is never held in memory or even
+    its length known up front. The end of chunks marker ("##") is yielded last.
+
+    Args:
+        parts: parts of the message payload
+        chunk_size: size of the chunks to encode the payload into, only the final chunk may be
+            smaller
+
+    Yields:
+        bytes: framed chunks of the message
+
+    Raises:
+        ScrapliValueError: if chunk_size is not positive, or the payload is empty (a message must
+            have at least one chunk); nothing has been yielded at that point
+
+    """
+    if chunk_size <= 0:
+        raise ScrapliValueError("chunk_size must be positive")
+
+    pending = bytearray()
+    first = True
+
+    for part in parts:
+        view = memoryview(part)
+
+        if pending:
+            # top up the chunk gathered from previous parts before moving on to this one
+            taken = chunk_size - len(pending)
+            pending += view[:taken]
+            view = view[taken:]
+            if len(pending) < chunk_size:
+                continue
+            yield _frame_chunk(body=pending, first=first)
+            pending.clear()
+            first = False
+
+        while len(view) >= chunk_size:
+            yield _frame_chunk(body=view[:chunk_size], first=first)
+            view = view[chunk_size:]
+            first = False
+
+        pending += view
+
+    if pending:
+        yield _frame_chunk(body=pending, first=first)
+    elif first:
+        raise ScrapliValueError("cannot encode an empty message, it must have at least one chunk")
+
+    yield b"\n##"
+
+
+def encode_delimited_message(parts: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Incrementally encode an outgoing netconf 1.0 message from the parts of its payload
+
+    Args:
+        parts: parts of the message payload
+
+    Yields:
+        bytes: parts of the message followed by the end of message delimiter
+
+    Raises:
+        N/A
+
+    """
+    for part in parts:
+        if part:
+            yield part
+
+    yield END_OF_MESSAGE_DELIMITER
+
+
+def encode_message(
+    parts: Iterable[bytes], netconf_version: NetconfVersion, chunk_size: int = SEND_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Incrementally encode an outgoing message with the framing for the given netconf version
+
+    Args:
+        parts: parts of the message payload
+        netconf_version: netconf version of the session
+        chunk_size: size of the chunks to encode the payload of 1.1 messages into
+
+    Returns:
+        Iterator[bytes]: framed message, ready to be written to the channel part by part
+
+    Raises:
+        N/A
+
+    """
+    if netconf_version == NetconfVersion.VERSION_1_1:
+        return encode_chunked_message(parts=parts, chunk_size=chunk_size)
+    return encode_delimited_message(parts=parts)
@@ -1,13 +1,40 @@
 """scrapli_netconf.helper"""
 
+import os
 import re
+from collections import deque
+from functools import partial
 from logging import getLogger
+from typing import IO, Dict, Iterable, Iterator, Union, cast
 
-from lxml import objectify
+from lxml import etree
 from lxml.etree import Element
 
+from scrapli.exceptions import ScrapliValueError
+
 LOG = getLogger("scrapli_netconf.helper")
 
+# an xml document to send without ever loading it into memory as a whole: a path to a file, a file
+# object opened in binary mode, or an iterable of the bytes of the document
+XmlSource = Union[str, "os.PathLike[str]", IO[bytes], Iterable[bytes]]
+
+# size of the blocks files are read in
+XML_SOURCE_BLOCK_SIZE = 65536
+
+XML_DECLARATION = re.compile(pattern=rb"\s*<\?xml\b.*?\?>\s*", flags=re.S)
+
+XSI_TYPE_ATTRIBUTE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+PYTYPE_ATTRIBUTE = "{http://codespeak.net/lxml/objectify/pytype}pytype"
+
+# elements carrying the type annotations that objectify.deannotate used to strip out for us
+ANNOTATED_ELEMENTS = etree.XPath(
+    "descendant-or-self::*[@xsi:type or @py:pytype]",
+    namespaces={
+        "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+        "py": "http://codespeak.net/lxml/objectify/pytype",
+    },
+)
+
 
 def remove_namespaces(tree: Element) -> Element:
     """
@@ -16,6 +43,10 @@ def remove_namespaces(tree: Element) -> Element:
     Replace element tags like: {http://cisco.com/ns/yang/Cisco-IOS-XR-ipv4-bgp-oper}connection-state
     With: connection-state
 
+    Replies tend to contain the same few tags many many times over, so rather than splitting every
+    tag we keep a table of already seen qualified tags to their local names and do a single pass
+    over the elements (comments and processing instructions are skipped by `iter` itself).
+
     Args:
         tree: lxml Element
 
@@ -26,9 +57,192 @@ def remove_namespaces(tree: Element) -> Element:
         N/A
 
     """
-    for el in tree.getiterator():
-        if not hasattr(el.tag, "find"):
+    local_names: Dict[str, str] = {}
+
+    for el in tree.iter(tag=etree.Element):
+        tag = el.tag
+        if tag[0] != "{":
             continue
-        el.tag = re.sub(r"^{.*}", "", el.tag)
-    objectify.deannotate(tree, cleanup_namespaces=True)
+
+        local_name = local_names.get(tag)
+        if local_name is None:
+            local_name = local_names[tag] = tag[tag.index("}") + 1 :]  # noqa: E203
+        el.tag = local_name
+
+    for el in ANNOTATED_ELEMENTS(tree):
+        el.attrib.pop(XSI_TYPE_ATTRIBUTE, None)
+        el.attrib.pop(PYTYPE_ATTRIBUTE, None)
+
+    etree.cleanup_namespaces(tree)
     return tree
+
+
+def iter_xml_source(source: XmlSource, block_size: int = XML_SOURCE_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Iterate over the bytes of an xml document part by part
+
+    Paths are opened (and closed once the document has been consumed) and files read in blocks of
+    `block_size` bytes, iterables of bytes are passed through as they are.
+
+    Args:
+        source: path to a file, file object opened in binary mode, or iterable of bytes
+        block_size: size of the blocks to read files in
+
+    Yields:
+        bytes: parts of the document
+
+    Raises:
+        N/A
+
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter(partial(file.read, block_size), b"")
+        return
+
+    if hasattr(source, "read"):
+        yield from iter(partial(source.read, block_size), b"")
+        return
+
+    yield from source
+
+
+def iter_well_formed_xml_source(
+    source: XmlSource, block_size: int = XML_SOURCE_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """
+    Iterate over the bytes of an xml document part by part, checking the document is well-formed
+
+    Where the document can be read twice -- paths, and file objects that are seekable -- the whole
+    document is checked up front (a part at a time) before returning, so nothing of a document that
+    is not well-formed is ever used. Other sources can only be checked as they are iterated over,
+    see `check_well_formed`.
+
+    Args:
+        source: path to a file, file object opened in binary mode, or iterable of bytes
+        block_size: size of the blocks to read files in
+
+    Returns:
+        Iterator[bytes]: parts of the document
+
+    Raises:
+        N/A
+
+    """
+    if isinstance(source, (str, os.PathLike)):
+        deque(check_well_formed(iter_xml_source(source=source, block_size=block_size)), maxlen=0)
+        return iter_xml_source(source=source, block_size=block_size)
+
+    if hasattr(source, "seekable") and source.seekable():
+        file = cast(IO[bytes], source)
+        position = file.tell()
+        deque(check_well_formed(iter_xml_source(source=file, block_size=block_size)), maxlen=0)
+        file.seek(position)
+        return iter_xml_source(source=file, block_size=block_size)
+
+    return check_well_formed(iter_xml_source(source=source, block_size=block_size))
+
+
+class WellFormednessTarget:
+    """lxml parser target that builds nothing at all, used to only check xml is well-formed"""
+
+    def close(self) -> None:
+        """
+        Handle end of document
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+
+
+# shared by all (complete) document checks, as the target keeps no state; like the module level
+# parsers of the drivers, only ever used via `etree.fromstring`
+WELL_FORMEDNESS_PARSER = etree.XMLParser(
+    target=WellFormednessTarget(), resolve_entities=False, huge_tree=True
+)
+
+
+def check_well_formed(parts: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Pass the parts of an xml document through, checking the document is well-formed as they pass
+
+    The parts are fed to a parser that does not build a tree, so this only ever holds on to what
+    the parser needs to track the open elements. Note that a document that is not well-formed is
+    only noticed once the offending part is reached -- everything before it has been passed on.
+
+    Args:
+        parts: parts of the xml document
+
+    Yields:
+        bytes: the parts, unchanged
+
+    Raises:
+        ScrapliValueError: if the document is not well-formed xml
+
+    """
+    parser = etree.XMLParser(target=WellFormednessTarget(), resolve_entities=False, huge_tree=True)
+
+    try:
+        for part in parts:
+            parser.feed(part)
+            yield part
+        parser.close()
+    except etree.XMLSyntaxError as exc:
+        raise ScrapliValueError(f"xml document is not well-formed: {exc}") from exc
+
+
+def check_well_formed_document(document: bytes) -> None:
+    """
+    Check an xml document is well-formed, without building a tree of it
+
+    Args:
+        document: xml document to check
+
+    Returns:
+        None
+
+    Raises:
+        ScrapliValueError: if the document is not well-formed xml
+
+    """
+    try:
+        etree.fromstring(document, parser=WELL_FORMEDNESS_PARSER)
+    except etree.XMLSyntaxError as exc:
+        raise ScrapliValueError(f"xml document is not well-formed: {exc}") from exc
+
+
+def strip_xml_declaration(parts: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Pass the parts of an xml document through, dropping any xml declaration at its start
+
+    Documents sent as part of a request are embedded in it, where a declaration is not allowed. Only
+    the first non-empty part is checked, so the declaration (if any) must be contained in it.
+
+    Args:
+        parts: parts of the xml document
+
+    Yields:
+        bytes: the parts, without the declaration
+
+    Raises:
+        N/A
+
+    """
+    parts = iter(parts)
+
+    for part in parts:
+        if not part:
+            continue
+
+        declaration = XML_DECLARATION.match(part)
+        yield part[declaration.end() :] if declaration else part  # noqa: E203
+        break
+
+    yield from parts
@@ -0,0 +1,192 @@
+"""scrapli_netconf.notifications"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Deque, Optional
+
+from lxml import etree
+from lxml.etree import _Element
+
+from scrapli_netconf.helper import remove_namespaces
+from scrapli_netconf.response import PARSER
+
+LOG = getLogger("scrapli_netconf.notifications")
+
+# start tag of a notification, only ever checked at the start of a message (after any xml
+# declaration)
+NOTIFICATION_START_TAG = re.compile(
+    pattern=rb"\s*(?:<\?xml[^>]*\?>\s*)?<(?:[\w.-]+:)?notification\b"
+)
+# sent as the last notification of a subscription with a stop time, see RFC 5277 section 3.2.1
+NOTIFICATION_COMPLETE_TAG = "{*}notificationComplete"
+
+# number of notifications held for the consumer before the oldest are dropped
+NOTIFICATION_QUEUE_SIZE = 1000
+
+
+@dataclass()
+class NotificationStats:
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+
+
+class NotificationQueue:
+    def __init__(self, maxsize: int = NOTIFICATION_QUEUE_SIZE) -> None:
+        """
+        Bounded queue of the notifications received on a session, waiting to be consumed
+
+        Notifications are only ever read off the channel when the consumer asks for the next one
+        or while waiting for rpc replies, so a full queue holds back reading notifications (and so
+        the server sending them) rather than growing. Should the queue be full when a notification
+        is read while waiting for a reply, the oldest notification is dropped to make room, so the
+        reply is never held up behind notifications nobody is consuming -- `stats` counts them.
+
+        Args:
+            maxsize: number of notifications to hold at most
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        self.maxsize = max(maxsize, 1)
+        self.stats = NotificationStats()
+        self._notifications: Deque[bytes] = deque()
+
+    def __len__(self) -> int:
+        """
+        Count the notifications waiting to be consumed
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of notifications in the queue
+
+        Raises:
+            N/A
+
+        """
+        return len(self._notifications)
+
+    def full(self) -> bool:
+        """
+        Check if the queue is full
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if the queue holds `maxsize` notifications
+
+        Raises:
+            N/A
+
+        """
+        return len(self._notifications) >= self.maxsize
+
+    def put(self, notification: bytes) -> None:
+        """
+        Add a notification to the queue, dropping the oldest one if the queue is full
+
+        Args:
+            notification: de-framed notification message
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.stats.received += 1
+
+        if self.full():
+            self._notifications.popleft()
+            self.stats.dropped += 1
+            LOG.warning(
+                "notification queue full, dropped oldest notification (%s dropped so far)",
+                self.stats.dropped,
+            )
+
+        self._notifications.append(notification)
+
+    def get(self) -> Optional[bytes]:
+        """
+        Take the oldest notification off the queue
+
+        Args:
+            N/A
+
+        Returns:
+            Optional[bytes]: de-framed notification message, None if the queue is empty
+
+        Raises:
+            N/A
+
+        """
+        if not self._notifications:
+            return None
+
+        self.stats.delivered += 1
+        return self._notifications.popleft()
+
+
+def is_notification(payload: bytes) -> bool:
+    """
+    Check if a message read off the channel is a notification
+
+    Args:
+        payload: de-framed message
+
+    Returns:
+        bool: True if the message is a notification
+
+    Raises:
+        N/A
+
+    """
+    return NOTIFICATION_START_TAG.match(payload) is not None
+
+
+def parse_notification(notification: bytes, strip_namespaces: bool = False) -> Optional[_Element]:
+    """
+    Parse a notification message, with the same (recovering) parser as replies
+
+    Args:
+        notification: de-framed notification message
+        strip_namespaces: strip out all namespaces if True
+
+    Returns:
+        Optional[_Element]: lxml element of the notification, or None if nothing could be parsed
+
+    Raises:
+        N/A
+
+    """
+    xml_notification: Optional[_Element] = etree.fromstring(notification, parser=PARSER)
+    if strip_namespaces and xml_notification is not None:
+        xml_notification = remove_namespaces(xml_notification)
+    return xml_notification
+
+
+def is_notification_complete(xml_notification: _Element) -> bool:
+    """
+    Check if a notification is the last one of its subscription
+
+    Args:
+        xml_notification: lxml element of the notification
+
+    Returns:
+        bool: True if the notification signals the end of the subscription
+
+    Raises:
+        N/A
+
+    """
+    return xml_notification.find(NOTIFICATION_COMPLETE_TAG) is not None
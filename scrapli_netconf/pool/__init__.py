@@ -0,0 +1,9 @@
+"""scrapli_netconf.pool"""
+
+from scrapli_netconf.pool.async_pool import AsyncNetconfConnectionPool
+from scrapli_netconf.pool.sync_pool import NetconfConnectionPool
+
+__all__ = (
+    "AsyncNetconfConnectionPool",
+    "NetconfConnectionPool",
+)
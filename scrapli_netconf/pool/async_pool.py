@@ -0,0 +1,392 @@
+"""scrapli_netconf.pool.async_pool"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, AsyncIterator, List, Optional, Type
+
+from scrapli.exceptions import (
+    ScrapliCommandFailure,
+    ScrapliConnectionNotOpened,
+    ScrapliException,
+    ScrapliTimeout,
+)
+from scrapli_netconf.driver.async_driver import AsyncNetconfDriver
+from scrapli_netconf.pool.base_pool import (
+    HEALTH_CHECK_RPC,
+    LOG,
+    BaseNetconfConnectionPool,
+    IdleSession,
+    PoolKey,
+)
+
+
+class AsyncNetconfConnectionPool(BaseNetconfConnectionPool[AsyncNetconfDriver]):
+    def __init__(
+        self,
+        max_sessions_per_host: int = 2,
+        max_idle_time: float = 300.0,
+        health_check_idle_time: float = 30.0,
+        timeout_checkout: float = 30.0,
+    ) -> None:
+        """
+        Pool of open AsyncNetconfDriver sessions
+
+        Sessions are handed out with the `connection` async context manager and returned to the
+        pool when the context exits, saving the ssh handshake and capabilities exchange for every
+        use.
+
+        Args:
+            max_sessions_per_host: maximum number of open sessions (in use and idle) to any one host
+            max_idle_time: seconds a session may sit idle in the pool before it is closed
+            health_check_idle_time: sessions idle for longer than this many seconds are sent a
+                cheap rpc to make sure they are still alive before being handed out
+            timeout_checkout: seconds to wait for a session to a host to become available when the
+                host already has `max_sessions_per_host` sessions in use
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            N/A
+
+        """
+        super().__init__(
+            max_sessions_per_host=max_sessions_per_host,
+            max_idle_time=max_idle_time,
+            health_check_idle_time=health_check_idle_time,
+            timeout_checkout=timeout_checkout,
+        )
+
+        # created on first use so that it belongs to the running event loop
+        self._condition: Optional[asyncio.Condition] = None
+
+    async def __aenter__(self) -> "AsyncNetconfConnectionPool":
+        """
+        Enter method for context manager
+
+        Args:
+            N/A
+
+        Returns:
+            AsyncNetconfConnectionPool: the pool itself
+
+        Raises:
+            N/A
+
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Exit method to cleanup for async context manager
+
+        Args:
+            exception_type: exception type being raised
+            exception_value: message from exception being raised
+            traceback: traceback from exception being raised
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        await self.close()
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        """
+        Getter for 'condition' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            asyncio.Condition: condition guarding the pool state
+
+        Raises:
+            N/A
+
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @staticmethod
+    async def _close_sessions(conns: List[AsyncNetconfDriver]) -> None:
+        """
+        Close sessions that have been taken out of the pool
+
+        Args:
+            conns: drivers to close
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception as exc:  # pylint: disable=W0703
+                LOG.warning("failed closing pooled session to %s: %s", conn.host, exc)
+
+    @staticmethod
+    async def _is_healthy(session: IdleSession[AsyncNetconfDriver]) -> bool:
+        """
+        Check an idle session is still responsive
+
+        Any reply at all (even an rpc-error) means the session is good.
+
+        Args:
+            session: idle session
+
+        Returns:
+            bool: True if the session is usable
+
+        Raises:
+            N/A
+
+        """
+        if not session.conn.isalive():
+            return False
+
+        try:
+            await session.conn.rpc(filter_=HEALTH_CHECK_RPC)
+        except ScrapliException as exc:
+            LOG.info("pooled session to %s failed health check: %s", session.conn.host, exc)
+            return False
+
+        return True
+
+    async def _check_idle_session(self, session: IdleSession[AsyncNetconfDriver]) -> bool:
+        """
+        Health check an idle session taken out of the pool (if it is due one), giving up its slot
+        if it is not usable
+
+        Args:
+            session: idle session
+
+        Returns:
+            bool: True if the session is usable
+
+        Raises:
+            BaseException: anything raised while health checking the session, after giving up its
+                slot
+
+        """
+        try:
+            healthy = not self._needs_health_check(session=session) or await self._is_healthy(
+                session=session
+            )
+        except BaseException:
+            await self._discard(conn=session.conn)
+            raise
+
+        if not healthy:
+            await self._discard(conn=session.conn)
+        return healthy
+
+    async def _checkout(self, key: PoolKey, driver_kwargs: Any) -> AsyncNetconfDriver:
+        """
+        Take a session out of the pool, opening a new one if there is no idle one to use
+
+        Args:
+            key: pool key of the session
+            driver_kwargs: arguments to create the driver with
+
+        Returns:
+            AsyncNetconfDriver: open driver
+
+        Raises:
+            ScrapliConnectionNotOpened: if the pool has been closed
+            ScrapliTimeout: if no session to the host became available within `timeout_checkout`
+            BaseException: anything raised while opening a new session (or health checking an idle
+                one), after giving up its slot
+
+        """
+        host = driver_kwargs.get("host", "")
+        deadline = time.monotonic() + self.timeout_checkout
+
+        while True:
+            to_close: List[AsyncNetconfDriver] = []
+            session: Optional[IdleSession[AsyncNetconfDriver]] = None
+
+            try:
+                async with self.condition:
+                    while True:
+                        if self.closed:
+                            raise ScrapliConnectionNotOpened("connection pool is closed")
+
+                        to_close.extend(self._evict_expired_sessions())
+
+                        session = self._take_idle_session(key=key)
+                        if session is not None:
+                            break
+
+                        if self._reserve_session(host=host):
+                            break
+
+                        # at the limit for the host, make room by closing an idle session to it
+                        # (for other arguments) if there is one
+                        evicted = self._evict_session_for_host(host=host)
+                        if evicted is not None:
+                            to_close.append(evicted)
+                            continue
+
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise ScrapliTimeout(
+                                f"timed out waiting for a pooled session to {host}"
+                            )
+                        try:
+                            await asyncio.wait_for(self.condition.wait(), timeout=remaining)
+                        except asyncio.TimeoutError:
+                            pass
+            finally:
+                await self._close_sessions(conns=to_close)
+
+            if session is None:
+                LOG.debug("opening new pooled session to %s", host)
+                conn = AsyncNetconfDriver(**driver_kwargs)
+                try:
+                    await conn.open()
+                except BaseException:
+                    await self._discard(conn=conn)
+                    raise
+                return conn
+
+            if await self._check_idle_session(session=session):
+                return session.conn
+
+    async def _checkin(self, key: PoolKey, conn: AsyncNetconfDriver) -> None:
+        """
+        Return a session to the pool
+
+        Args:
+            key: pool key of the session
+            conn: driver of the session
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        async with self.condition:
+            if not self.closed:
+                self._return_session(key=key, conn=conn)
+                self.condition.notify()
+                return
+
+        await self._discard(conn=conn)
+
+    async def _discard(self, conn: AsyncNetconfDriver) -> None:
+        """
+        Close a session that is not going back in the pool
+
+        Args:
+            conn: driver of the session
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        async with self.condition:
+            self._release_session(host=conn.host)
+            self.condition.notify()
+
+        await self._close_sessions(conns=[conn])
+
+    @asynccontextmanager
+    async def connection(self, **driver_kwargs: Any) -> AsyncIterator[AsyncNetconfDriver]:
+        """
+        Check out an open session from the pool for the duration of the context
+
+        The session is returned to the pool when the context exits; if the context exits with an
+        exception other than `ScrapliCommandFailure` (which means the device replied just fine) the
+        state of the session is unknown, so it is closed instead.
+
+        Args:
+            driver_kwargs: arguments to create the AsyncNetconfDriver with, i.e. host, auth_username
+
+        Yields:
+            AsyncNetconfDriver: open driver
+
+        Raises:
+            ScrapliCommandFailure: re-raised from the context, the session is kept in the pool
+
+        """
+        key = self._pool_key(driver_kwargs=driver_kwargs)
+        conn = await self._checkout(key=key, driver_kwargs=driver_kwargs)
+
+        reusable = False
+        try:
+            yield conn
+            reusable = True
+        except ScrapliCommandFailure:
+            reusable = True
+            raise
+        finally:
+            if reusable:
+                await self._checkin(key=key, conn=conn)
+            else:
+                await self._discard(conn=conn)
+
+    async def evict_idle(self) -> None:
+        """
+        Close all sessions that have been idle for longer than `max_idle_time`
+
+        This happens anyway whenever a session is checked out, but can be called periodically to
+        not hold sessions open on devices that have not been used in a while.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        async with self.condition:
+            to_close = self._evict_expired_sessions()
+            self.condition.notify_all()
+
+        await self._close_sessions(conns=to_close)
+
+    async def close(self) -> None:
+        """
+        Close the pool and all idle sessions; sessions in use are closed when they are returned
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        async with self.condition:
+            self.closed = True
+            to_close = self._evict_all_sessions()
+            self.condition.notify_all()
+
+        await self._close_sessions(conns=to_close)
@@ -0,0 +1,254 @@
+"""scrapli_netconf.pool.base_pool"""
+
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Deque, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar
+
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.driver.base_driver import NetconfBaseDriver
+
+LOG = getLogger("scrapli_netconf.pool")
+
+# an empty subtree filter selects nothing at all (RFC 6241 section 6.4.2), so this makes for about
+# the cheapest rpc there is to check a session is still responsive
+HEALTH_CHECK_RPC = "<get><filter type='subtree'/></get>"
+
+DriverT = TypeVar("DriverT", bound=NetconfBaseDriver)
+PoolKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass()
+class IdleSession(Generic[DriverT]):
+    conn: DriverT
+    idle_since: float
+
+
+class BaseNetconfConnectionPool(Generic[DriverT]):
+    def __init__(
+        self,
+        max_sessions_per_host: int = 2,
+        max_idle_time: float = 300.0,
+        health_check_idle_time: float = 30.0,
+        timeout_checkout: float = 30.0,
+    ) -> None:
+        """
+        Base connection pool for netconf drivers
+
+        Sessions are pooled by the full set of arguments the driver is created with (so by host,
+        credentials and any other settings), and are capped per host across all of those.
+
+        Args:
+            max_sessions_per_host: maximum number of open sessions (in use and idle) to any one host
+            max_idle_time: seconds a session may sit idle in the pool before it is closed
+            health_check_idle_time: sessions idle for longer than this many seconds are sent a
+                cheap rpc to make sure they are still alive before being handed out
+            timeout_checkout: seconds to wait for a session to a host to become available when the
+                host already has `max_sessions_per_host` sessions in use
+
+        Returns:
+            N/A  # noqa: DAR202
+
+        Raises:
+            ScrapliValueError: if `max_sessions_per_host` is less than one
+
+        """
+        if max_sessions_per_host < 1:
+            raise ScrapliValueError("`max_sessions_per_host` must be at least one")
+
+        self.max_sessions_per_host = max_sessions_per_host
+        self.max_idle_time = max_idle_time
+        self.health_check_idle_time = health_check_idle_time
+        self.timeout_checkout = timeout_checkout
+
+        self.closed = False
+
+        self._idle: Dict[PoolKey, Deque[IdleSession[DriverT]]] = defaultdict(deque)
+        self._sessions_per_host: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _pool_key(driver_kwargs: Mapping[str, Any]) -> PoolKey:
+        """
+        Build the key sessions created with the given driver arguments are pooled under
+
+        Args:
+            driver_kwargs: arguments to create the driver with
+
+        Returns:
+            PoolKey: hashable key of the driver arguments
+
+        Raises:
+            N/A
+
+        """
+        return tuple(sorted((name, repr(value)) for name, value in driver_kwargs.items()))
+
+    def _take_idle_session(self, key: PoolKey) -> Optional[IdleSession[DriverT]]:
+        """
+        Take the most recently used idle session for the given key out of the pool, if any
+
+        Args:
+            key: pool key of the session
+
+        Returns:
+            Optional[IdleSession]: idle session or None if there are none
+
+        Raises:
+            N/A
+
+        """
+        idle = self._idle.get(key)
+        if not idle:
+            return None
+        return idle.pop()
+
+    def _reserve_session(self, host: str) -> bool:
+        """
+        Reserve a session to host, if the host is not already at its session limit
+
+        Args:
+            host: host the session is for
+
+        Returns:
+            bool: True if a session was reserved
+
+        Raises:
+            N/A
+
+        """
+        if self._sessions_per_host[host] >= self.max_sessions_per_host:
+            return False
+        self._sessions_per_host[host] += 1
+        return True
+
+    def _release_session(self, host: str) -> None:
+        """
+        Release a session to host that has been (or is about to be) closed
+
+        Args:
+            host: host the session is for
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._sessions_per_host[host] -= 1
+        if not self._sessions_per_host[host]:
+            del self._sessions_per_host[host]
+
+    def _return_session(self, key: PoolKey, conn: DriverT) -> None:
+        """
+        Put a session back in the pool as idle
+
+        Args:
+            key: pool key of the session
+            conn: driver of the session
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._idle[key].append(IdleSession(conn=conn, idle_since=time.monotonic()))
+
+    def _evict_expired_sessions(self) -> List[DriverT]:
+        """
+        Take all sessions that have been idle for longer than `max_idle_time` out of the pool
+
+        Args:
+            N/A
+
+        Returns:
+            List[DriverT]: evicted drivers, to be closed by the caller
+
+        Raises:
+            N/A
+
+        """
+        expired_since = time.monotonic() - self.max_idle_time
+        evicted = []
+
+        for key, idle in list(self._idle.items()):
+            # sessions are always returned to the right, so the oldest are on the left
+            while idle and idle[0].idle_since < expired_since:
+                evicted.append(idle.popleft().conn)
+            if not idle:
+                del self._idle[key]
+
+        for conn in evicted:
+            self._release_session(host=conn.host)
+
+        return evicted
+
+    def _evict_session_for_host(self, host: str) -> Optional[DriverT]:
+        """
+        Take the longest idle session to host (for any key) out of the pool to make room for another
+
+        Args:
+            host: host to make room for
+
+        Returns:
+            Optional[DriverT]: evicted driver, to be closed by the caller, or None if there were no
+                idle sessions to the host
+
+        Raises:
+            N/A
+
+        """
+        oldest: Optional[Deque[IdleSession[DriverT]]] = None
+
+        for idle in self._idle.values():
+            if idle and idle[0].conn.host == host:
+                if oldest is None or idle[0].idle_since < oldest[0].idle_since:
+                    oldest = idle
+
+        if oldest is None:
+            return None
+
+        conn = oldest.popleft().conn
+        self._release_session(host=host)
+        return conn
+
+    def _evict_all_sessions(self) -> List[DriverT]:
+        """
+        Take all idle sessions out of the pool
+
+        Args:
+            N/A
+
+        Returns:
+            List[DriverT]: evicted drivers, to be closed by the caller
+
+        Raises:
+            N/A
+
+        """
+        evicted = [session.conn for idle in self._idle.values() for session in idle]
+        self._idle.clear()
+
+        for conn in evicted:
+            self._release_session(host=conn.host)
+
+        return evicted
+
+    def _needs_health_check(self, session: IdleSession[DriverT]) -> bool:
+        """
+        Determine if an idle session should be health checked before handing it out
+
+        Args:
+            session: idle session
+
+        Returns:
+            bool: True if the session should be checked
+
+        Raises:
+            N/A
+
+        """
+        return time.monotonic() - session.idle_since >= self.health_check_idle_time
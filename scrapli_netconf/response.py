@@ -2,8 +2,9 @@
 
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TextIO, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Union
 
 from lxml import etree
 from lxml.etree import Element
@@ -11,12 +12,13 @@ from lxml.etree import Element
 from scrapli.exceptions import ScrapliCommandFailure
 from scrapli.response import Response
 from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.exceptions import InvalidMessageFraming
+from scrapli_netconf.framing import decode_chunked_message
 from scrapli_netconf.helper import remove_namespaces
 
 LOG = logging.getLogger("response")
 
-NEW_LINE_BYTE = 10
-CHUNK_1_1_DELIMITER_BYTE = 35
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>'
 
 # CONTROL_CHARS matches control chars we do not want to see in text output, such as \x07 (terminal
 # bell). See #127 for more details.
@@ -29,12 +31,13 @@ class NetconfResponse(Response):
     # intentionally overriding base class' list of strings for failed when contains
     failed_when_contains: List[bytes]  # type: ignore[assignment]
 
-    def __init__(
+    def __init__(  # pylint: disable=R0917
         self,
         netconf_version: NetconfVersion,
-        xml_input: Element,
+        xml_input: Union[Element, Callable[[], Element]],
         strip_namespaces: bool = True,
         failed_when_contains: Optional[Union[bytes, List[bytes]]] = None,
+        build_result: bool = True,
         **kwargs: Any,
     ):
         """
@@ -45,13 +48,19 @@ class NetconfResponse(Response):
 
         Args:
             netconf_version: string of netconf version; `1.0`|`1.1`
-            xml_input: lxml Element of input to be sent to device
+            xml_input: lxml Element of input to be sent to device, or a function building it -- the
+                function is only called the first time `xml_input` is accessed
             strip_namespaces: strip out all namespaces if True, otherwise ignore them
             failed_when_contains: list of bytes that, if present in final output, represent a
                 failed command/interaction -- should generally be left alone for netconf. Note that
                 this differs from the base scrapli Response object as we want to be parsing/checking
                 for these strings in raw byte strings we get back from the device
-            kwargs: kwargs for instantiation of scrapli Response object supertype
+            build_result: build the pretty printed `result` string (on first access) if True,
+                otherwise `result` is always an empty string -- useful if only ever using the
+                `xml_result` element as it saves serializing the whole reply a second time
+            kwargs: kwargs for instantiation of scrapli Response object supertype -- unlike the
+                supertype `channel_input` may be bytes, in which case the string is only decoded
+                from it if it is asked for
 
         Returns:
             N/A  # noqa: DAR202
@@ -64,9 +73,19 @@ class NetconfResponse(Response):
             raise ValueError(f"`netconf_version` should be one of 1.0|1.1, got `{netconf_version}`")
 
         self.netconf_version = netconf_version
-        self.xml_input = xml_input
+        self._xml_input: Optional[Element] = None
+        self._xml_input_builder: Optional[Callable[[], Element]] = None
+        if callable(xml_input):
+            self._xml_input_builder = xml_input
+        else:
+            self._xml_input = xml_input
         self.strip_namespaces = strip_namespaces
-        self.xml_result: Element
+        self.build_result = build_result
+        self._xml_result: Optional[Element] = None
+        self._serialized_xml_result: Optional[bytes] = None
+        self._result: Optional[str] = None
+        self.raw_channel_input = b""
+        self._channel_input: Optional[str] = None
 
         super().__init__(**kwargs)
 
@@ -85,12 +104,177 @@ class NetconfResponse(Response):
 
         self.error_messages: List[str] = []
 
-    def record_response(self, result: bytes) -> None:
+    @property
+    def channel_input(self) -> str:
+        """
+        Getter for 'channel_input' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            str: input that got sent down the channel
+
+        Raises:
+            N/A
+
+        """
+        if self._channel_input is None:
+            self._channel_input = self.raw_channel_input.decode()
+        return self._channel_input
+
+    @channel_input.setter
+    def channel_input(self, value: Union[str, bytes]) -> None:
+        """
+        Setter for 'channel_input' attribute
+
+        Args:
+            value: input that got sent down the channel, as a string or bytes
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(value, bytes):
+            self.raw_channel_input = value
+            self._channel_input = None
+            return
+
+        self.raw_channel_input = value.encode()
+        self._channel_input = value
+
+    @property
+    def xml_input(self) -> Element:
+        """
+        Getter for 'xml_input' attribute
+
+        Args:
+            N/A
+
+        Returns:
+            Element: lxml element of input to be sent to device
+
+        Raises:
+            N/A
+
+        """
+        if self._xml_input_builder is not None:
+            self._xml_input = self._xml_input_builder()
+            self._xml_input_builder = None
+        return self._xml_input
+
+    @xml_input.setter
+    def xml_input(self, value: Element) -> None:
+        """
+        Setter for 'xml_input' attribute
+
+        Args:
+            value: lxml element of input to be sent to device
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._xml_input = value
+        self._xml_input_builder = None
+
+    @property
+    def xml_result(self) -> Element:
+        """
+        Getter for 'xml_result' attribute
+
+        When the reply was parsed elsewhere (see `record_parsed_reply`) the element is only
+        rebuilt from the serialized reply the first time it is accessed.
+
+        Args:
+            N/A
+
+        Returns:
+            Element: lxml element of the reply, None if there is no (parsable) reply
+
+        Raises:
+            N/A
+
+        """
+        if self._xml_result is None and self._serialized_xml_result is not None:
+            self._xml_result = etree.fromstring(self._serialized_xml_result, parser=PARSER)
+            self._serialized_xml_result = None
+        return self._xml_result
+
+    @xml_result.setter
+    def xml_result(self, value: Element) -> None:
+        """
+        Setter for 'xml_result' attribute
+
+        Args:
+            value: lxml element of the reply
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._xml_result = value
+        self._serialized_xml_result = None
+
+    @property
+    def result(self) -> str:
+        """
+        Getter for 'result' attribute
+
+        The pretty printed result string is only built the first time it is accessed (and then
+        cached), as most consumers only ever need the `xml_result` element.
+
+        Args:
+            N/A
+
+        Returns:
+            str: pretty printed xml result string
+
+        Raises:
+            N/A
+
+        """
+        if self._result is None:
+            if self.build_result and self.xml_result is not None:
+                self._result = etree.tostring(self.xml_result, pretty_print=True).decode()
+            else:
+                self._result = ""
+        return self._result
+
+    @result.setter
+    def result(self, value: str) -> None:
+        """
+        Setter for 'result' attribute
+
+        Args:
+            value: string value for result
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._result = value
+
+    def record_response(self, result: bytes, deframed: bool = False) -> None:
         """
         Record channel_input results and elapsed time of channel input/reading output
 
         Args:
             result: bytes result of channel_input
+            deframed: True if result is the netconf 1.1 payload already de-framed by the channel,
+                otherwise result is the chunk framed reply
 
         Returns:
             N/A
@@ -111,31 +295,70 @@ class NetconfResponse(Response):
         if self.netconf_version == NetconfVersion.VERSION_1_0:
             self._record_response_netconf_1_0()
         else:
-            self._record_response_netconf_1_1()
+            self._record_response_netconf_1_1(deframed=deframed)
 
         if self.failed:
             self._fetch_error_messages()
 
-    @classmethod
-    def _parse_raw_result(cls, raw_result: bytes) -> bytes:
+    def record_parsed_reply(self, result: bytes, parsed_reply: "ParsedReply") -> None:
+        """
+        Record channel_input results that have already been parsed, see `parse_reply`
+
+        Args:
+            result: bytes result of channel_input
+            parsed_reply: the parsed result
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.finish_time = datetime.now()
+        self.elapsed_time = (self.finish_time - self.start_time).total_seconds()
+        self.raw_result = result
+
+        self.failed = parsed_reply.failed
+        self.error_messages = parsed_reply.error_messages
+
+        # xml_result (and so result) is rebuilt from the serialized reply on first access
+        self.xml_result = None
+        self._serialized_xml_result = parsed_reply.xml
+        self._result = None
+
+    def _parse(self, payload: bytes) -> Optional[Element]:
+        """
+        Parse payload into an lxml Element, stripping namespaces if configured to do so
+
+        Args:
+            payload: xml bytes to parse
+
+        Returns:
+            Element: parsed lxml Element, or None if nothing could be parsed
+
+        Raises:
+            N/A
+
+        """
+        parsed_result: Optional[Element] = etree.fromstring(payload, parser=PARSER)
+
+        if self.strip_namespaces and parsed_result is not None:
+            parsed_result = remove_namespaces(parsed_result)
+
+        return parsed_result
+
+    def _parse_raw_result(self, raw_result: bytes) -> Optional[Element]:
         # remove the message end characters and xml document header see:
         # https://github.com/scrapli/scrapli_netconf/issues/1
-        _raw_result = raw_result.replace(b"]]>]]>", b"").replace(
-            b'<?xml version="1.0" encoding="UTF-8"?>', b""
-        )
+        _raw_result = raw_result.replace(b"]]>]]>", b"").replace(XML_DECLARATION, b"")
 
-        parsed_result: Union[bytes, None] = etree.fromstring(
-            _raw_result,
-            parser=PARSER,
-        )
+        parsed_result = self._parse(_raw_result)
 
         if parsed_result is None:
             # if we failed to parse, try again after stripping out control chars, if we still
             # end up with None, oh well, raise an exception later on down the road
-            parsed_result = etree.fromstring(
-                CONTROL_CHARS.sub(b"", _raw_result),
-                parser=PARSER,
-            )
+            parsed_result = self._parse(CONTROL_CHARS.sub(b"", _raw_result))
 
         return parsed_result
 
@@ -155,18 +378,15 @@ class NetconfResponse(Response):
         """
         self.xml_result = self._parse_raw_result(self.raw_result)
 
-        if self.strip_namespaces:
-            self.xml_result = remove_namespaces(self.xml_result)
-            self.result = etree.tostring(self.xml_result, pretty_print=True).decode()
-        else:
-            self.result = etree.tostring(self.xml_result, pretty_print=True).decode()
+        # result is built from xml_result on first access
+        self._result = None
 
-    def _record_response_netconf_1_1(self) -> None:
+    def _record_response_netconf_1_1(self, deframed: bool) -> None:
         """
         Record response for netconf version 1.1
 
         Args:
-            N/A
+            deframed: True if raw_result has already been de-framed
 
         Returns:
             N/A
@@ -175,77 +395,26 @@ class NetconfResponse(Response):
             N/A
 
         """
-        _raw_result = self.raw_result.strip()
-
-        if not _raw_result or not _raw_result.startswith(b"#"):
-            LOG.critical("unable to parse netconf response: no chunk marker at start of data")
-            self.failed = True
-
-            return
-
-        chunks: List[bytes] = []
-
-        cursor = 0
-
-        while cursor < len(_raw_result):
-            if _raw_result[cursor] == NEW_LINE_BYTE:
-                cursor += 1
-
-                continue
-
-            if _raw_result[cursor] != CHUNK_1_1_DELIMITER_BYTE:
-                LOG.critical(
-                    "unable to parse netconf response: chunk marker missing, got "
-                    f"{_raw_result[cursor]}",
-                )
-                self.failed = True
-
-                return
-
-            cursor += 1
-
-            if _raw_result[cursor] == CHUNK_1_1_DELIMITER_BYTE:
-                break
-
-            chunk_size: int = 0
-
-            for chunk_size_cursor in range(cursor, cursor + 10):
-                if _raw_result[chunk_size_cursor] == NEW_LINE_BYTE:
-                    chunk_size = int(_raw_result[cursor:chunk_size_cursor])
-
-                    cursor = chunk_size_cursor + 1
-
-                    break
-
-            if not chunk_size:
-                LOG.critical(
-                    "unable to parse netconf response: failed parsing chunk size",
-                )
+        if deframed:
+            payload = self.raw_result
+        else:
+            try:
+                payload = decode_chunked_message(self.raw_result)
+            except InvalidMessageFraming as exc:
+                LOG.critical("unable to parse netconf response: %s", exc)
                 self.failed = True
 
                 return
 
-            chunks.append(_raw_result[cursor : cursor + chunk_size])  # noqa: E203
+        if XML_DECLARATION in payload:
+            # remove the xml document header see:
+            # https://github.com/scrapli/scrapli_netconf/issues/1
+            payload = payload.replace(XML_DECLARATION, b"")
 
-            cursor += chunk_size
+        self.xml_result = self._parse(payload)
 
-        self.xml_result = etree.fromstring(
-            b"".join(
-                [
-                    # remove the message end characters and xml document header see:
-                    # https://github.com/scrapli/scrapli_netconf/issues/1
-                    chunk.replace(b'<?xml version="1.0" encoding="UTF-8"?>', b"")
-                    for chunk in chunks
-                ]
-            ),
-            parser=PARSER,
-        )
-
-        if self.strip_namespaces:
-            self.xml_result = remove_namespaces(self.xml_result)
-            self.result = etree.tostring(self.xml_result, pretty_print=True).decode()
-        else:
-            self.result = etree.tostring(self.xml_result, pretty_print=True).decode()
+        # result is built from xml_result on first access
+        self._result = None
 
     def _fetch_error_messages(self) -> None:
         """
@@ -355,3 +524,185 @@ class NetconfResponse(Response):
             raise ScrapliCommandFailure(
                 f"operation failed, reported rpc errors: {self.error_messages}"
             )
+
+
+@dataclass()
+class ParsedReply:
+    xml: Optional[bytes]
+    failed: bool
+    error_messages: List[str]
+
+
+def parse_reply(
+    result: bytes,
+    netconf_version: NetconfVersion,
+    strip_namespaces: bool = True,
+    failed_when_contains: Optional[List[bytes]] = None,
+    deframed: bool = False,
+) -> ParsedReply:
+    """
+    Parse a reply exactly as `NetconfResponse.record_response` would, returning picklable results
+
+    This allows for parsing replies in another process (i.e. with a ProcessPoolExecutor), which
+    matters when parsing large replies for many devices as parsing otherwise all happens on one
+    core; the results are recorded with `NetconfResponse.record_parsed_reply`.
+
+    Args:
+        result: bytes result of channel_input
+        netconf_version: netconf version of the reply
+        strip_namespaces: strip out all namespaces if True, otherwise ignore them
+        failed_when_contains: list of bytes that, if present in final output, represent a failure
+        deframed: True if result is the netconf 1.1 payload already de-framed by the channel
+
+    Returns:
+        ParsedReply: serialized xml of the parsed reply, if it failed, and any error messages
+
+    Raises:
+        N/A
+
+    """
+    response = NetconfResponse(
+        host="",
+        channel_input="",
+        xml_input=None,
+        netconf_version=netconf_version,
+        strip_namespaces=strip_namespaces,
+        failed_when_contains=failed_when_contains,
+        build_result=False,
+    )
+    response.record_response(result=result, deframed=deframed)
+
+    xml_result = response.xml_result
+    return ParsedReply(
+        xml=etree.tostring(xml_result) if xml_result is not None else None,
+        failed=response.failed,
+        error_messages=response.error_messages,
+    )
+
+
+class NetconfDataStream:
+    def __init__(self, strip_namespaces: bool = True) -> None:
+        """
+        Scrapli Netconf NetconfDataStream
+
+        Incrementally parse a reply as it is read off of the channel, yielding each element under
+        the reply's "data" element as soon as it has been completely parsed. Yielded elements are
+        removed from the (partial) reply tree, so once the caller is done with an element it can be
+        garbage collected -- this keeps memory use down to roughly one subtree rather than the whole
+        reply (plus the raw bytes, plus a string copy) that NetconfResponse holds.
+
+        Args:
+            strip_namespaces: strip out all namespaces of yielded elements if True
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.strip_namespaces = strip_namespaces
+        self.error_messages: List[str] = []
+
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"), remove_blank_text=True, recover=True
+        )
+        self._depth = 0
+        self._in_data = False
+
+    def feed(self, data: bytes) -> Iterator[Element]:
+        """
+        Feed (de-framed) reply bytes to the parser
+
+        Args:
+            data: part of the reply payload
+
+        Yields:
+            Element: each completely parsed child of the reply's "data" element
+
+        Raises:
+            N/A
+
+        """
+        self._parser.feed(data)
+        yield from self._read_events()
+
+    def close(self) -> Iterator[Element]:
+        """
+        Signal the end of the reply to the parser
+
+        Args:
+            N/A
+
+        Yields:
+            Element: any remaining completely parsed children of the reply's "data" element
+
+        Raises:
+            N/A
+
+        """
+        self._parser.close()
+        yield from self._read_events()
+
+    def _read_events(self) -> Iterator[Element]:
+        """
+        Process any pending parser events
+
+        Args:
+            N/A
+
+        Yields:
+            Element: each completely parsed child of the reply's "data" element
+
+        Raises:
+            N/A
+
+        """
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+
+                if self._depth == 2 and etree.QName(element).localname == "data":
+                    self._in_data = True
+
+                continue
+
+            self._depth -= 1
+
+            if self._depth == 2 and self._in_data:
+                element.getparent().remove(element)
+
+                if self.strip_namespaces:
+                    element = remove_namespaces(element)
+
+                yield element
+            elif self._depth == 1:
+                if etree.QName(element).localname == "data":
+                    self._in_data = False
+                elif etree.QName(element).localname == "rpc-error":
+                    self.error_messages.extend(
+                        err.text.strip()
+                        for err in element.iterfind("{*}error-message")
+                        if err.text is not None
+                    )
+
+                element.getparent().remove(element)
+
+    def raise_for_status(self) -> None:
+        """
+        Raise a `ScrapliCommandFailure` if the reply contained any rpc errors
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            ScrapliCommandFailure: if the reply contained any rpc errors
+
+        """
+        if self.error_messages:
+            raise ScrapliCommandFailure(
+                f"operation failed, reported rpc errors: {self.error_messages}"
+            )
@@ -0,0 +1,116 @@
+"""scrapli_netconf.transport.base_transport"""
+
+import time
+from typing import Callable, Optional
+
+from scrapli.transport.base import BaseTransportArgs
+
+# default size of the chunks writes are split into, overridable with the transport option
+# `netconf_write_chunk_size`; a size of zero (or less) writes everything in one go
+DEFAULT_WRITE_CHUNK_SIZE = 65535
+# how long to back off for when a write would block and there is no better way to wait
+WRITE_BLOCKED_SLEEP = 0.001
+
+
+class BaseNetconfTransport:
+    _base_transport_args: BaseTransportArgs
+    _write_chunk_size: Optional[int] = None
+
+    @property
+    def write_chunk_size(self) -> int:
+        """
+        Getter for `write_chunk_size` attribute
+
+        Defaults to the `netconf_write_chunk_size` transport option if one was provided, otherwise
+        to `DEFAULT_WRITE_CHUNK_SIZE`.
+
+        Args:
+            N/A
+
+        Returns:
+            int: size of chunks to write to the transport
+
+        Raises:
+            N/A
+
+        """
+        if self._write_chunk_size is None:
+            self._write_chunk_size = int(
+                self._base_transport_args.transport_options.get(
+                    "netconf_write_chunk_size", DEFAULT_WRITE_CHUNK_SIZE
+                )
+            )
+        return self._write_chunk_size
+
+    @write_chunk_size.setter
+    def write_chunk_size(self, value: int) -> None:
+        """
+        Setter for `write_chunk_size` attribute
+
+        Args:
+            value: int value for write_chunk_size
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._write_chunk_size = value
+
+    def _wait_writable(self) -> None:
+        """
+        Wait for the transport to be able to accept more input after a write would have blocked
+
+        Transports that can wait on something better than a short sleep should override this.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        time.sleep(WRITE_BLOCKED_SLEEP)
+
+    def _write_chunked(
+        self, channel_input: bytes, write: Callable[[memoryview], Optional[int]]
+    ) -> None:
+        """
+        Write bytes to the transport in chunks of (at most) `write_chunk_size` bytes
+
+        Chunks are slices of a memoryview over the input, so nothing is copied on the way to the
+        transport. The `write` callable must return how many bytes of the chunk it actually wrote
+        -- the next chunk starts from there, so partial writes are picked up where they left off --
+        or None if the write would have blocked, in which case we wait for the transport to drain
+        before trying again. Any timeout is left to the channel, which wraps its writes in the
+        operation timeout.
+
+        Args:
+            channel_input: bytes to write to the transport
+            write: callable writing a chunk to the transport
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        chunk_size = self.write_chunk_size
+        bytes_to_send_len = len(channel_input)
+        if chunk_size <= 0:
+            chunk_size = bytes_to_send_len
+
+        bytes_sent = 0
+        with memoryview(channel_input) as bytes_to_send:
+            while bytes_sent < bytes_to_send_len:
+                written = write(bytes_to_send[bytes_sent : bytes_sent + chunk_size])
+                if written is None:
+                    self._wait_writable()
+                    continue
+                bytes_sent += written
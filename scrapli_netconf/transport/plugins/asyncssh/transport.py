@@ -33,8 +33,8 @@ class NetconfAsyncsshTransport(AsyncsshTransport):
         """
         if self.plugin_transport_args.auth_strict_key:
             self.logger.debug(
-                f"Attempting to validate {self._base_transport_args.host} public key is in known "
-                f"hosts"
+                "Attempting to validate %s public key is in known hosts",
+                self._base_transport_args.host,
             )
             self._verify_key()
 
@@ -110,7 +110,7 @@ class NetconfAsyncsshTransport(AsyncsshTransport):
 
         if self.plugin_transport_args.auth_strict_key:
             self.logger.debug(
-                f"Attempting to validate {self._base_transport_args.host} public key is in known "
-                f"hosts and is valid"
+                "Attempting to validate %s public key is in known hosts and is valid",
+                self._base_transport_args.host,
             )
             self._verify_key_value()
@@ -1,13 +1,16 @@
 """scrapli_netconf.transport.plugins.paramiko.transport"""
 
-from scrapli.exceptions import ScrapliConnectionNotOpened
+from typing import Optional
+
+from scrapli.exceptions import ScrapliConnectionError, ScrapliConnectionNotOpened
 from scrapli.transport.plugins.paramiko.transport import ParamikoTransport, PluginTransportArgs
+from scrapli_netconf.transport.base_transport import BaseNetconfTransport
 
 # imported from base driver
 _ = PluginTransportArgs
 
 
-class NetconfParamikoTransport(ParamikoTransport):
+class NetconfParamikoTransport(ParamikoTransport, BaseNetconfTransport):
     def open_netconf(self) -> None:
         """
         Netconf open method
@@ -46,3 +49,35 @@ class NetconfParamikoTransport(ParamikoTransport):
         self.session_channel = self.session.open_session()
         self._set_timeout(self._base_transport_args.timeout_transport)
         self.session_channel.invoke_subsystem("netconf")
+
+    def write(self, channel_input: bytes) -> None:
+        if not self.session_channel:
+            raise ScrapliConnectionNotOpened
+
+        self._write_chunked(channel_input=channel_input, write=self._send_chunk)
+
+    def _send_chunk(self, chunk: memoryview) -> Optional[int]:
+        """
+        Send a chunk to the session channel
+
+        Paramiko only sends as much of a chunk as fits in the remote window (blocking until there
+        is some room in it), so the chunk may be partially sent.
+
+        Args:
+            chunk: bytes to send
+
+        Returns:
+            Optional[int]: number of bytes sent
+
+        Raises:
+            ScrapliConnectionNotOpened: if session is unopened/None
+            ScrapliConnectionError: if the session channel was closed while sending
+
+        """
+        if not self.session_channel:
+            raise ScrapliConnectionNotOpened
+
+        sent: int = self.session_channel.send(chunk)
+        if sent == 0:
+            raise ScrapliConnectionError("session channel closed while sending input")
+        return sent
@@ -1,13 +1,16 @@
 """scrapli_netconf.transport.plugins.ssh2.transport"""
 
+from typing import Optional
+
 from scrapli.exceptions import ScrapliConnectionNotOpened
 from scrapli.transport.plugins.ssh2.transport import PluginTransportArgs, Ssh2Transport
+from scrapli_netconf.transport.base_transport import BaseNetconfTransport
 
 # imported from base driver
 _ = PluginTransportArgs
 
 
-class NetconfSsh2Transport(Ssh2Transport):
+class NetconfSsh2Transport(Ssh2Transport, BaseNetconfTransport):
     def open_netconf(self) -> bytes:
         """
         Netconf open method
@@ -47,3 +50,32 @@ class NetconfSsh2Transport(Ssh2Transport):
 
         self.session_channel = self.session.open_session()
         self.session_channel.subsystem("netconf")
+
+    def write(self, channel_input: bytes) -> None:
+        if not self.session_channel:
+            raise ScrapliConnectionNotOpened
+
+        self._write_chunked(channel_input=channel_input, write=self._write_chunk)
+
+    def _write_chunk(self, chunk: memoryview) -> Optional[int]:
+        """
+        Write a chunk to the session channel
+
+        ssh2-python only accepts bytes (or str), so unlike the other transports each chunk is copied
+        on its way out.
+
+        Args:
+            chunk: bytes to write
+
+        Returns:
+            Optional[int]: number of bytes written, None if the write would have blocked
+
+        Raises:
+            ScrapliConnectionNotOpened: if session is unopened/None
+
+        """
+        if not self.session_channel:
+            raise ScrapliConnectionNotOpened
+
+        _, bytes_written = self.session_channel.write(chunk.tobytes())
+        return bytes_written or None
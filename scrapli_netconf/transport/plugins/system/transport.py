@@ -1,24 +1,18 @@
 """scrapli_netconf.transport.plugins.system.transport"""
 
-from io import BytesIO
+import os
+import select
+from typing import Optional
 
 from scrapli.exceptions import ScrapliConnectionNotOpened
-from scrapli.transport.base import BaseTransportArgs
 from scrapli.transport.plugins.system.transport import PluginTransportArgs, SystemTransport
+from scrapli_netconf.transport.base_transport import BaseNetconfTransport
 
 # imported from base driver
 _ = PluginTransportArgs
 
 
-class NetconfSystemTransport(SystemTransport):
-    def __init__(
-        self, base_transport_args: BaseTransportArgs, plugin_transport_args: PluginTransportArgs
-    ):
-        self.write_chunk_size = 65535
-        super().__init__(
-            base_transport_args=base_transport_args, plugin_transport_args=plugin_transport_args
-        )
-
+class NetconfSystemTransport(SystemTransport, BaseNetconfTransport):
     def _build_open_cmd(self) -> None:
         super()._build_open_cmd()
 
@@ -33,7 +27,7 @@ class NetconfSystemTransport(SystemTransport):
             self.open_cmd.append("-tt")
 
         self.open_cmd.extend(["-s", "netconf"])
-        self.logger.debug(f"final open_cmd: {self.open_cmd}")
+        self.logger.debug("final open_cmd: %s", self.open_cmd)
 
     def open_netconf(self) -> None:
         """
@@ -57,13 +51,50 @@ class NetconfSystemTransport(SystemTransport):
         if not self.session:
             raise ScrapliConnectionNotOpened
 
-        if self.write_chunk_size <= 0:
-            self.session.write(channel_input)
-        else:
-            bytes_to_send_len = len(channel_input)
-            bytes_to_send = BytesIO(channel_input)
-            bytes_sent = 0
+        self._write_chunked(channel_input=channel_input, write=self._write_pty)
+
+    def _write_pty(self, chunk: memoryview) -> Optional[int]:
+        """
+        Write a chunk straight to the pty file descriptor
+
+        Bypasses the buffered file object of the pty process, which would copy the chunk into its
+        buffer before writing it, and lets us see how much of the chunk the pty actually took.
+
+        Args:
+            chunk: bytes to write
+
+        Returns:
+            Optional[int]: number of bytes written, None if the write would have blocked
+
+        Raises:
+            ScrapliConnectionNotOpened: if session is unopened/None
+
+        """
+        if not self.session:
+            raise ScrapliConnectionNotOpened
+
+        try:
+            return os.write(self.session.fd, chunk)
+        except BlockingIOError:
+            return None
 
-            while bytes_sent < bytes_to_send_len:
-                self.session.write(bytes_to_send.read(self.write_chunk_size))
-                bytes_sent += self.write_chunk_size
+    def _wait_writable(self) -> None:
+        """
+        Wait for the pty to drain enough to accept more input
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            ScrapliConnectionNotOpened: if session is unopened/None
+
+        """
+        if not self.session:
+            raise ScrapliConnectionNotOpened
+
+        select.select(
+            [], [self.session.fd], [], self._base_transport_args.timeout_transport or None
+        )
@@ -0,0 +1,124 @@
+"""
+Benchmark of building requests
+
+Compares building each request by splicing byte templates (`_build_request`) against the previous
+implementation, which parsed the rpc envelope and operation templates into lxml elements,
+inserted them into one another and serialized the result, asserting both produce identical
+channel inputs. Both build the full `NetconfResponse` the operation methods send, and are reported
+as requests built per second on a single core. Run with:
+
+    python tests/benchmark/bench_build_request.py
+"""
+
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from lxml import etree
+
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.driver import NetconfDriver
+from scrapli_netconf.driver.base_driver import NetconfBaseOperations
+from scrapli_netconf.response import NetconfResponse
+
+DURATION = 1.0
+
+FILTER = (
+    '<interfaces xmlns="http://openconfig.net/yang/interfaces"><interface><name>Gi0/0/0/0</name>'
+    "</interface></interfaces>"
+)
+CONFIG = (
+    '<config><cdp xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-cdp-cfg"><timer>80</timer>'
+    "<enable>true</enable><log-adjacency/><hold-time>200</hold-time></cdp></config>"
+)
+
+
+def _response(conn: NetconfDriver, xml_request: etree._Element) -> NetconfResponse:
+    return NetconfResponse(
+        host=conn.host,
+        channel_input=conn._finalize_channel_input(xml_request=xml_request).decode(),
+        xml_input=xml_request,
+        netconf_version=conn.netconf_version,
+        strip_namespaces=conn.strip_namespaces,
+        build_result=conn.build_result,
+    )
+
+
+def legacy_get(conn: NetconfDriver, filter_: str) -> NetconfResponse:
+    xml_request = conn._build_base_elem()
+    xml_request.insert(0, etree.fromstring(NetconfBaseOperations.GET.value))
+    xml_request.find("get").insert(0, conn._build_filter(filter_=filter_))
+    return _response(conn, xml_request)
+
+
+def legacy_edit_config(conn: NetconfDriver, config: str, target: str) -> NetconfResponse:
+    xml_config = etree.fromstring(config, parser=conn.xml_parser)
+    xml_request = conn._build_base_elem()
+    xml_request.insert(
+        0, etree.fromstring(NetconfBaseOperations.EDIT_CONFIG.value.format(target=target))
+    )
+    xml_request.find("edit-config").insert(1, xml_config)
+    return _response(conn, xml_request)
+
+
+def legacy_lock(conn: NetconfDriver, target: str) -> NetconfResponse:
+    xml_request = conn._build_base_elem()
+    xml_request.insert(
+        0,
+        etree.fromstring(
+            NetconfBaseOperations.LOCK.value.format(target=target), parser=conn.xml_parser
+        ),
+    )
+    return _response(conn, xml_request)
+
+
+def legacy_commit(conn: NetconfDriver) -> NetconfResponse:
+    xml_request = conn._build_base_elem()
+    xml_request.insert(
+        0, etree.fromstring(NetconfBaseOperations.COMMIT.value, parser=conn.xml_parser)
+    )
+    return _response(conn, xml_request)
+
+
+OPERATIONS: Dict[str, Tuple[Callable[..., NetconfResponse], Dict[str, Any]]] = {
+    "get": (legacy_get, {"filter_": FILTER}),
+    "edit_config": (legacy_edit_config, {"config": CONFIG, "target": "running"}),
+    "lock": (legacy_lock, {"target": "running"}),
+    "commit": (legacy_commit, {}),
+}
+
+
+def _rate(func: Callable[[], Any]) -> float:
+    count = 0
+    start = time.process_time()
+    while time.process_time() - start < DURATION:
+        for _ in range(100):
+            func()
+        count += 100
+    return count / (time.process_time() - start)
+
+
+def main() -> None:
+    conn = NetconfDriver(host="localhost")
+    conn.netconf_version = NetconfVersion.VERSION_1_1
+    conn.readable_datastores = ["running"]
+    conn.writeable_datastores = ["running"]
+
+    for operation, (legacy_func, kwargs) in OPERATIONS.items():
+        pre_operation = getattr(conn, f"_pre_{operation}")
+
+        conn.message_id = 101
+        legacy = legacy_func(conn, **kwargs)
+        conn.message_id = 101
+        assert pre_operation(**kwargs).channel_input == legacy.channel_input
+
+        legacy_rate = _rate(lambda: legacy_func(conn, **kwargs))
+        template_rate = _rate(lambda: pre_operation(**kwargs))
+
+        print(
+            f"{operation}: legacy {legacy_rate:,.0f} req/s/core, templates {template_rate:,.0f} "
+            f"req/s/core, {template_rate / legacy_rate:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of server capability lookups
+
+Compares the lookups the driver does for each operation against a plain list of capabilities (as
+they used to be stored), with the same lookups against `ServerCapabilities`, for a server
+advertising a few thousand yang modules. Reported as lookups per second on a single core, after
+the (one off) cost of building the index. Run with:
+
+    python tests/benchmark/bench_capabilities.py
+"""
+
+import time
+from typing import Any, Callable, List
+
+from scrapli_netconf.capabilities import ServerCapabilities
+
+DURATION = 1.0
+MODULE_COUNT = 3000
+
+CAPABILITIES = [
+    "urn:ietf:params:netconf:base:1.0",
+    "urn:ietf:params:netconf:base:1.1",
+    "urn:ietf:params:netconf:capability:candidate:1.0",
+    *(
+        f"http://example.com/ns/yang/module-{index}?module=module-{index}&revision=2024-01-01"
+        for index in range(MODULE_COUNT)
+    ),
+    "urn:ietf:params:netconf:capability:with-defaults:1.0?basic-mode=explicit",
+]
+XPATH = "urn:ietf:params:netconf:capability:xpath:1.0"
+WITH_DEFAULTS = "urn:ietf:params:netconf:capability:with-defaults:1.0"
+
+
+def _rate(func: Callable[[], Any]) -> float:
+    count = 0
+    start = time.process_time()
+    while time.process_time() - start < DURATION:
+        for _ in range(100):
+            func()
+        count += 100
+    return count / (time.process_time() - start)
+
+
+def list_lookups(capabilities: List[str]) -> None:
+    assert XPATH not in capabilities
+    assert any(WITH_DEFAULTS in capability for capability in capabilities)
+    assert any(f"module=module-{MODULE_COUNT - 1}&" in capability for capability in capabilities)
+
+
+def indexed_lookups(capabilities: ServerCapabilities) -> None:
+    assert XPATH not in capabilities
+    assert capabilities.has_capability(WITH_DEFAULTS)
+    assert capabilities.supports_module(f"module-{MODULE_COUNT - 1}")
+
+
+def main() -> None:
+    start = time.process_time()
+    server_capabilities = ServerCapabilities(CAPABILITIES)
+    server_capabilities.has_capability(WITH_DEFAULTS)
+    index_time = time.process_time() - start
+
+    list_rate = _rate(lambda: list_lookups(CAPABILITIES))
+    indexed_rate = _rate(lambda: indexed_lookups(server_capabilities))
+
+    print(
+        f"{len(CAPABILITIES)} capabilities: index built in {index_time * 1000:.1f}ms, list "
+        f"{list_rate:,.0f} lookups/s/core, indexed {indexed_rate:,.0f} lookups/s/core, "
+        f"{indexed_rate / list_rate:.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
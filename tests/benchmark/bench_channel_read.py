@@ -0,0 +1,90 @@
+"""
+Benchmark of reading a large reply off of the channel
+
+Feeds a synthetic ~100MB reply through `NetconfChannel` in 4KiB reads, comparing reading until the
+prompt pattern (scrapli core `_read_until_prompt`, which searches the tail of the whole read buffer
+after every read) with the message decoders used by `_read_until_message`. Run with:
+
+    python tests/benchmark/bench_channel_read.py
+"""
+
+import time
+from typing import Callable, Iterator
+
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.driver import NetconfDriver
+
+READ_SIZE = 4_096
+REPLY_SIZE = 100_000_000
+
+ELEMENT = b"<interface><name>GigabitEthernet0/0/0/0</name><mtu>9216</mtu></interface>"
+PAYLOAD = (
+    b'<rpc-reply message-id="101" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>'
+    + ELEMENT * (REPLY_SIZE // len(ELEMENT))
+    + b"</data></rpc-reply>"
+)
+
+
+def _frame(payload: bytes, netconf_version: NetconfVersion) -> bytes:
+    if netconf_version == NetconfVersion.VERSION_1_0:
+        return payload + b"]]>]]>"
+
+    chunk_size = 65_536
+    framed = b"".join(
+        b"\n#%d\n%b" % (len(payload[i : i + chunk_size]), payload[i : i + chunk_size])
+        for i in range(0, len(payload), chunk_size)
+    )
+    return framed + b"\n##\n"
+
+
+def _reads(framed: bytes) -> Callable[[], bytes]:
+    view = memoryview(framed)
+    offsets: Iterator[int] = iter(range(0, len(framed), READ_SIZE))
+
+    def _read() -> bytes:
+        offset = next(offsets)
+        return view[offset : offset + READ_SIZE].tobytes()
+
+    return _read
+
+
+def _channel(netconf_version: NetconfVersion, framed: bytes) -> NetconfDriver:
+    conn = NetconfDriver(host="localhost")
+    conn.channel._netconf_base_channel_args.netconf_version = netconf_version
+    conn.channel._base_channel_args.comms_prompt_pattern = (
+        "]]>]]>" if netconf_version == NetconfVersion.VERSION_1_0 else r"^##$"
+    )
+    conn.transport.read = _reads(framed)  # type: ignore[method-assign]
+    return conn
+
+
+def _time(func: Callable[[], bytes]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for netconf_version in (NetconfVersion.VERSION_1_0, NetconfVersion.VERSION_1_1):
+        framed = _frame(PAYLOAD, netconf_version)
+
+        conn = _channel(netconf_version, framed)
+        assert conn.channel._read_until_message() == PAYLOAD
+
+        prompt = min(
+            _time(lambda: _channel(netconf_version, framed).channel._read_until_prompt())
+            for _ in range(3)
+        )
+        decoder = min(
+            _time(lambda: _channel(netconf_version, framed).channel._read_until_message())
+            for _ in range(3)
+        )
+
+        print(
+            f"netconf {netconf_version.value}, {len(framed) / 1_000_000:.0f}MB in {READ_SIZE}B "
+            f"reads: prompt {prompt:.2f}s, decoder {decoder:.2f}s, {prompt / decoder:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
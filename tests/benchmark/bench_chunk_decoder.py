@@ -0,0 +1,78 @@
+"""
+Micro-benchmark of netconf 1.1 chunk decoding
+
+Compares `scrapli_netconf.framing.decode_chunked_message` against the previous per-byte decoder
+that lived in `NetconfResponse._record_response_netconf_1_1`. Run with:
+
+    python tests/benchmark/bench_chunk_decoder.py
+"""
+
+import timeit
+from typing import List
+
+from scrapli_netconf.framing import decode_chunked_message
+
+PAYLOAD = (
+    b'<rpc-reply message-id="101" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>'
+    + b"<interface><name>GigabitEthernet0/0/0/0</name><mtu>9216</mtu></interface>" * 50_000
+    + b"</data></rpc-reply>"
+)
+
+
+def _frame(payload: bytes, chunk_size: int) -> bytes:
+    framed = b"".join(
+        b"\n#%d\n%b" % (len(payload[i : i + chunk_size]), payload[i : i + chunk_size])
+        for i in range(0, len(payload), chunk_size)
+    )
+    return framed + b"\n##\n"
+
+
+def legacy_decode(raw_result: bytes) -> bytes:
+    _raw_result = raw_result.strip()
+    chunks: List[bytes] = []
+    cursor = 0
+
+    while cursor < len(_raw_result):
+        if _raw_result[cursor] == 10:
+            cursor += 1
+            continue
+
+        cursor += 1
+
+        if _raw_result[cursor] == 35:
+            break
+
+        chunk_size = 0
+
+        for chunk_size_cursor in range(cursor, cursor + 10):
+            if _raw_result[chunk_size_cursor] == 10:
+                chunk_size = int(_raw_result[cursor:chunk_size_cursor])
+                cursor = chunk_size_cursor + 1
+                break
+
+        chunks.append(_raw_result[cursor : cursor + chunk_size])
+        cursor += chunk_size
+
+    return b"".join(
+        chunk.replace(b'<?xml version="1.0" encoding="UTF-8"?>', b"") for chunk in chunks
+    )
+
+
+def main() -> None:
+    for chunk_size in (65_536, 4_096, 512):
+        framed = _frame(PAYLOAD, chunk_size)
+        assert legacy_decode(framed) == decode_chunked_message(framed)
+
+        legacy = min(timeit.repeat(lambda: legacy_decode(framed), number=10, repeat=3)) / 10
+        current = min(timeit.repeat(lambda: decode_chunked_message(framed), number=10, repeat=3))
+        current /= 10
+
+        print(
+            f"{len(framed) / 1_000_000:.1f}MB in {chunk_size}B chunks: "
+            f"legacy {legacy * 1000:.2f}ms, current {current * 1000:.2f}ms, "
+            f"{legacy / current:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
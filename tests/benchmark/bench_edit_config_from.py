@@ -0,0 +1,70 @@
+"""
+Benchmark of memory used pushing a large config
+
+Compares the peak memory (as traced by `tracemalloc`) of building the request for a ~20MB config
+with `_pre_edit_config` -- which needs the whole config as a string, parses it and serializes the
+request in one go -- against streaming it from a file with `_pre_edit_config_from`, consuming the
+framed channel input part by part as the channel would. Memory allocated by lxml itself (the
+parsed tree) is not traced, so the former is understated. Run with:
+
+    python tests/benchmark/bench_edit_config_from.py
+"""
+
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.driver import NetconfDriver
+
+CONFIG_SIZE = 20_000_000
+
+INTERFACE = (
+    b"<interface><name>GigabitEthernet0/0/0/0</name><description>uplink</description>"
+    b"<mtu>9216</mtu></interface>"
+)
+CONFIG = (
+    b'<config><interfaces xmlns="http://openconfig.net/yang/interfaces">'
+    + INTERFACE * (CONFIG_SIZE // len(INTERFACE))
+    + b"</interfaces></config>"
+)
+
+
+def _peak(func: Callable[[], None]) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    conn = NetconfDriver(host="localhost")
+    conn.netconf_version = NetconfVersion.VERSION_1_1
+    conn.writeable_datastores = ["running"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_file = Path(tmp_dir) / "config.xml"
+        config_file.write_bytes(CONFIG)
+
+        def edit_config() -> None:
+            response = conn._pre_edit_config(config=config_file.read_text())
+            assert response.raw_channel_input
+
+        def edit_config_from() -> None:
+            _, channel_input = conn._pre_edit_config_from(config=config_file)
+            for _ in channel_input:
+                pass
+
+        legacy = _peak(edit_config)
+        streamed = _peak(edit_config_from)
+
+    print(
+        f"{len(CONFIG) / 1_000_000:.0f}MB config: edit_config peak {legacy / 1_000_000:.1f}MB, "
+        f"edit_config_from peak {streamed / 1_000_000:.1f}MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of parsing the server hello
+
+Compares `parse_server_capabilities` against the previous implementation, which ran a dotall regex
+over everything read while waiting for the hello, removed all newlines from the hello, parsed it,
+checked the tag of every element of it in python and formatted the capabilities into a log message
+(whether or not it was logged), asserting both produce the same capabilities. Both log the result
+as the channel does, to a logger with info disabled. Uses a hello advertising a few thousand yang
+modules (~310KB), reported as milliseconds per hello on a single core. Run with:
+
+    python tests/benchmark/bench_hello.py
+"""
+
+import logging
+import re
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from lxml import etree
+
+from scrapli_netconf.capabilities import parse_server_capabilities
+
+LOG = logging.getLogger("bench_hello")
+LOG.setLevel(logging.WARNING)
+
+ROUNDS = 200
+MODULE_COUNT = 3000
+
+RAW_SERVER_CAPABILITIES = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">\n<capabilities>\n'
+    b"<capability>urn:ietf:params:netconf:base:1.1</capability>\n"
+    + b"".join(
+        b"<capability>http://example.com/ns/yang/module-%d?module=module-%d&amp;"
+        b"revision=2024-01-01</capability>\n" % (index, index)
+        for index in range(MODULE_COUNT)
+    )
+    + b"</capabilities>\n<session-id>4</session-id>\n</hello>]]>]]>"
+)
+
+
+def legacy_parse_server_capabilities(raw_server_capabilities: bytes) -> List[str]:
+    server_capabilities = []
+    filtered_raw_server_capabilities = re.search(
+        pattern=rb"(<(\w+\:){0,1}hello.*<\/(\w+\:){0,1}hello>)",
+        string=raw_server_capabilities,
+        flags=re.I | re.S,
+    )
+    assert filtered_raw_server_capabilities is not None
+    server_capabilities_xml = etree.fromstring(
+        filtered_raw_server_capabilities.groups()[0].replace(b"\n", b"")
+    )
+    for elem in server_capabilities_xml.iter():
+        if "capability" not in elem.tag:
+            continue
+        server_capabilities.append(elem.text.strip())
+    LOG.info(f"server capabilities received and parsed: {server_capabilities}")
+    return server_capabilities
+
+
+def current_parse_server_capabilities(raw_server_capabilities: bytes) -> List[str]:
+    server_capabilities = parse_server_capabilities(raw_server_capabilities=raw_server_capabilities)
+    LOG.info("server capabilities received and parsed: %s", server_capabilities)
+    return server_capabilities
+
+
+def main() -> None:
+    assert parse_server_capabilities(RAW_SERVER_CAPABILITIES) == legacy_parse_server_capabilities(
+        RAW_SERVER_CAPABILITIES
+    )
+
+    # interleaved, so both see the same noise from whatever else the machine is doing
+    timings: Dict[str, List[float]] = {"legacy": [], "current": []}
+    funcs: Dict[str, Callable[[bytes], List[str]]] = {
+        "legacy": legacy_parse_server_capabilities,
+        "current": current_parse_server_capabilities,
+    }
+    for _ in range(ROUNDS):
+        for name, func in funcs.items():
+            start = time.process_time()
+            func(RAW_SERVER_CAPABILITIES)
+            timings[name].append(time.process_time() - start)
+
+    legacy_ms = statistics.median(timings["legacy"]) * 1000
+    current_ms = statistics.median(timings["current"]) * 1000
+
+    print(
+        f"{len(RAW_SERVER_CAPABILITIES) // 1024}KB hello: legacy {legacy_ms:.2f}ms, current "
+        f"{current_ms:.2f}ms, {legacy_ms / current_ms:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of the input validation modes
+
+Compares building requests from user provided xml with each `input_validation` mode: "parse"
+(parsing the xml into lxml elements and serializing it again, as always), "check" (a well-formedness
+check that does not build a tree) and "trust" (no validation at all), asserting all of them produce
+identical channel inputs for already flat input. Reported as requests built per second on a single
+core, for a small and a larger (a few hundred interfaces) payload. Run with:
+
+    python tests/benchmark/bench_input_validation.py
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.driver import NetconfDriver
+
+DURATION = 1.0
+INTERFACE_COUNT = 500
+
+CONFIG = (
+    '<config><cdp xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-cdp-cfg"><timer>80</timer>'
+    "<enable>true</enable><log-adjacency/><hold-time>200</hold-time></cdp></config>"
+)
+LARGE_CONFIG = (
+    '<config><interfaces xmlns="http://openconfig.net/yang/interfaces">'
+    + "".join(
+        f"<interface><name>Gi0/0/0/{index}</name><config><name>Gi0/0/0/{index}</name>"
+        f"<description>port {index}</description><enabled>true</enabled></config></interface>"
+        for index in range(INTERFACE_COUNT)
+    )
+    + "</interfaces></config>"
+)
+RPC = '<get-software-information xmlns="http://xml.juniper.net/junos/*/junos"/>'
+
+OPERATIONS: Dict[str, Dict[str, Any]] = {
+    "edit_config": {"config": CONFIG, "target": "running"},
+    "edit_config (large)": {"config": LARGE_CONFIG, "target": "running"},
+    "rpc": {"filter_": RPC},
+}
+INPUT_VALIDATIONS = ("parse", "check", "trust")
+
+
+def _rate(func: Callable[[], Any]) -> float:
+    count = 0
+    start = time.process_time()
+    while time.process_time() - start < DURATION:
+        for _ in range(10):
+            func()
+        count += 10
+    return count / (time.process_time() - start)
+
+
+def main() -> None:
+    conn = NetconfDriver(host="localhost")
+    conn.netconf_version = NetconfVersion.VERSION_1_1
+    conn.writeable_datastores = ["running"]
+
+    for operation, kwargs in OPERATIONS.items():
+        pre_operation = getattr(conn, f"_pre_{operation.split()[0]}")
+
+        channel_inputs = set()
+        for input_validation in INPUT_VALIDATIONS:
+            conn.message_id = 101
+            response = pre_operation(input_validation=input_validation, **kwargs)
+            channel_inputs.add(response.raw_channel_input)
+        assert len(channel_inputs) == 1
+
+        rates = {
+            input_validation: _rate(
+                lambda: pre_operation(
+                    input_validation=input_validation, **kwargs  # pylint: disable=W0640
+                )
+            )
+            for input_validation in INPUT_VALIDATIONS
+        }
+
+        print(
+            f"{operation}: "
+            + ", ".join(f"{mode} {rate:,.0f} req/s/core" for mode, rate in rates.items())
+            + f", trust {rates['trust'] / rates['parse']:.1f}x parse"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of namespace stripping
+
+Compares `scrapli_netconf.helper.remove_namespaces` against the previous regex/objectify based
+implementation and asserts both produce identical output. Run with:
+
+    python tests/benchmark/bench_remove_namespaces.py
+"""
+
+import re
+import timeit
+
+from lxml import etree, objectify
+
+from scrapli_netconf.helper import remove_namespaces
+
+REPLY = (
+    b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data>'
+    b'<interfaces xmlns="http://openconfig.net/yang/interfaces">'
+    + b"<interface><name>Gi0/0/0/0</name><!-- comment --><state><mtu>9216</mtu>"
+    b'<type xmlns:ianaift="urn:ietf:params:xml:ns:yang:iana-if-type">ianaift:ethernetCsmacd</type>'
+    b'<counters xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:type="x">'
+    b"<in-octets>1</in-octets></counters></state></interface>" * 20_000
+    + b"</interfaces></data></rpc-reply>"
+)
+
+
+def legacy_remove_namespaces(tree):
+    for el in tree.getiterator():
+        if not hasattr(el.tag, "find"):
+            continue
+        el.tag = re.sub(r"^{.*}", "", el.tag)
+    objectify.deannotate(tree, cleanup_namespaces=True)
+    return tree
+
+
+def main() -> None:
+    assert etree.tostring(legacy_remove_namespaces(etree.fromstring(REPLY))) == etree.tostring(
+        remove_namespaces(etree.fromstring(REPLY))
+    )
+
+    legacy = min(
+        timeit.repeat(
+            "legacy_remove_namespaces(tree)",
+            setup="tree = etree.fromstring(REPLY)",
+            number=1,
+            repeat=5,
+            globals=globals(),
+        )
+    )
+    current = min(
+        timeit.repeat(
+            "remove_namespaces(tree)",
+            setup="tree = etree.fromstring(REPLY)",
+            number=1,
+            repeat=5,
+            globals=globals(),
+        )
+    )
+
+    print(
+        f"{len(etree.fromstring(REPLY).xpath('//*'))} elements: legacy {legacy * 1000:.1f}ms, "
+        f"current {current * 1000:.1f}ms, {legacy / current:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+import asyncio
+
 import pytest
 
+from scrapli.decorators import timeout_wrapper
+from scrapli.exceptions import ScrapliConnectionError, ScrapliTimeout
+from scrapli_netconf.constants import NetconfVersion
+
 
 async def test_open_netconf():
     pass
@@ -63,8 +69,9 @@ async def test_read_until_input_no_echo(dummy_async_conn):
 async def test_send_input_netconf(monkeypatch, dummy_async_conn):
     _read_counter = 0
 
-    channel_input = "show version"
-    expected_buf = b"output from show version!\n]]>]]>"
+    channel_input = b"show version"
+    # netconf 1.0 replies are read with the delimiter decoder, so come back de-framed
+    expected_buf = b"output from show version!\n"
 
     async def _read(cls):
         nonlocal _read_counter
@@ -93,3 +100,326 @@ async def test_send_input_netconf(monkeypatch, dummy_async_conn):
     dummy_async_conn.channel._server_echo = True
     actual_buf = await dummy_async_conn.channel.send_input_netconf(channel_input=channel_input)
     assert actual_buf == expected_buf
+
+
+async def test_send_input_netconf_1_1_echo_unknown(monkeypatch, dummy_async_conn):
+    async def _read(cls):
+        return b"#30\n<rpc-reply><data/></rpc-reply>\n##"
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+    dummy_async_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_async_conn.channel._base_channel_args.comms_prompt_pattern = r"^##$"
+    dummy_async_conn.channel._server_echo = None
+    actual_buf = await dummy_async_conn.channel.send_input_netconf(channel_input=b"<rpc/>")
+
+    # replies read until the prompt while working out the echo are de-framed all the same
+    assert dummy_async_conn.channel._server_echo is False
+    assert actual_buf == b"<rpc-reply><data/></rpc-reply>"
+
+
+async def test_send_input_netconf_multiplexed(monkeypatch, dummy_async_conn):
+    replies = asyncio.Queue()
+    written = []
+
+    async def _read(cls):
+        return await replies.get()
+
+    def _write(cls, channel_input):
+        if not channel_input.startswith(b"<rpc"):
+            return
+        written.append(channel_input)
+        if len(written) == 2:
+            # answer the second rpc first, the first rpc is answered in two reads
+            replies.put_nowait(b'<rpc-reply message-id="102"/>]]>]]><rpc-reply ')
+            replies.put_nowait(b'message-id="101"/>]]>]]>')
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+
+    dummy_async_conn.channel.start_multiplexer()
+    assert dummy_async_conn.channel.multiplexing is True
+
+    actual_bufs = await asyncio.gather(
+        dummy_async_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="101"/>'),
+        dummy_async_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="102"/>'),
+    )
+    assert actual_bufs == [b'<rpc-reply message-id="101"/>', b'<rpc-reply message-id="102"/>']
+
+    await dummy_async_conn.channel.stop_multiplexer()
+    assert dummy_async_conn.channel.multiplexing is False
+
+
+async def test_send_input_netconf_stream_multiplexed(monkeypatch, dummy_async_conn):
+    replies = asyncio.Queue()
+    written = []
+
+    async def _read(cls):
+        return await replies.get()
+
+    def _write(cls, channel_input):
+        written.append(channel_input)
+        if channel_input == b"]]>]]>":
+            replies.put_nowait(b'<rpc-reply message-id="101"/>]]>]]>')
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+
+    dummy_async_conn.channel.start_multiplexer()
+
+    channel_input = [b'<rpc message-id="101">', b"<get/>", b"</rpc>", b"]]>]]>"]
+    actual_buf = await dummy_async_conn.channel.send_input_netconf_stream(
+        channel_input=iter(channel_input)
+    )
+    assert actual_buf == b'<rpc-reply message-id="101"/>'
+    assert written[: len(channel_input)] == channel_input
+
+    await dummy_async_conn.channel.stop_multiplexer()
+
+
+async def test_send_input_netconf_multiplexed_read_failure(monkeypatch, dummy_async_conn):
+    async def _read(cls):
+        raise ScrapliConnectionError("transport at EOF; no more data to be read")
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+
+    dummy_async_conn.channel.start_multiplexer()
+
+    with pytest.raises(ScrapliConnectionError):
+        await dummy_async_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="101"/>')
+
+    assert dummy_async_conn.channel.multiplexing is False
+
+
+async def test_multiplexer_notifications(monkeypatch, dummy_async_conn):
+    reads = asyncio.Queue()
+
+    async def _read(cls):
+        return await reads.get()
+
+    def _write(cls, channel_input):
+        if channel_input.startswith(b"<rpc"):
+            reads.put_nowait(b"<notification><c/></notification>]]>]]>")
+            reads.put_nowait(b"<notification><d/></notification>]]>]]>")
+            reads.put_nowait(b'<rpc-reply message-id="101"/>]]>]]>')
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+
+    notifications = dummy_async_conn.channel.enable_notifications(maxsize=1)
+    dummy_async_conn.channel.start_multiplexer()
+
+    reads.put_nowait(b"<notification><a/></notification>]]>]]>")
+    reads.put_nowait(b"<notification><b/></notification>]]>]]>")
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # the queue is full, so the multiplexer holds off reading the next notification
+    assert len(notifications) == 1
+    assert reads.qsize() == 1
+
+    assert (
+        await dummy_async_conn.channel.read_notification() == b"<notification><a/></notification>"
+    )
+    assert (
+        await dummy_async_conn.channel.read_notification() == b"<notification><b/></notification>"
+    )
+
+    # while a reply is outstanding notifications are read regardless, dropping the oldest
+    actual_buf = await dummy_async_conn.channel.send_input_netconf(
+        channel_input=b'<rpc message-id="101"/>'
+    )
+    assert actual_buf == b'<rpc-reply message-id="101"/>'
+    assert (
+        await dummy_async_conn.channel.read_notification() == b"<notification><d/></notification>"
+    )
+    assert notifications.stats.received == 4
+    assert notifications.stats.delivered == 3
+    assert notifications.stats.dropped == 1
+
+    await dummy_async_conn.channel.stop_multiplexer()
+
+
+async def test_multiplexer_idle_read_timeout(monkeypatch, dummy_async_conn):
+    reads = asyncio.Queue()
+
+    @timeout_wrapper
+    async def _read(cls):
+        return await reads.get()
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    dummy_async_conn.transport._base_transport_args.timeout_transport = 0.01
+
+    dummy_async_conn.channel.enable_notifications()
+    dummy_async_conn.channel.start_multiplexer()
+
+    # sitting idle for longer than the transport timeout does not stop the multiplexer
+    await asyncio.sleep(0.05)
+    reads.put_nowait(b"<notification><a/></notification>]]>]]>")
+    assert (
+        await dummy_async_conn.channel.read_notification() == b"<notification><a/></notification>"
+    )
+    assert dummy_async_conn.channel.multiplexing is True
+
+    await dummy_async_conn.channel.stop_multiplexer()
+
+
+async def test_multiplexer_slow_reply(monkeypatch, dummy_async_conn):
+    replies = asyncio.Queue()
+
+    @timeout_wrapper
+    async def _read(cls):
+        return await replies.get()
+
+    def _write(cls, channel_input):
+        if channel_input.startswith(b"<rpc"):
+            # the reply takes longer to start coming back than the transport timeout
+            asyncio.get_running_loop().call_later(
+                0.05, replies.put_nowait, b'<rpc-reply message-id="101"/>]]>]]>'
+            )
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+    dummy_async_conn.transport._base_transport_args.timeout_transport = 0.01
+
+    dummy_async_conn.channel.start_multiplexer()
+
+    assert (
+        await dummy_async_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="101"/>')
+        == b'<rpc-reply message-id="101"/>'
+    )
+    assert dummy_async_conn.channel.multiplexing is True
+
+    await dummy_async_conn.channel.stop_multiplexer()
+
+
+async def test_multiplexer_read_timeout_mid_message(monkeypatch, dummy_async_conn):
+    replies = asyncio.Queue()
+
+    @timeout_wrapper
+    async def _read(cls):
+        return await replies.get()
+
+    def _write(cls, channel_input):
+        if channel_input.startswith(b"<rpc"):
+            # the rest of the reply never comes
+            replies.put_nowait(b'<rpc-reply message-id="101">')
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.close", lambda cls: None
+    )
+    dummy_async_conn.transport._base_transport_args.timeout_transport = 0.01
+
+    dummy_async_conn.channel.start_multiplexer()
+
+    with pytest.raises(ScrapliTimeout):
+        await dummy_async_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="101"/>')
+    assert dummy_async_conn.channel.multiplexing is False
+
+
+@pytest.mark.parametrize("channel_lock", [False, True], ids=["no_lock", "lock"])
+async def test_send_input_netconf_iter_stop_early(monkeypatch, dummy_async_conn, channel_lock):
+    reads = asyncio.Queue()
+    for read in (
+        b"#4\n<a/>\n",
+        b"#4\n<b/>\n##\n",
+        b'#29\n<rpc-reply message-id="102"/>\n##\n',
+    ):
+        reads.put_nowait(read)
+
+    async def _read(cls):
+        return await reads.get()
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+
+    channel = dummy_async_conn.channel
+    channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    channel._server_echo = False
+    if channel_lock:
+        channel.channel_lock = asyncio.Lock()
+
+    async for payload in channel.send_input_netconf_iter(channel_input=b'<rpc message-id="101"/>'):
+        assert payload == b"<a/>"
+        break
+
+    # the rest of the first reply is not mistaken for the reply to the next rpc, even though the
+    # event loop has not closed the iterator yet
+    assert (
+        await channel.send_input_netconf(channel_input=b'<rpc message-id="102"/>')
+        == b'<rpc-reply message-id="102"/>'
+    )
+    assert channel._reply_stream is None
+
+
+async def test_send_input_netconf_iter_timeout(monkeypatch, dummy_async_conn):
+    async def _read(cls):
+        await asyncio.sleep(1)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.close", lambda cls: None
+    )
+
+    channel = dummy_async_conn.channel
+    channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    channel._server_echo = False
+    channel._base_channel_args.timeout_ops = 0.01
+
+    with pytest.raises(ScrapliTimeout):
+        async for _ in channel.send_input_netconf_iter(channel_input=b'<rpc message-id="101"/>'):
+            pass
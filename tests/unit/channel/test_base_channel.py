@@ -1,5 +1,7 @@
 import pytest
 
+from scrapli_netconf.cache import CachedSession, hash_hello
+from scrapli_netconf.capabilities import ServerCapabilities
 from scrapli_netconf.constants import NetconfClientCapabilities, NetconfVersion
 from scrapli_netconf.exceptions import CapabilityNotSupported, CouldNotExchangeCapabilities
 
@@ -99,6 +101,8 @@ def test_parse_server_capabilities_1_1(
         raw_server_capabilities=server_capabilities_1_1
     )
     assert client_capabilities == parsed_server_capabilities_1_1
+    assert isinstance(client_capabilities, ServerCapabilities)
+    assert client_capabilities.has_capability("urn:ietf:params:netconf:capability:candidate:1.0")
 
 
 def test_parse_server_capabilities_1_1_namespace(
@@ -116,6 +120,47 @@ def test_parse_server_capabilities_exception(dummy_conn):
     assert "failed to parse server capabilities" in str(exc.value)
 
 
+def test_parse_server_capabilities_cached(dummy_conn, server_capabilities_1_1):
+    cached_capabilities = ServerCapabilities(["urn:ietf:params:netconf:base:1.1"])
+    dummy_conn._netconf_base_channel_args.cached_session = CachedSession(
+        host="localhost",
+        port=830,
+        hello_hash=hash_hello(raw_server_capabilities=server_capabilities_1_1),
+        server_capabilities=cached_capabilities,
+        server_echo=True,
+    )
+    server_capabilities = dummy_conn.channel._parse_server_capabilities(
+        raw_server_capabilities=server_capabilities_1_1
+    )
+    assert server_capabilities is cached_capabilities
+    assert dummy_conn.channel.server_echo is True
+
+
+def test_parse_server_capabilities_cached_hello_changed(
+    dummy_conn, server_capabilities_1_0, parsed_server_capabilities_1_0
+):
+    dummy_conn._netconf_base_channel_args.cached_session = CachedSession(
+        host="localhost",
+        port=830,
+        hello_hash="stale",
+        server_capabilities=ServerCapabilities(["urn:ietf:params:netconf:base:1.1"]),
+        readable_datastores=["running", "candidate"],
+        writeable_datastores=["candidate"],
+        server_echo=True,
+    )
+    server_capabilities = dummy_conn.channel._parse_server_capabilities(
+        raw_server_capabilities=server_capabilities_1_0
+    )
+    assert server_capabilities == parsed_server_capabilities_1_0
+    assert dummy_conn.channel.server_echo is None
+    assert dummy_conn._netconf_base_channel_args.cached_session == CachedSession(
+        host="localhost",
+        port=830,
+        hello_hash=hash_hello(raw_server_capabilities=server_capabilities_1_0),
+        server_capabilities=server_capabilities,
+    )
+
+
 def test_process_output(dummy_conn):
     output = dummy_conn.channel._process_output(buf=b"tacocat", strip_prompt=True)
     assert output == b"tacocat"
@@ -0,0 +1,41 @@
+from scrapli_netconf.channel.buffer import ReadBuffer
+
+
+def test_read_buffer_consume():
+    buf = ReadBuffer(b"hello")
+    buf.extend(b" world")
+    assert len(buf) == 11
+    assert buf.peek(5) == b"hello"
+    assert buf.consume(6) == b"hello "
+    assert buf.peek() == b"world"
+    assert buf.consume() == b"world"
+    assert not buf
+
+
+def test_read_buffer_find():
+    buf = ReadBuffer(b"<hello/>]]>]]><rpc-reply/>")
+    buf.consume(1)
+    assert buf.find(b"]]>]]>") == 7
+    assert buf.find(b"]]>]]>", 8) == -1
+    assert buf.find(b"nope") == -1
+
+
+def test_read_buffer_unread():
+    buf = ReadBuffer(b"abcdef")
+    buf.consume(3)
+    # fits in the consumed head of the buffer
+    buf.unread(b"12")
+    assert buf.peek() == b"12def"
+    # does not fit in the consumed head of the buffer
+    buf.unread(b"xyz")
+    assert buf.consume() == b"xyz12def"
+    buf.unread(b"")
+    assert not buf
+
+
+def test_read_buffer_compacts(monkeypatch):
+    monkeypatch.setattr(ReadBuffer, "COMPACT_THRESHOLD", 4)
+    buf = ReadBuffer(b"0123456789")
+    assert buf.consume(6) == b"012345"
+    assert buf._start == 0
+    assert buf.peek() == b"6789"
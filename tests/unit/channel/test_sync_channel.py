@@ -1,5 +1,8 @@
 import pytest
 
+from scrapli.exceptions import ScrapliTimeout, ScrapliValueError
+from scrapli_netconf.constants import NetconfVersion
+
 
 def test_open_netconf():
     pass
@@ -90,6 +93,18 @@ def test_get_server_capabilities(monkeypatch, dummy_conn):
     assert dummy_conn.channel._get_server_capabilities() == b"lasjdfkldsjaflkdjf"
 
 
+def test_get_server_capabilities_over_read(monkeypatch, dummy_conn):
+    reads = iter([b"<hello/>]]>]", b"]><rpc-reply/>"])
+
+    def _read(cls):
+        return next(reads)
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+
+    assert dummy_conn.channel._get_server_capabilities() == b"<hello/>"
+    assert dummy_conn.channel._read_buf.peek() == b"<rpc-reply/>"
+
+
 def test_send_client_capabilities():
     pass
 
@@ -121,8 +136,9 @@ def test_read_until_input_no_echo(dummy_conn):
 def test_send_input_netconf(monkeypatch, dummy_conn):
     _read_counter = 0
 
-    channel_input = "show version"
-    expected_buf = b"output from show version!\n]]>]]>"
+    channel_input = b"show version"
+    # netconf 1.0 replies are read with the delimiter decoder, so come back de-framed
+    expected_buf = b"output from show version!\n"
 
     def _read(cls):
         nonlocal _read_counter
@@ -146,3 +162,222 @@ def test_send_input_netconf(monkeypatch, dummy_conn):
     dummy_conn.channel._server_echo = True
     actual_buf = dummy_conn.channel.send_input_netconf(channel_input=channel_input)
     assert actual_buf == expected_buf
+
+
+def test_send_input_netconf_1_1(monkeypatch, dummy_conn):
+    _read_counter = 0
+
+    reads = [b"#3", b"0\n<rpc-reply><data/></rpc-", b"reply>\n##\n#1"]
+
+    def _read(cls):
+        nonlocal _read_counter
+        _read_counter += 1
+        return reads[_read_counter - 1]
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.channel._server_echo = False
+    actual_buf = dummy_conn.channel.send_input_netconf(channel_input=b"<rpc/>")
+    assert actual_buf == b"<rpc-reply><data/></rpc-reply>"
+    assert dummy_conn.channel._read_buf.peek() == b"\n#1"
+
+
+def test_send_input_netconf_1_1_echo_unknown(monkeypatch, dummy_conn):
+    def _read(cls):
+        return b"#30\n<rpc-reply><data/></rpc-reply>\n##"
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.channel._base_channel_args.comms_prompt_pattern = r"^##$"
+    actual_buf = dummy_conn.channel.send_input_netconf(channel_input=b"<rpc/>")
+
+    # replies read until the prompt while working out the echo are de-framed all the same
+    assert dummy_conn.channel._server_echo is False
+    assert actual_buf == b"<rpc-reply><data/></rpc-reply>"
+
+
+def test_send_input_netconf_stream(monkeypatch, dummy_conn):
+    reads = iter(
+        [b"#12\n<rpc>" + b"x" * 66 + b"</rpc>\n##", b"#30\n<rpc-reply><data/>", b"</rpc-reply>\n##"]
+    )
+    written = []
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        written.append(channel_input)
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.channel._base_channel_args.comms_prompt_pattern = r"^##$"
+    channel_input = [b"#77\n<rpc>", b"x" * 66, b"</rpc>", b"\n##"]
+    actual_buf = dummy_conn.channel.send_input_netconf_stream(channel_input=iter(channel_input))
+
+    # the echo of the input is recognized from the tail end of the input alone
+    assert dummy_conn.channel._server_echo is True
+    assert actual_buf == b"<rpc-reply><data/></rpc-reply>"
+    assert written[: len(channel_input)] == channel_input
+
+
+@pytest.mark.parametrize("input_size", [64, 4096], ids=["small", "large"])
+def test_send_input_netconf_stream_timeout(monkeypatch, dummy_conn, input_size):
+    def _read_until_message(cls):
+        raise ScrapliTimeout
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel._read_until_message",
+        _read_until_message,
+    )
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.channel._server_echo = False
+    channel_input = [b"#%d\n" % input_size, b"x" * input_size, b"\n##"]
+    with pytest.raises(ScrapliTimeout) as exc:
+        dummy_conn.channel.send_input_netconf_stream(channel_input=iter(channel_input))
+
+    # only the tail end of a streamed input is kept, the hint goes on how much was sent
+    assert ("use_compressed_parser" in str(exc.value)) is (input_size >= 4096)
+
+
+def test_send_input_netconf_1_0(monkeypatch, dummy_conn):
+    # a delimiter split across reads and followed by the start of the next message in one read
+    reads = iter([b"<rpc-reply><data/></rpc-reply>]]", b">]]><rpc-reply " + b"x" * 2048])
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.channel._server_echo = False
+    actual_buf = dummy_conn.channel.send_input_netconf(channel_input=b"<rpc/>]]>]]>")
+    assert actual_buf == b"<rpc-reply><data/></rpc-reply>"
+    assert dummy_conn.channel._read_buf.peek() == b"<rpc-reply " + b"x" * 2048
+
+
+def test_send_input_netconf_iter(monkeypatch, dummy_conn):
+    _read_counter = 0
+
+    reads = [b"<rpc-reply><data>", b"<a/></data></rpc-reply>]]", b">]]>"]
+
+    def _read(cls):
+        nonlocal _read_counter
+        _read_counter += 1
+        return reads[_read_counter - 1]
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.channel._server_echo = False
+    assert list(dummy_conn.channel.send_input_netconf_iter(channel_input=b"<rpc/>")) == [
+        b"<rpc-reply><data>",
+        b"<a/></data></rpc-reply>",
+    ]
+
+
+def test_send_inputs_netconf(monkeypatch, dummy_conn):
+    _read_counter = 0
+    writes = []
+
+    reads = [
+        b'#45\n<rpc-reply message-id="102"><ok/></rpc-reply>\n##\n#33\n<notification>',
+        b"<a/></notification>\n##\n#2",
+        b'9\n<rpc-reply message-id="101"/>\n##\n',
+    ]
+
+    def _read(cls):
+        nonlocal _read_counter
+        _read_counter += 1
+        return reads[_read_counter - 1]
+
+    def _write(cls, channel_input):
+        writes.append(channel_input)
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.channel._server_echo = False
+    replies = dummy_conn.channel.send_inputs_netconf(
+        channel_inputs={"101": b"<rpc-101/>", "102": b"<rpc-102/>"}
+    )
+    assert replies == {
+        "101": b'<rpc-reply message-id="101"/>',
+        "102": b'<rpc-reply message-id="102"><ok/></rpc-reply>',
+    }
+    # both inputs are written before any reply is read
+    assert [write for write in writes if write.startswith(b"<rpc")] == [
+        b"<rpc-101/>",
+        b"<rpc-102/>",
+    ]
+
+
+def test_send_input_netconf_notifications(monkeypatch, dummy_conn):
+    reads = iter(
+        [
+            b"<notification><a/></notification>]]>]]>",
+            b'<rpc-reply message-id="101"/>]]>]]>',
+            b'<rpc-reply message-id="102"/>]]>]]><notification><b/></notification>]]>]]>',
+        ]
+    )
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.channel._netconf_base_channel_args.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.channel._server_echo = False
+    notifications = dummy_conn.channel.enable_notifications()
+
+    # notifications ahead of the reply are queued rather than taken to be the reply
+    actual_buf = dummy_conn.channel.send_input_netconf(channel_input=b'<rpc message-id="101"/>')
+    assert actual_buf == b'<rpc-reply message-id="101"/>'
+    assert len(notifications) == 1
+
+    assert dummy_conn.channel.read_notification() == b"<notification><a/></notification>"
+    # the stray reply is discarded while waiting for the next notification
+    assert dummy_conn.channel.read_notification() == b"<notification><b/></notification>"
+    assert notifications.stats.delivered == 2
+
+
+def test_read_notification_not_enabled(dummy_conn):
+    with pytest.raises(ScrapliValueError):
+        dummy_conn.channel.read_notification()
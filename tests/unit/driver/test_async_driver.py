@@ -1,3 +1,11 @@
+import asyncio
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from scrapli.exceptions import ScrapliCommandFailure
+from scrapli_netconf.cache import SchemaCache
 from scrapli_netconf.constants import NetconfVersion
 
 
@@ -41,3 +49,163 @@ async def test_get_config(monkeypatch, dummy_async_conn):
         actual_response.channel_input
         == """<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><get-config><source><running/></source></get-config></rpc>]]>]]>"""
     )
+
+
+async def test_stream_get_config(monkeypatch, dummy_async_conn):
+    reply = (
+        b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><rpc-error>'
+        b"<error-message>bad things</error-message></rpc-error></rpc-reply>"
+    )
+
+    async def dummy_send_input_netconf_iter(cls, channel_input):
+        yield reply
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.async_channel.AsyncNetconfChannel.send_input_netconf_iter",
+        dummy_send_input_netconf_iter,
+    )
+    dummy_async_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_async_conn.readable_datastores = ["running"]
+
+    with pytest.raises(ScrapliCommandFailure) as exc:
+        async for _ in dummy_async_conn.stream_get_config():
+            pass
+
+    assert str(exc.value) == "operation failed, reported rpc errors: ['bad things']"
+
+
+async def test_pipeline(monkeypatch, dummy_async_conn):
+    async def dummy_send_inputs_netconf(cls, channel_inputs):
+        return {
+            message_id: (
+                f'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+                f'message-id="{message_id}"><ok/></rpc-reply>]]>]]>'
+            ).encode()
+            for message_id in channel_inputs
+        }
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.async_channel.AsyncNetconfChannel.send_inputs_netconf",
+        dummy_send_inputs_netconf,
+    )
+    dummy_async_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_async_conn.writeable_datastores = ["running"]
+    responses = await dummy_async_conn.pipeline([("lock", {"target": "running"}), ("discard", {})])
+    assert [response.xml_result.get("message-id") for response in responses] == ["101", "102"]
+    assert all(response.failed is False for response in responses)
+
+
+async def test_get_parse_executor(monkeypatch, dummy_async_conn):
+    reply = (
+        b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><rpc-error>'
+        b"<error-message>bad things</error-message></rpc-error></rpc-reply>]]>]]>"
+    )
+
+    async def dummy_send_input_netconf(cls, channel_input):
+        return reply
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.async_channel.AsyncNetconfChannel.send_input_netconf",
+        dummy_send_input_netconf,
+    )
+    dummy_async_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_async_conn.strip_namespaces = True
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        dummy_async_conn.parse_executor = executor
+        actual_response = await dummy_async_conn.get(filter_="<interfaces/>")
+
+    assert actual_response.raw_result == reply
+    assert actual_response.failed is True
+    assert actual_response.error_messages == ["bad things"]
+    assert actual_response.xml_result.get("message-id") == "101"
+
+
+async def test_sync_schemas(monkeypatch, dummy_async_conn, tmp_path):
+    sent_identifiers = []
+
+    async def dummy_send_inputs_netconf(cls, channel_inputs):
+        sent_identifiers.extend(
+            re.search(rb"<identifier>(.*?)</identifier>", channel_input).group(1).decode()
+            for channel_input in channel_inputs.values()
+        )
+        return {
+            message_id: (
+                f'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+                f'message-id="{message_id}"><data xmlns="urn:ietf:params:xml:ns:yang:'
+                f'ietf-netconf-monitoring">module m{message_id} {{}}</data></rpc-reply>]]>]]>'
+            ).encode()
+            for message_id in channel_inputs
+        }
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.async_channel.AsyncNetconfChannel.send_inputs_netconf",
+        dummy_send_inputs_netconf,
+    )
+    dummy_async_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_async_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.0",
+        "urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring?module=ietf-netconf-monitoring"
+        "&revision=2010-10-04",
+        "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08",
+    ]
+    responses = await dummy_async_conn.sync_schemas(schema_cache=str(tmp_path))
+    assert list(responses) == [
+        ("ietf-netconf-monitoring", "2010-10-04"),
+        ("ietf-interfaces", "2014-05-08"),
+    ]
+    assert sent_identifiers == ["ietf-netconf-monitoring", "ietf-interfaces"]
+    schema_cache = SchemaCache(path=tmp_path)
+    assert schema_cache.load(name="ietf-interfaces", revision="2014-05-08") == "module m102 {}"
+
+    # everything is cached now, so nothing is fetched again
+    assert await dummy_async_conn.sync_schemas(schema_cache=schema_cache) == {}
+    assert len(sent_identifiers) == 2
+
+
+NOTIFICATION_CAPABILITY = "urn:ietf:params:netconf:capability:notification:1.0"
+SUBSCRIPTION_REPLIES = (
+    b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><ok/>'
+    b"</rpc-reply>]]>]]>"
+    b'<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>'
+    b"2024-01-01T00:00:00Z</eventTime><netconf-config-change xmlns="
+    b'"urn:ietf:params:xml:ns:yang:ietf-netconf-notifications"/></notification>]]>]]>'
+    b'<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>'
+    b"2024-01-02T00:00:00Z</eventTime><notificationComplete "
+    b'xmlns="urn:ietf:params:xml:ns:netmod:notification"/></notification>]]>]]>'
+)
+
+
+async def test_create_subscription(monkeypatch, dummy_async_conn):
+    reads = asyncio.Queue()
+
+    async def _read(cls):
+        return await reads.get()
+
+    def _write(cls, channel_input):
+        if b"<create-subscription" in channel_input:
+            reads.put_nowait(SUBSCRIPTION_REPLIES)
+
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.read", _read
+    )
+    monkeypatch.setattr(
+        "scrapli.transport.plugins.asyncssh.transport.AsyncsshTransport.write", _write
+    )
+    dummy_async_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_async_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+    dummy_async_conn.strip_namespaces = True
+
+    response = await dummy_async_conn.create_subscription(stream="NETCONF")
+    assert response.failed is False
+    # notifications are read alongside replies by the multiplexer
+    assert dummy_async_conn.channel.multiplexing is True
+
+    # iteration ends with the notification signalling the subscription is complete
+    assert [
+        [child.tag for child in xml_notification]
+        async for xml_notification in dummy_async_conn.notifications()
+    ] == [["eventTime", "netconf-config-change"], ["eventTime", "notificationComplete"]]
+    assert dummy_async_conn.notification_stats.delivered == 2
+
+    await dummy_async_conn.channel.stop_multiplexer()
@@ -2,7 +2,16 @@ import pytest
 from lxml import etree
 
 from scrapli.exceptions import ScrapliTypeError, ScrapliValueError
-from scrapli_netconf.constants import NetconfClientCapabilities, NetconfVersion, XmlParserVersion
+from scrapli_netconf.cache import CachedSession, CapabilityCache, SchemaCache
+from scrapli_netconf.capabilities import ServerCapabilities
+from scrapli_netconf.constants import (
+    InputValidation,
+    NetconfClientCapabilities,
+    NetconfVersion,
+    XmlParserVersion,
+)
+from scrapli_netconf.driver import NetconfDriver
+from scrapli_netconf.driver.base_driver import YANG_LIBRARY_1_1_FILTER, YANG_LIBRARY_FILTER
 from scrapli_netconf.exceptions import CapabilityNotSupported
 from scrapli_netconf.response import NetconfResponse
 
@@ -54,6 +63,9 @@ def test_server_capabilities(dummy_conn):
     assert dummy_conn.server_capabilities == []
     dummy_conn.server_capabilities = ["blah"]
     assert dummy_conn.server_capabilities == ["blah"]
+    # lists are indexed for lookups when set
+    assert isinstance(dummy_conn.server_capabilities, ServerCapabilities)
+    assert "blah" in dummy_conn.server_capabilities
 
 
 def test_set_server_capabilities_exception(dummy_conn):
@@ -108,6 +120,32 @@ def test_determine_preferred_xml_parser(dummy_conn, test_data):
     )
 
 
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        ("parse", InputValidation.PARSE),
+        ("check", InputValidation.CHECK),
+        ("trust", InputValidation.TRUST),
+    ),
+    ids=(
+        "parse",
+        "check",
+        "trust",
+    ),
+)
+def test_determine_input_validation(dummy_conn, test_data):
+    input_validation, input_validation_output = test_data
+    assert (
+        dummy_conn._determine_input_validation(input_validation=input_validation)
+        == input_validation_output
+    )
+
+
+def test_determine_input_validation_exception(dummy_conn):
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._determine_input_validation(input_validation="blah")
+
+
 def test_build_readable_datastores(dummy_conn, parsed_server_capabilities_1_1):
     dummy_conn.server_capabilities = parsed_server_capabilities_1_1
     dummy_conn._build_readable_datastores()
@@ -120,6 +158,80 @@ def test_build_writeable_datastores(dummy_conn, parsed_server_capabilities_1_1):
     assert dummy_conn.writeable_datastores == ["candidate"]
 
 
+def test_determine_capability_cache(dummy_conn, tmp_path):
+    assert dummy_conn.capability_cache is None
+    cache = dummy_conn._determine_capability_cache(capability_cache=str(tmp_path))
+    assert isinstance(cache, CapabilityCache)
+    assert cache.path == tmp_path
+    assert dummy_conn._determine_capability_cache(capability_cache=cache) is cache
+
+
+def test_build_datastores_capability_cache(monkeypatch, tmp_path, server_capabilities_1_1):
+    conn = NetconfDriver(host="localhost", capability_cache=str(tmp_path))
+    conn._load_cached_session()
+    conn.channel._process_capabilities_exchange(raw_server_capabilities=server_capabilities_1_1)
+    conn._build_datastores()
+    assert conn.readable_datastores == ["running", "candidate"]
+    assert conn.writeable_datastores == ["candidate"]
+
+    cached_session = conn.capability_cache.load(host="localhost")
+    assert cached_session.server_capabilities == conn.server_capabilities
+    assert cached_session.readable_datastores == ["running", "candidate"]
+    assert cached_session.writeable_datastores == ["candidate"]
+    assert cached_session.server_echo is None
+
+    conn._update_cached_server_echo(server_echo=False)
+    assert conn.capability_cache.load(host="localhost").server_echo is False
+
+    # a new session getting the same hello reuses everything that was cached
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.base_channel.parse_server_capabilities",
+        lambda raw_server_capabilities: pytest.fail("hello should not be parsed"),
+    )
+    monkeypatch.setattr(
+        "scrapli_netconf.driver.base_driver.NetconfBaseDriver._build_readable_datastores",
+        lambda cls: pytest.fail("datastores should not be built"),
+    )
+    conn = NetconfDriver(host="localhost", capability_cache=str(tmp_path))
+    conn._load_cached_session()
+    conn.channel._process_capabilities_exchange(
+        raw_server_capabilities=server_capabilities_1_1.replace(b"3671877071", b"4")
+    )
+    conn._build_datastores()
+    assert conn.server_capabilities == cached_session.server_capabilities
+    assert conn.readable_datastores == ["running", "candidate"]
+    assert conn.writeable_datastores == ["candidate"]
+    assert conn.channel.server_echo is False
+
+
+def test_capability_cache_per_transport(tmp_path, server_capabilities_1_1):
+    conn = NetconfDriver(host="localhost", capability_cache=str(tmp_path))
+    conn._load_cached_session()
+    conn.channel._process_capabilities_exchange(raw_server_capabilities=server_capabilities_1_1)
+    conn._build_datastores()
+    # the system transport runs ssh in a pty, so the server input is echoed
+    conn._update_cached_server_echo(server_echo=True)
+
+    # the same device over a transport that does not echo must not pick that up
+    conn = NetconfDriver(host="localhost", transport="paramiko", capability_cache=str(tmp_path))
+    conn._load_cached_session()
+    conn.channel._process_capabilities_exchange(raw_server_capabilities=server_capabilities_1_1)
+    conn._build_datastores()
+    assert conn.channel.server_echo is None
+    conn._update_cached_server_echo(server_echo=False)
+
+    assert conn.capability_cache.load(host="localhost").server_echo is True
+    assert conn.capability_cache.load(host="localhost", transport="paramiko").server_echo is False
+
+
+def test_store_cached_session_failed(dummy_conn, tmp_path):
+    (tmp_path / "cache").write_text("not a directory")
+    dummy_conn.capability_cache = CapabilityCache(path=tmp_path / "cache")
+    dummy_conn._netconf_base_channel_args.cached_session = CachedSession(host="localhost", port=830)
+    # failing to cache is logged, it does not break the connection
+    dummy_conn._store_cached_session()
+
+
 @pytest.mark.parametrize(
     "capabilities",
     [
@@ -289,6 +401,52 @@ def test_pre_get(dummy_conn, capabilities):
     assert response.channel_input == expected_channel_input
 
 
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        """<netconf-yang xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-man-netconf-cfg"/>""",
+        """<filter type="subtree"><netconf-yang xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-man-netconf-cfg"/></filter>""",
+    ],
+    ids=["bare", "filter"],
+)
+@pytest.mark.parametrize("input_validation", ["check", "trust"])
+def test_pre_get_spliced(dummy_conn, input_validation, filter_):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = dummy_conn._pre_get(filter_=filter_, input_validation=input_validation)
+    assert response.channel_input == GET_CHANNEL_INPUT_1_1
+    assert response.xml_input.get("message-id") == "101"
+
+
+def test_pre_get_spliced_not_well_formed(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    filter_ = "<interfaces><interface></interfaces>"
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._pre_get(filter_=filter_, input_validation="check")
+
+    # trusted input is spliced into the request without looking at it at all
+    response = dummy_conn._pre_get(filter_=filter_, input_validation="trust")
+    assert filter_ in response.channel_input
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        "<filter><interfaces/></filter>",
+        """<filter type="xpath"><interfaces/></filter>""",
+        """<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" type = 'subtree'><interfaces/></filter>""",
+    ],
+    ids=["no_type", "wrong_type", "other_attributes"],
+)
+@pytest.mark.parametrize("input_validation", ["check", "trust"])
+def test_pre_get_spliced_filter_type(dummy_conn, input_validation, filter_):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = dummy_conn._pre_get(filter_=filter_, input_validation=input_validation)
+    # as when parsing, the filter type is always set to subtree
+    assert response.channel_input.count("type=") == 1
+    assert response.xml_input.find(".//{*}filter").get("type") == "subtree"
+    assert response.xml_input.find(".//{*}filter")[0].tag.endswith("interfaces")
+
+
 @pytest.mark.parametrize(
     "capabilities",
     [
@@ -352,6 +510,71 @@ def test_pre_edit_config(dummy_conn, capabilities):
     assert response.channel_input == expected_channel_input
 
 
+@pytest.mark.parametrize("input_validation", [InputValidation.CHECK, InputValidation.TRUST])
+def test_pre_edit_config_spliced(dummy_conn, input_validation):
+    dummy_conn.writeable_datastores = ["running"]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    # the drivers setting applies unless overridden per operation
+    dummy_conn.input_validation = input_validation
+    config = (
+        '<config><cdp xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-cdp-cfg"><timer>80</timer>'
+        "<enable>true</enable><log-adjacency/><hold-time>200</hold-time><advertise-v1-only/>"
+        "</cdp></config>"
+    )
+    response = dummy_conn._pre_edit_config(config=config)
+    assert response.channel_input == EDIT_CONFIG_CHANNEL_INPUT_1_1
+
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._pre_edit_config(config="<config><cdp></config>", input_validation="check")
+
+
+@pytest.mark.parametrize(
+    "capabilities",
+    [
+        (NetconfVersion.VERSION_1_0, EDIT_CONFIG_CHANNEL_INPUT_1_0),
+        (NetconfVersion.VERSION_1_1, EDIT_CONFIG_CHANNEL_INPUT_1_1),
+    ],
+    ids=["1.0", "1.1"],
+)
+def test_pre_edit_config_from(dummy_conn, capabilities, tmp_path):
+    dummy_conn.writeable_datastores = ["running"]
+    dummy_conn.netconf_version = capabilities[0]
+    expected_channel_input = capabilities[1]
+    config_file = tmp_path / "config.xml"
+    config_file.write_bytes(
+        b"<?xml version='1.0' encoding='utf-8'?>\n"
+        b'<config><cdp xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-cdp-cfg"><timer>80</timer>'
+        b"<enable>true</enable><log-adjacency/><hold-time>200</hold-time><advertise-v1-only/>"
+        b"</cdp></config>"
+    )
+    response, channel_input = dummy_conn._pre_edit_config_from(config=config_file)
+    assert isinstance(response, NetconfResponse)
+    assert response.channel_input == ""
+    assert b"".join(channel_input).decode() == expected_channel_input
+
+
+def test_pre_edit_config_from_not_well_formed(dummy_conn, tmp_path):
+    dummy_conn.writeable_datastores = ["running"]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    config_file = tmp_path / "config.xml"
+    config_file.write_bytes(b"<config><cdp></config>")
+    # files are checked before anything is built, let alone sent
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._pre_edit_config_from(config=str(config_file))
+    assert dummy_conn.message_id == 101
+
+    # iterables can only be checked as they are sent
+    _, channel_input = dummy_conn._pre_edit_config_from(config=iter([b"<config>", b"</cdp>"]))
+    with pytest.raises(ScrapliValueError):
+        list(channel_input)
+
+    # trusted configs are not checked at all
+    _, channel_input = dummy_conn._pre_edit_config_from(
+        config=str(config_file), input_validation="trust"
+    )
+    assert b"<config><cdp></config>" in b"".join(channel_input)
+
+
 @pytest.mark.parametrize(
     "capabilities",
     [
@@ -634,6 +857,51 @@ def test_pre_rpc(dummy_conn, capabilities):
     assert response.channel_input == expected_channel_input
 
 
+@pytest.mark.parametrize("input_validation", ["check", "trust"])
+def test_pre_rpc_spliced(dummy_conn, input_validation):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    filter_ = """<netconf-yang xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-man-netconf-cfg"/>"""
+    response = dummy_conn._pre_rpc(filter_=filter_, input_validation=input_validation)
+    assert response.channel_input == RPC_CHANNEL_INPUT_1_1
+    assert response.xml_input[0].tag.endswith("netconf-yang")
+
+
+def test_pre_rpc_spliced_multiple_roots(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = dummy_conn._pre_rpc(filter_="<lock/><unlock/>", input_validation="trust")
+    assert [element.tag for element in response.xml_input] == ["lock", "unlock"]
+
+
+def test_pre_rpc_spliced_not_well_formed(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = dummy_conn._pre_rpc(filter_="<lock><target></lock>", input_validation="trust")
+    assert "<lock><target></lock>" in response.channel_input
+    # the request element is recovered as best it can be rather than failing when accessed
+    assert response.xml_input[0].tag == "lock"
+
+
+@pytest.mark.parametrize(
+    "capabilities",
+    [
+        (NetconfVersion.VERSION_1_0, RPC_CHANNEL_INPUT_1_0),
+        (NetconfVersion.VERSION_1_1, RPC_CHANNEL_INPUT_1_1),
+    ],
+    ids=["1.0", "1.1"],
+)
+def test_pre_rpc_from(dummy_conn, capabilities):
+    dummy_conn.netconf_version = capabilities[0]
+    expected_channel_input = capabilities[1]
+    operation = iter(
+        [b"<netconf-yang ", b'xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-man-netconf-cfg"/>']
+    )
+    response, channel_input = dummy_conn._pre_rpc_from(operation=operation)
+    assert isinstance(response, NetconfResponse)
+    assert response.channel_input == ""
+    assert response.xml_input.get("message-id") == "101"
+    assert dummy_conn.message_id == 102
+    assert b"".join(channel_input).decode() == expected_channel_input
+
+
 @pytest.mark.parametrize(
     "capabilities",
     [
@@ -675,3 +943,282 @@ def test_pre_copy_config(dummy_conn, capabilities):
     response = dummy_conn._pre_copy_config(source="running", target="startup")
     assert isinstance(response, NetconfResponse)
     assert response.channel_input == expected_channel_input
+
+
+def test_pre_pipeline_invalid_operation(dummy_conn):
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._pre_pipeline(operations=[("close", {})])
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        ("get", {"filter_": "<netconf-yang/>"}),
+        ("get_config", {"filter_": "//netconf-yang", "filter_type": "xpath"}),
+        ("edit_config", {"config": "<config><cdp><timer>80</timer></cdp></config>"}),
+        ("commit", {}),
+        ("discard", {}),
+        ("lock", {"target": "running"}),
+        ("rpc", {"filter_": "<netconf-yang>\n  <x>1 &amp; 2</x>\n</netconf-yang>"}),
+        ("copy_config", {"source": "running", "target": "startup"}),
+    ],
+    ids=["get", "get_config", "edit_config", "commit", "discard", "lock", "rpc", "copy_config"],
+)
+def test_pre_operation_lazy_xml_input(dummy_conn, operation):
+    dummy_conn.server_capabilities = ["urn:ietf:params:netconf:capability:xpath:1.0"]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = getattr(dummy_conn, f"_pre_{operation[0]}")(**operation[1])
+    # the xml element of the request is only built once it is asked for
+    assert response._xml_input is None
+    assert response.xml_input.get("message-id") == "101"
+    assert (
+        dummy_conn._finalize_channel_input(xml_request=response.xml_input).decode()
+        == response.channel_input
+    )
+
+
+def test_pre_edit_config_netconf_base_namespace(dummy_conn):
+    # elements in the base namespace are reconciled with the rpc element's default namespace, so
+    # the request is built from lxml elements rather than spliced together
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    response = dummy_conn._pre_edit_config(
+        config='<nc:config xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        '<cdp nc:operation="merge"/></nc:config>',
+        target="running",
+    )
+    assert response.channel_input == (
+        "#264\n<?xml version='1.0' encoding='utf-8'?>\n"
+        '<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><edit-config>'
+        '<target><running/></target><config xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        '<cdp nc:operation="merge"/></config></edit-config></rpc>\n##'
+    )
+    assert response._xml_input is not None
+
+
+def test_filter_cache(dummy_conn):
+    dummy_conn.filter_cache_clear()
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+
+    first_response = dummy_conn._pre_get(filter_="<netconf-yang/>")
+    # cache is shared across drivers
+    other_conn = NetconfDriver(host="localhost")
+    other_conn.netconf_version = NetconfVersion.VERSION_1_1
+    other_conn.message_id = 101
+    second_response = other_conn._pre_get(filter_="<netconf-yang/>")
+
+    assert first_response.channel_input == second_response.channel_input
+    assert dummy_conn.filter_cache_info().hits == 1
+    assert dummy_conn.filter_cache_info().misses == 1
+
+    # the parser is part of the cache key
+    dummy_conn.xml_parser = XmlParserVersion.STANDARD_PARSER
+    dummy_conn._pre_get_config(filter_="<netconf-yang/>")
+    assert dummy_conn.filter_cache_info().misses == 2
+
+    dummy_conn.filter_cache_clear()
+    assert dummy_conn.filter_cache_info().currsize == 0
+
+
+MONITORING_CAPABILITY = (
+    "urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring?module=ietf-netconf-monitoring"
+    "&revision=2010-10-04"
+)
+
+
+def test_pre_get_schema(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [MONITORING_CAPABILITY]
+    response = dummy_conn._pre_get_schema(identifier="ietf-interfaces", version="2014-05-08")
+    assert (
+        response.channel_input
+        == """<?xml version='1.0' encoding='utf-8'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><get-schema xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring"><identifier>ietf-interfaces</identifier><version>2014-05-08</version><format>yang</format></get-schema></rpc>]]>]]>"""
+    )
+    assert etree.tostring(response.xml_input) == etree.tostring(
+        etree.fromstring(response.channel_input[39:-6].encode())
+    )
+
+
+def test_pre_get_schema_escaped(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = ["urn:ietf:params:netconf:capability:yang-library:1.0"]
+    response = dummy_conn._pre_get_schema(identifier="a&b", format_="yin")
+    assert (
+        response.channel_input
+        == """<?xml version='1.0' encoding='utf-8'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><get-schema xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring"><identifier>a&amp;b</identifier><format>yin</format></get-schema></rpc>]]>]]>"""
+    )
+
+
+def test_pre_get_schema_exception(dummy_conn):
+    dummy_conn.server_capabilities = ["urn:ietf:params:netconf:base:1.1"]
+    with pytest.raises(CapabilityNotSupported):
+        dummy_conn._pre_get_schema(identifier="ietf-interfaces")
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        (
+            b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring">module a {\n}\n</data></rpc-reply>""",
+            "module a {\n}\n",
+        ),
+        (
+            b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring"><![CDATA[module a {\n}\n]]></data></rpc-reply>""",
+            "module a {\n}\n",
+        ),
+        (
+            b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><rpc-error><error-message>invalid-value</error-message></rpc-error></rpc-reply>""",
+            None,
+        ),
+    ],
+    ids=["schema", "cdata", "rpc_error"],
+)
+def test_extract_schema(dummy_conn, test_data):
+    raw_response, expected_schema = test_data
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    dummy_conn.server_capabilities = [MONITORING_CAPABILITY]
+    response = dummy_conn._pre_get_schema(identifier="a")
+    response.record_response(raw_response, deframed=True)
+    assert dummy_conn._extract_schema(response=response) == expected_schema
+
+
+def test_pre_sync_schemas(monkeypatch, dummy_conn, tmp_path):
+    monkeypatch.setattr("scrapli_netconf.driver.base_driver.SCHEMA_SYNC_BATCH_SIZE", 2)
+    schema_cache = SchemaCache(path=tmp_path)
+    schema_cache.store(
+        name="ietf-interfaces", revision="2014-05-08", schema="module ietf-interfaces {}"
+    )
+    dummy_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.1",
+        MONITORING_CAPABILITY,
+        "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08",
+        "urn:ietf:params:xml:ns:yang:ietf-ip?module=ietf-ip&revision=2014-06-16",
+        "http://example.com/ns/yang/no-revision?module=no-revision",
+    ]
+    assert dummy_conn._pre_sync_schemas(
+        schema_cache=schema_cache, modules=None, yang_library=None
+    ) == [
+        [("ietf-netconf-monitoring", "2010-10-04"), ("ietf-ip", "2014-06-16")],
+        [("no-revision", None)],
+    ]
+    assert dummy_conn._pre_sync_schemas(
+        schema_cache=schema_cache, modules=["ietf-interfaces", "ietf-ip"], yang_library=None
+    ) == [[("ietf-ip", "2014-06-16")]]
+
+
+def test_pre_sync_schemas_yang_library(dummy_conn, tmp_path):
+    dummy_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.1",
+        "urn:ietf:params:netconf:capability:yang-library:1.0?revision=2016-06-21&module-set-id=1",
+    ]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    yang_library = dummy_conn._pre_get(filter_=YANG_LIBRARY_FILTER)
+    yang_library.record_response(
+        b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data><modules-state xmlns="urn:ietf:params:xml:ns:yang:ietf-yang-library"><module-set-id>1</module-set-id><module><name>ietf-interfaces</name><revision>2018-02-20</revision><namespace>urn:ietf:params:xml:ns:yang:ietf-interfaces</namespace><conformance-type>implement</conformance-type></module><module><name>example</name><revision></revision><submodule><name>example-sub</name><revision>2020-01-01</revision></submodule></module></modules-state></data></rpc-reply>""",
+        deframed=True,
+    )
+    assert dummy_conn._pre_sync_schemas(
+        schema_cache=SchemaCache(path=tmp_path), modules=None, yang_library=yang_library
+    ) == [
+        [("ietf-interfaces", "2018-02-20"), ("example", None), ("example-sub", "2020-01-01")],
+    ]
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        ([], None),
+        (
+            [
+                "urn:ietf:params:netconf:capability:yang-library:1.0?revision=2016-06-21&module-set-id=1"
+            ],
+            YANG_LIBRARY_FILTER,
+        ),
+        (
+            [
+                "urn:ietf:params:netconf:capability:yang-library:1.1?revision=2019-01-04&content-id=1"
+            ],
+            YANG_LIBRARY_1_1_FILTER,
+        ),
+    ],
+    ids=["none", "1.0", "1.1"],
+)
+def test_yang_library_filter(dummy_conn, test_data):
+    capabilities, expected_filter = test_data
+    dummy_conn.server_capabilities = ["urn:ietf:params:netconf:base:1.1", *capabilities]
+    assert dummy_conn._yang_library_filter() == expected_filter
+
+
+def test_pre_sync_schemas_yang_library_1_1(dummy_conn, tmp_path):
+    dummy_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.1",
+        "urn:ietf:params:netconf:capability:yang-library:1.1?revision=2019-01-04&content-id=1",
+    ]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    yang_library = dummy_conn._pre_get(filter_=YANG_LIBRARY_1_1_FILTER)
+    yang_library.record_response(
+        b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data><yang-library xmlns="urn:ietf:params:xml:ns:yang:ietf-yang-library"><module-set><name>all</name><module><name>ietf-interfaces</name><revision>2018-02-20</revision><namespace>urn:ietf:params:xml:ns:yang:ietf-interfaces</namespace></module><import-only-module><name>ietf-yang-types</name><revision>2013-07-15</revision><namespace>urn:ietf:params:xml:ns:yang:ietf-yang-types</namespace></import-only-module></module-set><content-id>1</content-id></yang-library></data></rpc-reply>""",
+        deframed=True,
+    )
+    assert dummy_conn._pre_sync_schemas(
+        schema_cache=SchemaCache(path=tmp_path), modules=None, yang_library=yang_library
+    ) == [[("ietf-interfaces", "2018-02-20"), ("ietf-yang-types", "2013-07-15")]]
+
+
+def test_pre_sync_schemas_yang_library_empty(dummy_conn, tmp_path):
+    dummy_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.1",
+        "urn:ietf:params:netconf:capability:yang-library:1.1?revision=2019-01-04&content-id=1",
+        "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08",
+    ]
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_1
+    yang_library = dummy_conn._pre_get(filter_=YANG_LIBRARY_FILTER)
+    yang_library.record_response(
+        b"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data/></rpc-reply>""",
+        deframed=True,
+    )
+    # a successful reply listing nothing (i.e. an NMDA server asked for "modules-state") falls back
+    # to the capabilities rather than syncing nothing at all
+    assert dummy_conn._pre_sync_schemas(
+        schema_cache=SchemaCache(path=tmp_path), modules=None, yang_library=yang_library
+    ) == [[("ietf-interfaces", "2014-05-08")]]
+
+
+NOTIFICATION_CAPABILITY = "urn:ietf:params:netconf:capability:notification:1.0"
+
+
+def test_pre_create_subscription(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+    response = dummy_conn._pre_create_subscription(
+        stream="NETCONF",
+        filter_="<netconf-config-change xmlns='urn:ietf:params:xml:ns:yang:ietf-netconf-notifications'/>",
+        start_time="2024-01-01T00:00:00Z",
+        stop_time="2024-01-02T00:00:00Z",
+    )
+    assert (
+        response.channel_input
+        == """<?xml version='1.0' encoding='utf-8'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><create-subscription xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><stream>NETCONF</stream><filter type="subtree"><netconf-config-change xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-notifications"/></filter><startTime>2024-01-01T00:00:00Z</startTime><stopTime>2024-01-02T00:00:00Z</stopTime></create-subscription></rpc>]]>]]>"""
+    )
+    assert etree.tostring(response.xml_input) == etree.tostring(
+        etree.fromstring(response.channel_input[39:-6].encode())
+    )
+
+
+def test_pre_create_subscription_escaped(dummy_conn):
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+    response = dummy_conn._pre_create_subscription(stream="a&b")
+    assert (
+        response.channel_input
+        == """<?xml version='1.0' encoding='utf-8'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><create-subscription xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><stream>a&amp;b</stream></create-subscription></rpc>]]>]]>"""
+    )
+
+
+def test_pre_create_subscription_exception(dummy_conn):
+    dummy_conn.server_capabilities = ["urn:ietf:params:netconf:base:1.1"]
+    with pytest.raises(CapabilityNotSupported):
+        dummy_conn._pre_create_subscription()
+
+    dummy_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+    with pytest.raises(ScrapliValueError):
+        dummy_conn._pre_create_subscription(stop_time="2024-01-02T00:00:00Z")
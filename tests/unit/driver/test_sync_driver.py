@@ -1,4 +1,10 @@
+import re
+
+from lxml import etree
+
+from scrapli_netconf.cache import SchemaCache
 from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.driver import NetconfDriver
 
 
 def test_get(monkeypatch, dummy_conn):
@@ -35,3 +41,187 @@ def test_get_config(monkeypatch, dummy_conn):
         actual_response.channel_input
         == """<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><get-config><source><running/></source></get-config></rpc>]]>]]>"""
     )
+
+
+def test_edit_config_trusted(monkeypatch):
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_input_netconf",
+        lambda cls, channel_input: b"<sent!>",
+    )
+    conn = NetconfDriver(host="localhost", input_validation="trust")
+    conn.netconf_version = NetconfVersion.VERSION_1_0
+    conn.writeable_datastores = ["running"]
+    config = "<config>\n  <hostname>r1</hostname>\n</config>"
+    actual_response = conn.edit_config(config=config)
+    assert actual_response.raw_result == b"<sent!>"
+    # trusted input is sent exactly as provided, it is not flattened
+    assert (
+        actual_response.channel_input
+        == """<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><edit-config><target><running/></target><config>\n  <hostname>r1</hostname>\n</config></edit-config></rpc>]]>]]>"""
+    )
+
+
+def test_rpc_from(monkeypatch, dummy_conn):
+    sent = []
+
+    def _send_input_netconf_stream(cls, channel_input):
+        sent.extend(channel_input)
+        return b"<rpc-reply><ok/></rpc-reply>"
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_input_netconf_stream",
+        _send_input_netconf_stream,
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    actual_response = dummy_conn.rpc_from(operation=(part for part in (b"<get>", b"</get>")))
+    assert actual_response.raw_result == b"<rpc-reply><ok/></rpc-reply>"
+    assert (
+        b"".join(sent)
+        == b"""<?xml version='1.0' encoding='utf-8'?>\n<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><get></get></rpc>]]>]]>"""
+    )
+
+
+def test_stream_get(monkeypatch, dummy_conn):
+    reply = (
+        b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data>'
+        b'<interfaces xmlns="http://openconfig.net/yang/interfaces"><interface/></interfaces>'
+        b"<system/></data></rpc-reply>"
+    )
+
+    def dummy_send_input_netconf_iter(cls, channel_input):
+        for i in range(0, len(reply), 10):
+            yield reply[i : i + 10]
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_input_netconf_iter",
+        dummy_send_input_netconf_iter,
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.strip_namespaces = True
+    elements = list(dummy_conn.stream_get(filter_="<interfaces/>"))
+    assert [etree.tostring(element) for element in elements] == [
+        b"<interfaces><interface/></interfaces>",
+        b"<system/>",
+    ]
+
+
+def test_pipeline(monkeypatch, dummy_conn):
+    def dummy_send_inputs_netconf(cls, channel_inputs):
+        assert list(channel_inputs) == ["101", "102"]
+        return {
+            message_id: (
+                f'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+                f'message-id="{message_id}"><ok/></rpc-reply>]]>]]>'
+            ).encode()
+            for message_id in reversed(list(channel_inputs))
+        }
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_inputs_netconf",
+        dummy_send_inputs_netconf,
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.readable_datastores = ["running"]
+    responses = dummy_conn.pipeline(
+        [("get_config", {"source": "running"}), ("get", {"filter_": "<interfaces/>"})]
+    )
+    assert [response.xml_input.get("message-id") for response in responses] == ["101", "102"]
+    assert [response.xml_result.get("message-id") for response in responses] == ["101", "102"]
+    assert all(response.failed is False for response in responses)
+
+
+def test_sync_schemas(monkeypatch, dummy_conn, tmp_path):
+    sent_identifiers = []
+
+    def dummy_send_inputs_netconf(cls, channel_inputs):
+        sent_identifiers.extend(
+            re.search(rb"<identifier>(.*?)</identifier>", channel_input).group(1).decode()
+            for channel_input in channel_inputs.values()
+        )
+        return {
+            message_id: (
+                f'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+                f'message-id="{message_id}"><data xmlns="urn:ietf:params:xml:ns:yang:'
+                f'ietf-netconf-monitoring">module m{message_id} {{}}</data></rpc-reply>]]>]]>'
+            ).encode()
+            for message_id in channel_inputs
+        }
+
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_inputs_netconf",
+        dummy_send_inputs_netconf,
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [
+        "urn:ietf:params:netconf:base:1.0",
+        "urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring?module=ietf-netconf-monitoring"
+        "&revision=2010-10-04",
+        "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08",
+    ]
+    responses = dummy_conn.sync_schemas(schema_cache=str(tmp_path))
+    assert list(responses) == [
+        ("ietf-netconf-monitoring", "2010-10-04"),
+        ("ietf-interfaces", "2014-05-08"),
+    ]
+    assert sent_identifiers == ["ietf-netconf-monitoring", "ietf-interfaces"]
+    schema_cache = SchemaCache(path=tmp_path)
+    assert schema_cache.load(name="ietf-interfaces", revision="2014-05-08") == "module m102 {}"
+
+    # everything is cached now, so nothing is fetched again
+    assert dummy_conn.sync_schemas(schema_cache=schema_cache) == {}
+    assert len(sent_identifiers) == 2
+
+
+NOTIFICATION_CAPABILITY = "urn:ietf:params:netconf:capability:notification:1.0"
+SUBSCRIPTION_REPLIES = (
+    b'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><ok/>'
+    b"</rpc-reply>]]>]]>"
+    b'<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>'
+    b"2024-01-01T00:00:00Z</eventTime><netconf-config-change xmlns="
+    b'"urn:ietf:params:xml:ns:yang:ietf-netconf-notifications"/></notification>]]>]]>'
+    b'<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>'
+    b"2024-01-02T00:00:00Z</eventTime><notificationComplete "
+    b'xmlns="urn:ietf:params:xml:ns:netmod:notification"/></notification>]]>]]>'
+)
+
+
+def test_create_subscription(monkeypatch, dummy_conn):
+    reads = iter([SUBSCRIPTION_REPLIES])
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.plugins.system.transport.SystemTransport.read", _read)
+    monkeypatch.setattr(
+        "scrapli_netconf.transport.plugins.system.transport.NetconfSystemTransport.write", _write
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+    dummy_conn.channel._server_echo = False
+    dummy_conn.strip_namespaces = True
+
+    response = dummy_conn.create_subscription(stream="NETCONF")
+    assert response.failed is False
+
+    # iteration ends with the notification signalling the subscription is complete
+    assert [
+        [child.tag for child in xml_notification] for xml_notification in dummy_conn.notifications()
+    ] == [["eventTime", "netconf-config-change"], ["eventTime", "notificationComplete"]]
+    assert dummy_conn.notification_stats.delivered == 2
+
+
+def test_create_subscription_failed(monkeypatch, dummy_conn):
+    monkeypatch.setattr(
+        "scrapli_netconf.channel.sync_channel.NetconfChannel.send_input_netconf",
+        lambda cls, channel_input: b'<rpc-reply message-id="101"><rpc-error>'
+        b"<error-tag>operation-failed</error-tag></rpc-error></rpc-reply>]]>]]>",
+    )
+    dummy_conn.netconf_version = NetconfVersion.VERSION_1_0
+    dummy_conn.server_capabilities = [NOTIFICATION_CAPABILITY]
+
+    response = dummy_conn.create_subscription()
+    assert response.failed is True
+    assert dummy_conn.notification_stats is None
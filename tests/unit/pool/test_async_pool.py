@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from scrapli.exceptions import ScrapliTimeout
+from scrapli_netconf.pool import AsyncNetconfConnectionPool
+
+DEVICE = {"host": "localhost", "auth_username": "scrapli", "transport": "asyncssh"}
+
+
+@pytest.fixture(scope="function")
+def driver_calls(monkeypatch):
+    calls = {"open": 0, "close": 0, "rpc": 0}
+    alive = {"alive": True}
+
+    async def _open(cls):
+        calls["open"] += 1
+
+    async def _close(cls):
+        calls["close"] += 1
+
+    async def _rpc(cls, filter_):
+        calls["rpc"] += 1
+
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.open", _open)
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.close", _close)
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.rpc", _rpc)
+    monkeypatch.setattr(
+        "scrapli_netconf.driver.async_driver.AsyncNetconfDriver.isalive",
+        lambda cls: alive["alive"],
+    )
+    calls["alive"] = alive
+    return calls
+
+
+async def test_connection_reused(monkeypatch):
+    calls = {"open": 0, "close": 0}
+
+    async def _open(cls):
+        calls["open"] += 1
+
+    async def _close(cls):
+        calls["close"] += 1
+
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.open", _open)
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.close", _close)
+
+    async with AsyncNetconfConnectionPool(max_sessions_per_host=1) as pool:
+
+        async def _use():
+            async with pool.connection(**DEVICE) as conn:
+                await asyncio.sleep(0)
+                return conn
+
+        conns = await asyncio.gather(_use(), _use(), _use())
+        assert conns[0] is conns[1] is conns[2]
+
+    assert calls == {"open": 1, "close": 1}
+
+
+async def test_connection_health_check(driver_calls):
+    async with AsyncNetconfConnectionPool(health_check_idle_time=0) as pool:
+        async with pool.connection(**DEVICE) as conn:
+            first_conn = conn
+        async with pool.connection(**DEVICE) as conn:
+            assert conn is first_conn
+        assert driver_calls["rpc"] == 1
+
+        driver_calls["alive"]["alive"] = False
+        async with pool.connection(**DEVICE) as conn:
+            assert conn is not first_conn
+        assert driver_calls["open"] == 2
+        assert driver_calls["close"] == 1
+
+
+async def test_connection_health_check_cancelled(monkeypatch, driver_calls):
+    async def _rpc(cls, filter_):
+        await asyncio.Event().wait()
+
+    async with AsyncNetconfConnectionPool(
+        max_sessions_per_host=1, health_check_idle_time=0, timeout_checkout=0.1
+    ) as pool:
+        async with pool.connection(**DEVICE):
+            pass
+
+        monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.rpc", _rpc)
+
+        async def _use():
+            async with pool.connection(**DEVICE):
+                pass
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(_use(), timeout=0.01)
+
+        # the session is closed and gives up its slot, rather than being lost to the pool
+        assert driver_calls["close"] == 1
+        assert not pool._sessions_per_host
+
+
+async def test_connection_evicts_other_idle_session_for_host(driver_calls):
+    async with AsyncNetconfConnectionPool(max_sessions_per_host=1) as pool:
+        async with pool.connection(**DEVICE):
+            pass
+        async with pool.connection(**{**DEVICE, "auth_password": "other"}):
+            pass
+
+        assert driver_calls["open"] == 2
+        assert driver_calls["close"] == 1
+
+
+async def test_connection_keeps_other_idle_session_for_host_below_limit(driver_calls):
+    async with AsyncNetconfConnectionPool(max_sessions_per_host=2) as pool:
+        async with pool.connection(**DEVICE) as conn:
+            first_conn = conn
+        async with pool.connection(**{**DEVICE, "timeout_ops": 60}):
+            pass
+        async with pool.connection(**DEVICE) as conn:
+            assert conn is first_conn
+
+        assert driver_calls["open"] == 2
+        assert driver_calls["close"] == 0
+
+
+async def test_connection_max_sessions_per_host(driver_calls):
+    async with AsyncNetconfConnectionPool(max_sessions_per_host=1, timeout_checkout=0.01) as pool:
+        async with pool.connection(**DEVICE):
+            with pytest.raises(ScrapliTimeout):
+                async with pool.connection(**DEVICE):
+                    pass
+
+
+async def test_evict_idle(driver_calls):
+    async with AsyncNetconfConnectionPool(max_idle_time=0) as pool:
+        async with pool.connection(**DEVICE):
+            pass
+        await pool.evict_idle()
+        assert driver_calls["close"] == 1
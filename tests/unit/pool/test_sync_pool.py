@@ -0,0 +1,149 @@
+import pytest
+
+from scrapli.exceptions import ScrapliCommandFailure, ScrapliTimeout
+from scrapli_netconf.pool import NetconfConnectionPool
+
+DEVICE = {"host": "localhost", "auth_username": "scrapli", "auth_password": "scrapli"}
+
+
+@pytest.fixture(scope="function")
+def driver_calls(monkeypatch):
+    calls = {"open": 0, "close": 0, "rpc": 0}
+    alive = {"alive": True}
+
+    def _open(cls):
+        calls["open"] += 1
+
+    def _close(cls):
+        calls["close"] += 1
+
+    def _rpc(cls, filter_):
+        calls["rpc"] += 1
+
+    monkeypatch.setattr("scrapli_netconf.driver.sync_driver.NetconfDriver.open", _open)
+    monkeypatch.setattr("scrapli_netconf.driver.sync_driver.NetconfDriver.close", _close)
+    monkeypatch.setattr("scrapli_netconf.driver.sync_driver.NetconfDriver.rpc", _rpc)
+    monkeypatch.setattr(
+        "scrapli_netconf.driver.sync_driver.NetconfDriver.isalive", lambda cls: alive["alive"]
+    )
+    calls["alive"] = alive
+    return calls
+
+
+def test_connection_reused(driver_calls):
+    pool = NetconfConnectionPool()
+
+    with pool.connection(**DEVICE) as conn:
+        first_conn = conn
+    with pool.connection(**DEVICE) as conn:
+        assert conn is first_conn
+
+    assert driver_calls["open"] == 1
+    assert driver_calls["rpc"] == 0
+
+    pool.close()
+    assert driver_calls["close"] == 1
+
+
+def test_connection_keyed_by_credentials(driver_calls):
+    with NetconfConnectionPool() as pool:
+        with pool.connection(**DEVICE) as conn:
+            first_conn = conn
+        with pool.connection(**{**DEVICE, "auth_password": "other"}) as conn:
+            assert conn is not first_conn
+
+    assert driver_calls["open"] == 2
+    assert driver_calls["close"] == 2
+
+
+def test_connection_evicts_other_idle_session_for_host(driver_calls):
+    pool = NetconfConnectionPool(max_sessions_per_host=1)
+
+    with pool.connection(**DEVICE):
+        pass
+    with pool.connection(**{**DEVICE, "auth_password": "other"}):
+        pass
+
+    assert driver_calls["open"] == 2
+    assert driver_calls["close"] == 1
+
+
+def test_connection_keeps_other_idle_session_for_host_below_limit(driver_calls):
+    pool = NetconfConnectionPool(max_sessions_per_host=2)
+
+    with pool.connection(**DEVICE) as conn:
+        first_conn = conn
+    with pool.connection(**{**DEVICE, "timeout_ops": 60}):
+        pass
+    with pool.connection(**DEVICE) as conn:
+        assert conn is first_conn
+
+    assert driver_calls["open"] == 2
+    assert driver_calls["close"] == 0
+
+
+def test_connection_max_sessions_per_host(driver_calls):
+    pool = NetconfConnectionPool(max_sessions_per_host=1, timeout_checkout=0.01)
+
+    with pool.connection(**DEVICE):
+        with pytest.raises(ScrapliTimeout):
+            with pool.connection(**DEVICE):
+                pass
+
+
+def test_connection_health_check(driver_calls):
+    pool = NetconfConnectionPool(health_check_idle_time=0)
+
+    with pool.connection(**DEVICE) as conn:
+        first_conn = conn
+    with pool.connection(**DEVICE) as conn:
+        assert conn is first_conn
+    assert driver_calls["rpc"] == 1
+
+    driver_calls["alive"]["alive"] = False
+    with pool.connection(**DEVICE) as conn:
+        assert conn is not first_conn
+    assert driver_calls["open"] == 2
+    assert driver_calls["close"] == 1
+
+
+def test_connection_exception(driver_calls):
+    pool = NetconfConnectionPool()
+
+    with pytest.raises(ScrapliCommandFailure):
+        with pool.connection(**DEVICE):
+            raise ScrapliCommandFailure
+    assert driver_calls["close"] == 0
+
+    with pytest.raises(ValueError):
+        with pool.connection(**DEVICE):
+            raise ValueError
+    assert driver_calls["close"] == 1
+
+
+def test_evict_idle(driver_calls):
+    pool = NetconfConnectionPool(max_idle_time=0)
+
+    with pool.connection(**DEVICE):
+        pass
+    pool.evict_idle()
+    assert driver_calls["close"] == 1
+
+
+def test_connection_health_check_exception(monkeypatch, driver_calls):
+    pool = NetconfConnectionPool(max_sessions_per_host=1, health_check_idle_time=0)
+
+    with pool.connection(**DEVICE):
+        pass
+
+    def _rpc(cls, filter_):
+        raise OSError("socket is closed")
+
+    monkeypatch.setattr("scrapli_netconf.driver.sync_driver.NetconfDriver.rpc", _rpc)
+    with pytest.raises(OSError):
+        with pool.connection(**DEVICE):
+            pass
+
+    # the session is closed and gives up its slot, rather than being lost to the pool
+    assert driver_calls["close"] == 1
+    assert not pool._sessions_per_host
@@ -0,0 +1,88 @@
+from scrapli_netconf.cache import CachedSession, CapabilityCache, SchemaCache, hash_hello
+from scrapli_netconf.capabilities import ServerCapabilities
+
+HELLO = b"""<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <capabilities>
+  <capability>urn:ietf:params:netconf:base:1.1</capability>
+ </capabilities>
+ <session-id>%b</session-id>
+</hello>]]>]]>"""
+
+
+def test_hash_hello():
+    hello_hash = hash_hello(raw_server_capabilities=HELLO % b"1")
+    assert len(hello_hash) == 64
+    # the session-id changes every session, so it is not part of the hash
+    assert hash_hello(raw_server_capabilities=b"junk\n" + HELLO % b"4242") == hello_hash
+    assert (
+        hash_hello(raw_server_capabilities=HELLO.replace(b"base:1.1", b"base:1.0") % b"1")
+        != hello_hash
+    )
+    assert hash_hello(raw_server_capabilities=b"boo!") == ""
+
+
+def test_capability_cache(tmp_path):
+    cache = CapabilityCache(path=tmp_path / "cache")
+    assert cache.load(host="172.18.0.11") is None
+    assert list(cache.sessions()) == []
+
+    session = CachedSession(
+        host="172.18.0.11",
+        port=830,
+        hello_hash="abc",
+        server_capabilities=ServerCapabilities(["urn:ietf:params:netconf:base:1.1"]),
+        readable_datastores=["running"],
+        writeable_datastores=[],
+    )
+    cache.store(session=session)
+    cache.store(session=CachedSession(host="fe80::1", port=8300))
+
+    loaded_session = cache.load(host="172.18.0.11")
+    assert loaded_session == session
+    assert isinstance(loaded_session.server_capabilities, ServerCapabilities)
+    assert loaded_session.server_capabilities.has_capability("urn:ietf:params:netconf:base:1.1")
+    assert cache.load(host="172.18.0.11", port=8300) is None
+    assert [(session.host, session.port) for session in cache.sessions()] == [
+        ("172.18.0.11", 830),
+        ("fe80::1", 8300),
+    ]
+
+    # each transport gets its own entry, whether the server echoes inputs depends on it
+    cache.store(session=CachedSession(host="172.18.0.11", port=830, transport="asyncssh"))
+    assert cache.load(host="172.18.0.11") == session
+    assert cache.load(host="172.18.0.11", transport="asyncssh").hello_hash == ""
+    cache.remove(host="172.18.0.11", transport="asyncssh")
+    assert cache.load(host="172.18.0.11", transport="asyncssh") is None
+
+    cache.remove(host="fe80::1", port=8300)
+    cache.remove(host="fe80::1", port=8300)
+    assert [session.host for session in cache.sessions()] == ["172.18.0.11"]
+    # nothing is left lying around from writing the files
+    assert sorted(path.suffix for path in (tmp_path / "cache").iterdir()) == [".json"]
+
+
+def test_capability_cache_unusable_file(tmp_path):
+    cache = CapabilityCache(path=tmp_path)
+    (tmp_path / "172.18.0.11_830_system.json").write_text("{not json")
+    (tmp_path / "172.18.0.12_830_system.json").write_text('{"hostname": "r2"}')
+    assert cache.load(host="172.18.0.11") is None
+    assert cache.load(host="172.18.0.12") is None
+    assert list(cache.sessions()) == []
+
+
+def test_schema_cache(tmp_path):
+    cache = SchemaCache(path=tmp_path)
+    assert not cache.has(name="ietf-interfaces", revision="2014-05-08")
+    assert cache.load(name="ietf-interfaces", revision="2014-05-08") is None
+
+    schema = (
+        'module ietf-interfaces {\n  namespace "urn:ietf:params:xml:ns:yang:ietf-interfaces";\n}\n'
+    )
+    digest = cache.store(name="ietf-interfaces", revision="2014-05-08", schema=schema)
+    assert cache.has(name="ietf-interfaces", revision="2014-05-08")
+    assert not cache.has(name="ietf-interfaces", revision="2018-02-20")
+    assert cache.load(name="ietf-interfaces", revision="2014-05-08") == schema
+
+    # schemas are stored once, no matter how many revisions share them
+    assert cache.store(name="ietf-interfaces", revision="2018-02-20", schema=schema) == digest
+    assert [path.name for path in (tmp_path / "objects").iterdir()] == [f"{digest}.yang"]
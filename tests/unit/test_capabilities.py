@@ -0,0 +1,163 @@
+import json
+
+import pytest
+
+from scrapli_netconf.capabilities import (
+    ServerCapabilities,
+    YangModule,
+    find_hello,
+    parse_server_capabilities,
+)
+from scrapli_netconf.exceptions import CouldNotExchangeCapabilities
+
+CAPABILITIES = [
+    "urn:ietf:params:netconf:base:1.1",
+    "urn:ietf:params:netconf:capability:candidate:1.0",
+    "urn:ietf:params:netconf:capability:with-defaults:1.0?basic-mode=explicit&also-supported=trim",
+    "http://cisco.com/ns/yang/Cisco-IOS-XR-ifmgr-cfg?module=Cisco-IOS-XR-ifmgr-cfg&revision=2017-09-07",
+    "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08"
+    "&features=pre-provisioning,if-mib&deviations=cisco-xr-ietf-interfaces-deviations",
+]
+
+
+def test_server_capabilities_list_compatible():
+    server_capabilities = ServerCapabilities(CAPABILITIES)
+    assert server_capabilities == CAPABILITIES
+    assert isinstance(server_capabilities, list)
+    assert json.loads(json.dumps(server_capabilities)) == CAPABILITIES
+    assert server_capabilities.index("urn:ietf:params:netconf:base:1.1") == 0
+
+
+def test_server_capabilities_contains():
+    server_capabilities = ServerCapabilities(CAPABILITIES)
+    assert "urn:ietf:params:netconf:base:1.1" in server_capabilities
+    assert "urn:ietf:params:netconf:base:1.0" not in server_capabilities
+    # membership is exact, like a list
+    assert "urn:ietf:params:netconf:capability:with-defaults:1.0" not in server_capabilities
+    assert None not in server_capabilities
+
+
+def test_server_capabilities_has_capability():
+    server_capabilities = ServerCapabilities(CAPABILITIES)
+    assert server_capabilities.has_capability(
+        "urn:ietf:params:netconf:capability:with-defaults:1.0"
+    )
+    assert not server_capabilities.has_capability("urn:ietf:params:netconf:capability:xpath:1.0")
+    assert server_capabilities.capability_parameters(
+        "urn:ietf:params:netconf:capability:with-defaults:1.0"
+    ) == {"basic-mode": "explicit", "also-supported": "trim"}
+    assert server_capabilities.capability_parameters("urn:ietf:params:netconf:base:1.1") == {}
+    assert server_capabilities.capability_parameters("urn:ietf:params:netconf:base:1.0") is None
+
+
+def test_server_capabilities_modules():
+    server_capabilities = ServerCapabilities(CAPABILITIES)
+    assert set(server_capabilities.modules) == {"Cisco-IOS-XR-ifmgr-cfg", "ietf-interfaces"}
+    assert server_capabilities.get_module("ietf-interfaces") == YangModule(
+        name="ietf-interfaces",
+        namespace="urn:ietf:params:xml:ns:yang:ietf-interfaces",
+        revision="2014-05-08",
+        features=frozenset({"pre-provisioning", "if-mib"}),
+        deviations=("cisco-xr-ietf-interfaces-deviations",),
+    )
+    assert server_capabilities.get_module("openconfig-interfaces") is None
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        ({"name": "ietf-interfaces"}, True),
+        ({"name": "ietf-interfaces", "revision": "2014-05-08"}, True),
+        ({"name": "ietf-interfaces", "revision": "2018-02-20"}, False),
+        ({"name": "ietf-interfaces", "features": ["if-mib"]}, True),
+        ({"name": "ietf-interfaces", "features": ["if-mib", "arbitrary-names"]}, False),
+        ({"name": "openconfig-interfaces"}, False),
+    ],
+    ids=[
+        "module",
+        "revision",
+        "other_revision",
+        "features",
+        "missing_feature",
+        "missing_module",
+    ],
+)
+def test_server_capabilities_supports_module(test_data):
+    kwargs, expected = test_data
+    assert ServerCapabilities(CAPABILITIES).supports_module(**kwargs) is expected
+
+
+def test_server_capabilities_modified():
+    server_capabilities = ServerCapabilities(CAPABILITIES[:2])
+    assert "urn:ietf:params:netconf:capability:xpath:1.0" not in server_capabilities
+
+    server_capabilities.append("urn:ietf:params:netconf:capability:xpath:1.0")
+    assert "urn:ietf:params:netconf:capability:xpath:1.0" in server_capabilities
+
+    server_capabilities[0] = "urn:ietf:params:netconf:base:1.0"
+    assert "urn:ietf:params:netconf:base:1.0" in server_capabilities
+    assert "urn:ietf:params:netconf:base:1.1" not in server_capabilities
+
+    server_capabilities += [CAPABILITIES[3]]
+    assert isinstance(server_capabilities, ServerCapabilities)
+    assert server_capabilities.supports_module("Cisco-IOS-XR-ifmgr-cfg")
+
+    server_capabilities.clear()
+    assert not server_capabilities.has_capability("urn:ietf:params:netconf:base:1.0")
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        (b"<hello><capabilities/></hello>", (0, 30)),
+        (b"junk\n<nc:hello/> <nc:hello></nc:hello>]]>]]>", (5, 38)),
+        (b"hello <hello>hello</hello>hello>", (6, 26)),
+        (b"<hello><capabilities/>", None),
+        (b"boo!", None),
+    ],
+    ids=["hello", "namespaced", "hello_text", "incomplete", "no_hello"],
+)
+def test_find_hello(test_data):
+    raw_server_capabilities, expected_bounds = test_data
+    assert find_hello(raw_server_capabilities=raw_server_capabilities) == expected_bounds
+
+
+def test_parse_server_capabilities():
+    raw_server_capabilities = b"""<?xml version="1.0" encoding="UTF-8"?>
+<nc:hello xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <nc:capabilities>
+        <nc:capability>urn:ietf:params:netconf:base:1.1</nc:capability>
+        <capability>
+            urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&amp;revision=2014-05-08
+        </capability>
+        <nc:capability/>
+    </nc:capabilities>
+    <nc:session-id>1</nc:session-id>
+</nc:hello>]]>]]>"""
+    server_capabilities = parse_server_capabilities(raw_server_capabilities=raw_server_capabilities)
+    assert server_capabilities == [
+        "urn:ietf:params:netconf:base:1.1",
+        "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2014-05-08",
+    ]
+    assert server_capabilities.supports_module("ietf-interfaces", revision="2014-05-08")
+
+
+def test_parse_server_capabilities_corrupt_newlines():
+    # as sent by some iosxr versions on call-home lines
+    raw_server_capabilities = b"""<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+<capabilities><capabil
+
+ity>urn:ietf:params:netconf:base:1.1</capability></capabilities></hello>]]>]]>"""
+    assert parse_server_capabilities(raw_server_capabilities=raw_server_capabilities) == [
+        "urn:ietf:params:netconf:base:1.1"
+    ]
+
+
+@pytest.mark.parametrize(
+    "raw_server_capabilities",
+    [b"boo!", b"<hello><capabilities></hello>"],
+    ids=["no_hello", "not_well_formed"],
+)
+def test_parse_server_capabilities_exception(raw_server_capabilities):
+    with pytest.raises(CouldNotExchangeCapabilities):
+        parse_server_capabilities(raw_server_capabilities=raw_server_capabilities)
@@ -0,0 +1,69 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from scrapli.exceptions import ScrapliConnectionError, ScrapliValueError
+from scrapli_netconf.fleet import AsyncNetconfFleet, FleetResult, FleetStats
+
+
+async def test_fleet_run(monkeypatch):
+    attempts = {}
+
+    async def _open(cls):
+        attempts[cls.host] = attempts.get(cls.host, 0) + 1
+        if cls.host == "dead":
+            raise ScrapliConnectionError("no route to host")
+        if cls.host == "flaky" and attempts[cls.host] == 1:
+            raise ScrapliConnectionError("connection reset")
+
+    async def _close(cls):
+        pass
+
+    async def _get(cls, filter_):
+        if cls.host == "slow":
+            await asyncio.sleep(10)
+        return SimpleNamespace(host=cls.host, failed=False)
+
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.open", _open)
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.close", _close)
+    monkeypatch.setattr("scrapli_netconf.driver.async_driver.AsyncNetconfDriver.get", _get)
+
+    fleet = AsyncNetconfFleet(
+        inventory=[{"host": host} for host in ("slow", "dead", "flaky", "ok")],
+        defaults={"transport": "asyncssh"},
+        concurrency=2,
+        timeout_host=0.05,
+        retries=1,
+        retry_backoff=0,
+    )
+    results = {result.host: result async for result in fleet.run("get", filter_="<interfaces/>")}
+
+    assert results["ok"].response.host == "ok"
+    assert results["flaky"].response.host == "flaky"
+    assert results["flaky"].attempts == 2
+    assert isinstance(results["dead"].exception, ScrapliConnectionError)
+    assert isinstance(results["slow"].exception, asyncio.TimeoutError)
+    assert fleet.stats.hosts == 4
+    assert fleet.stats.succeeded == 2
+    assert fleet.stats.throughput > 0
+
+
+async def test_fleet_run_invalid_operation():
+    fleet = AsyncNetconfFleet(inventory=[])
+    with pytest.raises(ScrapliValueError):
+        async for _ in fleet.run("close"):
+            pass
+
+
+def test_fleet_stats():
+    stats = FleetStats()
+    for elapsed_time in range(1, 11):
+        stats.record(FleetResult(host="localhost", elapsed_time=elapsed_time))
+    stats.elapsed_time = 5
+
+    assert stats.failed == 10
+    assert stats.throughput == 2
+    assert stats.percentile(50) == 5
+    assert stats.percentile(90) == 9
+    assert stats.percentile(100) == 10
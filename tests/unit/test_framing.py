@@ -0,0 +1,187 @@
+import pytest
+
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.constants import NetconfVersion
+from scrapli_netconf.exceptions import InvalidMessageFraming
+from scrapli_netconf.framing import (
+    ChunkedMessageDecoder,
+    DelimitedMessageDecoder,
+    decode_chunked_message,
+    encode_chunked_message,
+    encode_message,
+)
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        (b"#5\n<a/>\n\n##\n", b"<a/>\n"),
+        (b"\n#3\n<a>\n#4\n</a>\n##\n", b"<a></a>"),
+        (b"#4\r\n<a/>\r\n##\r\n", b"<a/>"),
+        (b"#4\n<a/>", b"<a/>"),
+        (b"#4\n<a/>\n##\n#4\n<b/>\n##\n", b"<a/>"),
+        (b" #3\n<a>\t\n #4\n</a> \r\n##\n", b"<a></a>"),
+    ],
+    ids=[
+        "single_chunk",
+        "multi_chunk",
+        "carriage_returns",
+        "no_end_of_chunks",
+        "stops_at_end",
+        "whitespace_between_chunks",
+    ],
+)
+def test_decode_chunked_message(test_data):
+    raw, expected = test_data
+    assert decode_chunked_message(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"",
+        b"<a/>\n##",
+        b"#0\n\n##",
+        b"#blah\n<a/>\n##",
+        b"#10\n<a/>\n##",
+        b"#4\n<a/>blah\n##",
+        b"#+4\n<a/>\n##",
+        b"#-4\n<a/>\n##",
+        b"#1_0\n<a/><b/>\n##",
+        b"# 4\n<a/>\n##",
+        b"#4 \n<a/>\n##",
+        b"#04\n<a/>\n##",
+        b"#4294967296\n<a/>\n##",
+    ],
+    ids=[
+        "empty",
+        "no_chunk_marker",
+        "zero_size",
+        "invalid_size",
+        "truncated_chunk",
+        "garbage_between_chunks",
+        "plus_sign",
+        "minus_sign",
+        "underscore",
+        "leading_whitespace",
+        "trailing_whitespace",
+        "leading_zero",
+        "size_too_large",
+    ],
+)
+def test_decode_chunked_message_invalid(raw):
+    with pytest.raises(InvalidMessageFraming):
+        decode_chunked_message(raw)
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        ([b"#5\n<a/>\n\n##\n"], b"<a/>\n", b"\n"),
+        ([b"#", b"5", b"\n<a/>", b"\n\n#", b"#"], b"<a/>\n", b""),
+        ([b"#3\n<a>", b"\n#4\n</a>\n##\n#4\n<b/>"], b"<a></a>", b"\n#4\n<b/>"),
+        ([b"</rpc>\n##\n", b"#4\n<a/>\n##"], b"<a/>", b""),
+        ([b"#3\n<a>\t", b" \n#4\n</a>", b" \t\n##"], b"<a></a>", b""),
+        ([b"#4\r", b"\n<a/>\r\n##"], b"<a/>", b""),
+    ],
+    ids=[
+        "single_read",
+        "split_headers",
+        "over_read",
+        "leading_noise",
+        "whitespace_between_reads",
+        "carriage_return",
+    ],
+)
+def test_chunked_message_decoder(test_data):
+    reads, expected_payload, expected_remainder = test_data
+    decoder = ChunkedMessageDecoder(skip_leading_noise=True)
+
+    for read in reads[:-1]:
+        assert decoder.feed(read) is False
+
+    assert decoder.feed(reads[-1]) is True
+    assert decoder.complete is True
+    assert decoder.payload == expected_payload
+    assert decoder.remainder == expected_remainder
+
+
+def test_chunked_message_decoder_noise_after_chunk():
+    decoder = ChunkedMessageDecoder(skip_leading_noise=True)
+    decoder.feed(b"#4\n<a/>")
+
+    with pytest.raises(InvalidMessageFraming):
+        decoder.feed(b"blah\n##")
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        ([b"<a/>]]>]]>"], b"<a/>", b""),
+        ([b"<a/>]]", b">]]>\n<b/>"], b"<a/>", b"\n<b/>"),
+        ([b"<a>]]", b"</a>]]>]]>"], b"<a>]]</a>", b""),
+    ],
+    ids=["single_read", "split_delimiter", "partial_delimiter_in_payload"],
+)
+def test_delimited_message_decoder(test_data):
+    reads, expected_payload, expected_remainder = test_data
+    decoder = DelimitedMessageDecoder()
+
+    for read in reads[:-1]:
+        assert decoder.feed(read) is False
+
+    assert decoder.feed(reads[-1]) is True
+    assert decoder.payload == expected_payload
+    assert decoder.remainder == expected_remainder
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        [b"<a/>"],
+        [b"<a>", b"", b"</a>"],
+        [b"<a>" + b"x" * 100 + b"</a>"],
+        [b"<a>", b"x" * 7, b"y" * 30, b"z", b"</a>"],
+    ],
+    ids=["single_part", "empty_part", "large_part", "mixed_parts"],
+)
+def test_encode_chunked_message(parts):
+    chunk_size = 16
+    encoded = list(encode_chunked_message(parts=iter(parts), chunk_size=chunk_size))
+    payload = b"".join(parts)
+
+    assert encoded[-1] == b"\n##"
+    assert encoded[0].startswith(b"#")
+    assert all(chunk.startswith(b"\n#") for chunk in encoded[1:])
+    assert len(encoded) - 1 == -(-len(payload) // chunk_size)
+    assert decode_chunked_message(b"".join(encoded)) == payload
+
+
+def test_encode_chunked_message_single_chunk():
+    # a message that fits in one chunk is framed exactly as requests always have been
+    assert b"".join(encode_chunked_message(parts=[b"<a>", b"</a>"])) == b"#7\n<a></a>\n##"
+
+
+def test_encode_chunked_message_invalid_chunk_size():
+    with pytest.raises(ScrapliValueError):
+        list(encode_chunked_message(parts=[b"<a/>"], chunk_size=0))
+
+
+@pytest.mark.parametrize("parts", [[], [b""], [b"", b""]], ids=["no_parts", "empty", "empties"])
+def test_encode_chunked_message_empty(parts):
+    # "\n##\n" on its own is not a valid message, there must be at least one chunk
+    with pytest.raises(ScrapliValueError):
+        list(encode_chunked_message(parts=parts))
+
+
+def test_encode_message():
+    parts = [b"<a>", b"", b"</a>"]
+    assert list(encode_message(parts=parts, netconf_version=NetconfVersion.VERSION_1_0)) == [
+        b"<a>",
+        b"</a>",
+        b"]]>]]>",
+    ]
+    assert list(encode_message(parts=parts, netconf_version=NetconfVersion.VERSION_1_1)) == [
+        b"#7\n<a></a>",
+        b"\n##",
+    ]
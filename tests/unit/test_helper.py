@@ -1,6 +1,17 @@
+from io import BytesIO
+
+import pytest
 from lxml import etree
 
-from scrapli_netconf.helper import remove_namespaces
+from scrapli.exceptions import ScrapliValueError
+from scrapli_netconf.helper import (
+    check_well_formed,
+    check_well_formed_document,
+    iter_well_formed_xml_source,
+    iter_xml_source,
+    remove_namespaces,
+    strip_xml_declaration,
+)
 
 
 def test_remove_namespaces():
@@ -39,3 +50,89 @@ def test_remove_namespaces():
     etree_with_namespace = etree.fromstring(xml_with_namespace)
     etree_without_namespace = remove_namespaces(tree=etree_with_namespace)
     assert etree.tostring(etree_without_namespace).decode() == xml_without_namespace
+
+
+def test_remove_namespaces_type_annotations_and_comments():
+    xml_with_annotations = (
+        '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data><!-- comment -->'
+        '<counters xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xmlns:py="http://codespeak.net/lxml/objectify/pytype" xsi:type="x" py:pytype="int">'
+        "1</counters></data></rpc-reply>"
+    )
+    etree_without_namespace = remove_namespaces(tree=etree.fromstring(xml_with_annotations))
+    assert (
+        etree.tostring(etree_without_namespace)
+        == b"<rpc-reply><data><!-- comment --><counters>1</counters></data></rpc-reply>"
+    )
+
+
+def test_iter_xml_source(tmp_path):
+    document = b"<a>" + b"x" * 10 + b"</a>"
+    path = tmp_path / "document.xml"
+    path.write_bytes(document)
+
+    assert list(iter_xml_source(source=path, block_size=8)) == [
+        document[:8],
+        document[8:16],
+        document[16:],
+    ]
+    assert b"".join(iter_xml_source(source=str(path))) == document
+    assert list(iter_xml_source(source=BytesIO(document), block_size=16)) == [
+        document[:16],
+        document[16:],
+    ]
+    assert list(iter_xml_source(source=(part for part in [b"<a>", b"</a>"]))) == [b"<a>", b"</a>"]
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [[b"<a><b>", b"</c></a>"], [b"<a>"], [b"<a/>", b"<b/>"]],
+    ids=["mismatched_tag", "unclosed_tag", "multiple_roots"],
+)
+def test_check_well_formed_invalid(parts):
+    with pytest.raises(ScrapliValueError):
+        list(check_well_formed(parts=parts))
+
+
+def test_check_well_formed():
+    parts = [b"<?xml version='1.0'?>\n<a", b"><b>text</b", b"></a>"]
+    assert list(check_well_formed(parts=parts)) == parts
+
+
+@pytest.mark.parametrize(
+    "document",
+    [b"<a><b></c></a>", b"<a>", b"<a/><b/>"],
+    ids=["mismatched_tag", "unclosed_tag", "multiple_roots"],
+)
+def test_check_well_formed_document_invalid(document):
+    with pytest.raises(ScrapliValueError):
+        check_well_formed_document(document=document)
+
+
+def test_check_well_formed_document():
+    check_well_formed_document(document=b"<?xml version='1.0'?>\n<a><b>text</b></a>")
+
+
+def test_iter_well_formed_xml_source():
+    # seekable files are checked up front, and read from where they were when passed in
+    source = BytesIO(b"junk<a></a>")
+    source.seek(4)
+    assert b"".join(iter_well_formed_xml_source(source=source)) == b"<a></a>"
+
+    with pytest.raises(ScrapliValueError):
+        iter_well_formed_xml_source(source=BytesIO(b"<a><b></a>"))
+
+    # anything else is checked as it is iterated over
+    parts = iter_well_formed_xml_source(source=iter([b"<a>", b"<b>", b"</a>"]))
+    assert next(parts) == b"<a>"
+    with pytest.raises(ScrapliValueError):
+        list(parts)
+
+
+def test_strip_xml_declaration():
+    assert list(
+        strip_xml_declaration(
+            parts=[b"", b"\n<?xml version='1.0' encoding='utf-8'?>\n<a>", b"</a>"]
+        )
+    ) == [b"<a>", b"</a>"]
+    assert list(strip_xml_declaration(parts=[b"<a>", b"<?xml?></a>"])) == [b"<a>", b"<?xml?></a>"]
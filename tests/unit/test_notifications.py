@@ -0,0 +1,64 @@
+import pytest
+
+from scrapli_netconf.notifications import (
+    NotificationQueue,
+    NotificationStats,
+    is_notification,
+    is_notification_complete,
+    parse_notification,
+)
+
+NOTIFICATION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>2024-01-01T00:00:00Z</eventTime><netconf-config-change xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-notifications"/></notification>"""
+NOTIFICATION_COMPLETE = b"""<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0"><eventTime>2024-01-02T00:00:00Z</eventTime><notificationComplete xmlns="urn:ietf:params:xml:ns:netmod:notification"/></notification>"""
+
+
+def test_notification_queue():
+    notifications = NotificationQueue(maxsize=2)
+    assert notifications.get() is None
+
+    for notification in (b"<a/>", b"<b/>", b"<c/>"):
+        notifications.put(notification=notification)
+
+    # the oldest notification makes room for the newest
+    assert notifications.full()
+    assert len(notifications) == 2
+    assert notifications.get() == b"<b/>"
+    assert notifications.get() == b"<c/>"
+    assert notifications.get() is None
+    assert notifications.stats == NotificationStats(received=3, delivered=2, dropped=1)
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        (NOTIFICATION, True),
+        (b"\n<ncEvent:notification xmlns:ncEvent='urn:x'/>", True),
+        (b'<rpc-reply message-id="101"/>', False),
+        (b"<notifications/>", False),
+    ],
+    ids=["notification", "prefixed", "rpc_reply", "other_element"],
+)
+def test_is_notification(test_data):
+    payload, expected = test_data
+    assert is_notification(payload=payload) is expected
+
+
+def test_parse_notification():
+    xml_notification = parse_notification(notification=NOTIFICATION)
+    assert xml_notification.tag == "{urn:ietf:params:xml:ns:netconf:notification:1.0}notification"
+    assert not is_notification_complete(xml_notification=xml_notification)
+
+    xml_notification = parse_notification(notification=NOTIFICATION, strip_namespaces=True)
+    assert [child.tag for child in xml_notification] == ["eventTime", "netconf-config-change"]
+
+    assert parse_notification(notification=b"boo!") is None
+    assert parse_notification(notification=b"boo!", strip_namespaces=True) is None
+
+
+@pytest.mark.parametrize("strip_namespaces", [False, True], ids=["namespaces", "no_namespaces"])
+def test_is_notification_complete(strip_namespaces):
+    xml_notification = parse_notification(
+        notification=NOTIFICATION_COMPLETE, strip_namespaces=strip_namespaces
+    )
+    assert is_notification_complete(xml_notification=xml_notification)
@@ -1,3 +1,4 @@
+import pickle
 from datetime import datetime
 
 import pytest
@@ -5,7 +6,7 @@ from lxml import etree
 
 from scrapli.exceptions import ScrapliCommandFailure
 from scrapli_netconf.constants import NetconfVersion
-from scrapli_netconf.response import NetconfResponse
+from scrapli_netconf.response import NetconfResponse, parse_reply
 
 RESPONSE_1_0 = """<rpc-reply xmlns:junos="http://xml.juniper.net/junos/17.3R2/junos" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101">
   <data>
@@ -221,6 +222,22 @@ def test_response_init(response_setup):
         response.raise_for_status()
 
 
+def test_response_bytes_channel_input():
+    response = NetconfResponse(
+        host="localhost",
+        channel_input=b"<something/>",
+        xml_input=etree.fromstring(text="<something/>"),
+        netconf_version=NetconfVersion.VERSION_1_1,
+    )
+    assert response.raw_channel_input == b"<something/>"
+    assert response._channel_input is None
+    assert response.channel_input == "<something/>"
+
+    response.channel_input = "<else/>"
+    assert response.raw_channel_input == b"<else/>"
+    assert response.channel_input == "<else/>"
+
+
 @pytest.mark.parametrize(
     "response_setup",
     [
@@ -401,3 +418,87 @@ def test_raise_for_status(response_data):
         response.raise_for_status()
 
     assert str(exc.value) == f"operation failed, reported rpc errors: {expected_errors}"
+
+
+def test_record_response_1_1_deframed():
+    channel_input = "<something/>"
+    xml_input = etree.fromstring(text=channel_input)
+    response = NetconfResponse(
+        host="localhost",
+        channel_input=channel_input,
+        xml_input=xml_input,
+        netconf_version=NetconfVersion.VERSION_1_1,
+        failed_when_contains=[b"<rpc-error>"],
+        strip_namespaces=False,
+    )
+    framed = RESPONSE_1_1.encode()
+    response.record_response(
+        result=framed[framed.index(b"\n") + 1 : framed.rindex(b"##")], deframed=True
+    )
+    assert response.result == RESULT_1_1
+    assert response.failed is False
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [(True, RESULT_1_1), (False, "")],
+    ids=["build_result", "skip_result"],
+)
+def test_record_response_lazy_result(monkeypatch, test_data):
+    build_result, expected_result = test_data
+    channel_input = "<something/>"
+    xml_input = etree.fromstring(text=channel_input)
+    response = NetconfResponse(
+        host="localhost",
+        channel_input=channel_input,
+        xml_input=xml_input,
+        netconf_version=NetconfVersion.VERSION_1_1,
+        strip_namespaces=False,
+        build_result=build_result,
+    )
+    response.record_response(result=RESPONSE_1_1.encode())
+    assert response._result is None
+    assert response.result == expected_result
+    assert response._result == expected_result
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        (NetconfVersion.VERSION_1_0, RESPONSE_1_0, RESULT_1_0_STRIP, []),
+        (NetconfVersion.VERSION_1_1, RESPONSE_1_1, RESULT_1_1_STRIP, []),
+        (NetconfVersion.VERSION_1_1, MULTIPLE_ERRORS, None, ["error message 1", "error message 2"]),
+    ],
+    ids=["1.0", "1.1", "errors"],
+)
+def test_record_parsed_reply(test_data):
+    netconf_version, result, final_result, expected_errors = test_data
+    channel_input = "<something/>"
+    xml_input = etree.fromstring(text=channel_input)
+    response = NetconfResponse(
+        host="localhost",
+        channel_input=channel_input,
+        xml_input=xml_input,
+        netconf_version=netconf_version,
+        strip_namespaces=True,
+    )
+    parsed_reply = pickle.loads(
+        pickle.dumps(
+            parse_reply(
+                result=result.encode(),
+                netconf_version=netconf_version,
+                strip_namespaces=True,
+                failed_when_contains=response.failed_when_contains,
+            )
+        )
+    )
+    response.record_parsed_reply(result=result.encode(), parsed_reply=parsed_reply)
+
+    assert response.raw_result == result.encode()
+    assert response.failed is bool(expected_errors)
+    assert response.error_messages == expected_errors
+    # only rebuilt when first accessed
+    assert response._xml_result is None
+    assert response.xml_result is not None
+    if final_result is not None:
+        assert response.result == final_result
@@ -1,3 +1,6 @@
+import pytest
+
+from scrapli.exceptions import ScrapliConnectionError
 from scrapli_netconf.driver import NetconfDriver
 from scrapli_netconf.transport.plugins.paramiko.transport import NetconfParamikoTransport
 
@@ -5,3 +8,34 @@ from scrapli_netconf.transport.plugins.paramiko.transport import NetconfParamiko
 def test_init():
     conn = NetconfDriver(host="localhost", transport="paramiko")
     assert isinstance(conn.transport, NetconfParamikoTransport)
+
+
+class FakeChannel:
+    def __init__(self, window):
+        self.window = window
+        self.sent = []
+
+    def send(self, chunk):
+        sent = chunk[: self.window].tobytes()
+        self.sent.append(sent)
+        return len(sent)
+
+
+def test_write():
+    conn = NetconfDriver(
+        host="localhost", transport="paramiko", transport_options={"netconf_write_chunk_size": 1000}
+    )
+    conn.transport.session_channel = FakeChannel(window=300)
+    channel_input = bytes(range(256)) * 10
+
+    conn.transport.write(channel_input)
+
+    assert b"".join(conn.transport.session_channel.sent) == channel_input
+    assert max(len(sent) for sent in conn.transport.session_channel.sent) == 300
+
+
+def test_write_channel_closed():
+    conn = NetconfDriver(host="localhost", transport="paramiko")
+    conn.transport.session_channel = FakeChannel(window=0)
+    with pytest.raises(ScrapliConnectionError):
+        conn.transport.write(b"<rpc/>")
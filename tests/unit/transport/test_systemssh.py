@@ -1,7 +1,69 @@
+import pytest
+
+from scrapli.exceptions import ScrapliConnectionNotOpened
 from scrapli_netconf.driver import NetconfDriver
+from scrapli_netconf.transport.base_transport import DEFAULT_WRITE_CHUNK_SIZE
+from scrapli_netconf.transport.plugins.system import transport as system_transport
 from scrapli_netconf.transport.plugins.system.transport import NetconfSystemTransport
 
 
 def test_init():
     conn = NetconfDriver(host="localhost")
     assert isinstance(conn.transport, NetconfSystemTransport)
+    assert conn.transport.write_chunk_size == DEFAULT_WRITE_CHUNK_SIZE
+
+
+def test_write_chunk_size_transport_option():
+    conn = NetconfDriver(host="localhost", transport_options={"netconf_write_chunk_size": 1024})
+    assert conn.transport.write_chunk_size == 1024
+
+    conn.transport.write_chunk_size = 0
+    assert conn.transport.write_chunk_size == 0
+
+
+def test_write_not_opened():
+    conn = NetconfDriver(host="localhost")
+    with pytest.raises(ScrapliConnectionNotOpened):
+        conn.transport.write(b"<rpc/>")
+
+
+class FakePty:
+    fd = 99
+
+
+@pytest.mark.parametrize(
+    "write_chunk_size",
+    [0, 1000, 4096],
+    ids=["unchunked", "chunked", "chunk-larger-than-input"],
+)
+def test_write(monkeypatch, write_chunk_size):
+    conn = NetconfDriver(host="localhost")
+    conn.transport.session = FakePty()
+    conn.transport.write_chunk_size = write_chunk_size
+    channel_input = bytes(range(256)) * 10
+    writes = []
+    blocked = [True]
+
+    def _write(fd, chunk):
+        assert fd == FakePty.fd
+        assert isinstance(chunk, memoryview)
+        if write_chunk_size:
+            assert len(chunk) <= write_chunk_size
+        # the first write would block, after that only ever take part of each chunk
+        if blocked[0]:
+            blocked[0] = False
+            raise BlockingIOError
+        written = chunk[: max(len(chunk) // 2, 1)].tobytes()
+        writes.append(written)
+        return len(written)
+
+    waits = []
+    monkeypatch.setattr(system_transport.os, "write", _write)
+    monkeypatch.setattr(
+        system_transport.select, "select", lambda r, w, x, timeout: waits.append(w) or ([], w, [])
+    )
+
+    conn.transport.write(channel_input)
+
+    assert b"".join(writes) == channel_input
+    assert waits == [[FakePty.fd]]